@@ -6,5 +6,35 @@ class Settings(BaseSettings):
     mongo_uri: str = "mongodb://localhost:27017"
     mongo_db: str = "skillbridge"
 
+    # in-process skill catalog cache (app/core/skill_catalog.py)
+    skill_catalog_ttl_seconds: int = 300
+
+    # process pool used by POST /skills/extract/batch
+    extraction_workers: int = 2
+
+    # (text hash, catalog version) -> extraction result
+    extraction_cache_size: int = 2048
+
+    # per-user /dashboard/summary cache, invalidated by user writes
+    dashboard_cache_size: int = 4096
+    dashboard_cache_ttl_seconds: int = 60
+
+    # PDF text extraction pool (app/core/pdf_pool.py)
+    pdf_workers: int = 2
+    pdf_max_concurrency: int = 4
+    pdf_parse_timeout_seconds: float = 20.0
+
+    # uploads are read in chunks and rejected (413) past this size
+    resume_upload_max_bytes: int = 10 * 1024 * 1024
+
+    # background resume ingestion (app/core/ingest_worker.py, collection jobs_queue)
+    ingest_workers: int = 2
+    ingest_lease_seconds: int = 120
+    ingest_max_attempts: int = 3
+    ingest_poll_interval_seconds: float = 1.0
+
+    # submitted jobs at or above this estimated similarity to an existing one get duplicate_of
+    job_duplicate_threshold: float = 0.8
+
 settings = Settings()
 
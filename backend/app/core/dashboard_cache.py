@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+
+from app.core.config import settings
+from app.utils.cache import LRUCache
+
+# /dashboard/summary results keyed by (user_id, top_n). Write paths that change a
+# user's projects, evidence or confirmations call invalidate_dashboard(user_id).
+# Invalidations are numbered from one global sequence: a summary is cached only if
+# no invalidation of its user happened after its reads started, so it can't outlive
+# the invalidation. Only the latest dashboard_cache_size users' invalidations are
+# kept; a pruned user falls back to the newest pruned number, which at worst skips
+# caching a summary that was computed while the prune happened.
+
+_cache = LRUCache(maxsize=settings.dashboard_cache_size, ttl_seconds=settings.dashboard_cache_ttl_seconds)
+_sequence = 0
+_invalidated: OrderedDict[str, int] = OrderedDict()  # user_id -> sequence of last invalidation, oldest first
+_pruned_up_to = 0
+
+
+def get_cached_summary(user_id: str, top_n: int) -> dict | None:
+    return _cache.get((user_id, top_n))
+
+
+def dashboard_generation(user_id: str) -> int:
+    """Read before computing a summary and pass to cache_summary()."""
+    return _sequence
+
+
+def cache_summary(user_id: str, top_n: int, summary: dict, generation: int) -> bool:
+    """Store `summary` unless the user was invalidated since `generation` was read."""
+    if _invalidated.get(user_id, _pruned_up_to) > generation:
+        return False
+    _cache.set((user_id, top_n), summary)
+    return True
+
+
+def invalidate_dashboard(user_id: str | None):
+    global _sequence, _pruned_up_to
+    if user_id:
+        _sequence += 1
+        _invalidated[user_id] = _sequence
+        _invalidated.move_to_end(user_id)
+        while len(_invalidated) > settings.dashboard_cache_size:
+            _, _pruned_up_to = _invalidated.popitem(last=False)
+        _cache.invalidate(lambda key: key[0] == user_id)
+
+
+def dashboard_cache_stats() -> dict:
+    return _cache.stats()
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from collections import Counter
+from typing import Iterable
+
+from bson import ObjectId
+from pymongo import UpdateOne
+
+# Materialized evidence counters, maintained on every evidence write:
+#   skills.evidence_count                      -> all evidence citing the skill
+#   skill_evidence_counts{user_id, skill_id}   -> evidence per user
+# scripts/rebuild_evidence_counts.py recomputes both from scratch.
+
+
+def _skill_oids(skill_ids: Iterable) -> list[ObjectId]:
+    out = []
+    for sid in skill_ids or []:
+        if isinstance(sid, ObjectId):
+            out.append(sid)
+        elif ObjectId.is_valid(str(sid)):
+            out.append(ObjectId(str(sid)))
+    return out
+
+
+async def record_evidence_counts(db, evidence_docs: Iterable[dict], delta: int = 1):
+    """Add `delta` to the global and per-user counters for each skill the docs cite."""
+    global_counts: Counter = Counter()
+    user_counts: Counter = Counter()
+    for doc in evidence_docs:
+        for soid in set(_skill_oids(doc.get("skill_ids"))):
+            global_counts[soid] += delta
+            if doc.get("user_id"):
+                user_counts[(doc["user_id"], soid)] += delta
+
+    if global_counts:
+        await db["skills"].bulk_write(
+            [UpdateOne({"_id": soid}, {"$inc": {"evidence_count": n}}) for soid, n in global_counts.items()],
+            ordered=False,
+        )
+    if user_counts:
+        await db["skill_evidence_counts"].bulk_write(
+            [
+                UpdateOne(
+                    {"user_id": user_id, "skill_id": soid},
+                    {"$inc": {"evidence_count": n}},
+                    upsert=True,
+                )
+                for (user_id, soid), n in user_counts.items()
+            ],
+            ordered=False,
+        )
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from app.core.config import settings
+from app.utils.cache import LRUCache
+from app.utils.text import text_sha256
+
+# Extraction results keyed by (sha256 of normalized text, catalog version).
+# Entries from an older catalog version are dropped as soon as a newer one is seen.
+# Each entry also records the snapshots that already have a skill_extractions doc for
+# it (snapshot ObjectId -> created_at): a retried snapshot stores nothing new, while a
+# different snapshot with the same text reuses the result but still gets its own doc.
+# The map is only a shortcut: the unique (resume_snapshot_id, catalog_fingerprint) key on
+# skill_extractions is what keeps a snapshot from being stored twice across processes.
+
+_cache = LRUCache(maxsize=settings.extraction_cache_size)
+_cache_version: int | None = None
+
+
+def _check_version(version: int):
+    global _cache_version
+    if _cache_version != version:
+        _cache.clear()
+        _cache_version = version
+
+
+def get_cached_extraction(text: str, version: int) -> dict | None:
+    """{"extracted", "snapshots"} for `text` under catalog `version`, or None."""
+    _check_version(version)
+    return _cache.get((text_sha256(text), version))
+
+
+def cache_extraction(text: str, version: int, extracted: list, snapshot_id, created_at):
+    """Record that `snapshot_id` has a doc for this result, keeping the snapshots already recorded."""
+    _check_version(version)
+    key = (text_sha256(text), version)
+    entry = _cache.pop(key) or {"extracted": extracted, "snapshots": {}}
+    entry["snapshots"][snapshot_id] = created_at
+    _cache.set(key, entry)
+
+
+def extraction_cache_stats() -> dict:
+    return {"catalog_version": _cache_version, **_cache.stats()}
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+
+from app.core.config import settings
+from app.core.skill_catalog import SkillCatalog
+from app.utils.minhash import signature as minhash_signature
+from app.utils.skill_matcher import SkillMatcher
+
+# Process pool for CPU-bound skill extraction. Each worker receives the compiled
+# matcher once through the pool initializer; the pool is rebuilt when the
+# catalog version changes.
+
+_worker_matcher: SkillMatcher | None = None
+
+_pool: ProcessPoolExecutor | None = None
+_pool_version: int | None = None
+
+
+def _init_worker(matcher: SkillMatcher):
+    global _worker_matcher
+    _worker_matcher = matcher
+
+
+def _extract_in_worker(text: str) -> list[dict]:
+    return _worker_matcher.extract(text)
+
+
+def _analyze_job_in_worker(skills_text: str | None, description: str) -> tuple[dict | None, list[int]]:
+    counts = _worker_matcher.count_occurrences(skills_text) if skills_text else None
+    return counts, minhash_signature(description)
+
+
+def _get_pool(catalog: SkillCatalog) -> ProcessPoolExecutor:
+    global _pool, _pool_version
+    if _pool is None or _pool_version != catalog.version:
+        if _pool is not None:
+            _pool.shutdown(wait=False)
+        _pool = ProcessPoolExecutor(
+            max_workers=settings.extraction_workers,
+            initializer=_init_worker,
+            initargs=(catalog.matcher,),
+        )
+        _pool_version = catalog.version
+    return _pool
+
+
+async def extract_many(catalog: SkillCatalog, texts: list[str]) -> list[list[dict]]:
+    """Run catalog.matcher.extract over `texts` in the worker pool, preserving order."""
+    if not texts:
+        return []
+    loop = asyncio.get_running_loop()
+    pool = _get_pool(catalog)
+    futures = [loop.run_in_executor(pool, _extract_in_worker, t) for t in texts]
+    return await asyncio.gather(*futures)
+
+
+async def analyze_jobs(
+    catalog: SkillCatalog, items: list[tuple[str | None, str]]
+) -> list[tuple[dict[int, tuple[int, bool]] | None, list[int]]]:
+    """Job import work in the pool: for each (skills_text, description) return
+    (count_occurrences(skills_text) or None, MinHash signature of description)."""
+    if not items:
+        return []
+    loop = asyncio.get_running_loop()
+    pool = _get_pool(catalog)
+    futures = [loop.run_in_executor(pool, _analyze_job_in_worker, t, d) for t, d in items]
+    return await asyncio.gather(*futures)
+
+
+def shutdown_extraction_pool():
+    global _pool, _pool_version
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+        _pool_version = None
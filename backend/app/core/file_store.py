@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import hashlib
+
+from bson import ObjectId
+from fastapi import UploadFile
+from motor.motor_asyncio import AsyncIOMotorGridFSBucket
+from pymongo.errors import DuplicateKeyError
+
+# Content-addressed storage for uploaded originals. Files live in the GridFS bucket
+# `resume_files` under their sha256, so a re-upload of the same bytes reuses the
+# stored blob and snapshots can be re-parsed later without asking for the file again.
+
+RESUME_BUCKET = "resume_files"
+CHUNK_SIZE = 256 * 1024
+
+
+class UploadTooLarge(Exception):
+    pass
+
+
+async def read_upload(file: UploadFile, max_bytes: int) -> tuple[bytes, str]:
+    """Read an upload in chunks, refusing anything over max_bytes; returns (bytes, sha256)."""
+    h = hashlib.sha256()
+    buf = bytearray()
+    while True:
+        chunk = await file.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        if len(buf) + len(chunk) > max_bytes:
+            raise UploadTooLarge(f"File exceeds {max_bytes} bytes.")
+        h.update(chunk)
+        buf.extend(chunk)
+    return bytes(buf), h.hexdigest()
+
+
+async def store_file(db, data: bytes, sha256: str, filename: str, content_type: str | None = None):
+    """Store `data` in GridFS under its hash unless it is already there; returns the GridFS file id."""
+    files = db[f"{RESUME_BUCKET}.files"]
+    existing = await files.find_one({"filename": sha256}, {"_id": 1})
+    if existing:
+        return existing["_id"]
+    bucket = AsyncIOMotorGridFSBucket(db, bucket_name=RESUME_BUCKET)
+    file_id = ObjectId()
+    try:
+        await bucket.upload_from_stream_with_id(
+            file_id,
+            sha256,
+            data,
+            chunk_size_bytes=CHUNK_SIZE,
+            metadata={"original_filename": filename, "content_type": content_type, "size": len(data)},
+        )
+    except DuplicateKeyError:
+        # a concurrent upload of the same bytes wrote its files doc first (unique filename
+        # index); GridFS writes chunks before the files doc, so ours are orphans
+        await db[f"{RESUME_BUCKET}.chunks"].delete_many({"files_id": file_id})
+        existing = await files.find_one({"filename": sha256}, {"_id": 1})
+        if not existing:
+            raise
+        return existing["_id"]
+    return file_id
+
+
+async def read_file(db, file_id) -> bytes:
+    bucket = AsyncIOMotorGridFSBucket(db, bucket_name=RESUME_BUCKET)
+    stream = await bucket.open_download_stream(file_id)
+    return await stream.read()
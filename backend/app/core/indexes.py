@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+# Declarative index registry: every collection's indexes live here and are applied
+# idempotently at startup (create_indexes is a no-op for indexes that already exist).
+# Unique indexes are built before the app serves requests, since auth and every
+# dedupe/upsert path rely on them; the rest build in the background.
+# scripts/check_query_plans.py explains each router's canonical query against them.
+
+INDEXES: dict[str, list[IndexModel]] = {
+    "users": [
+        IndexModel([("email", ASCENDING)], unique=True),
+    ],
+    "sessions": [
+        IndexModel([("token", ASCENDING)], unique=True),
+        IndexModel([("expires_at", ASCENDING)], expireAfterSeconds=0),
+    ],
+    "skills": [
+        IndexModel([("name", ASCENDING)]),
+        IndexModel([("category", ASCENDING), ("name", ASCENDING)]),
+        IndexModel([("evidence_count", ASCENDING), ("name", ASCENDING)]),
+    ],
+    "skill_evidence_counts": [
+        IndexModel([("user_id", ASCENDING), ("skill_id", ASCENDING)], unique=True),
+        IndexModel([("user_id", ASCENDING), ("evidence_count", ASCENDING)]),
+    ],
+    "evidence": [
+        IndexModel([("user_id", ASCENDING), ("created_at", DESCENDING)]),
+        IndexModel([("skill_ids", ASCENDING), ("created_at", DESCENDING)]),
+        IndexModel([("project_id", ASCENDING), ("created_at", DESCENDING)]),
+    ],
+    # list_jobs pages on (created_at, _id); _id is the tiebreaker in every sort key
+    "jobs": [
+        IndexModel([("moderation_status", ASCENDING), ("role_ids", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]),
+        IndexModel([("moderation_status", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]),
+        IndexModel([("created_at", DESCENDING), ("_id", DESCENDING)]),
+        # near-duplicate candidates: multikey over the MinHash LSH band keys
+        IndexModel([("lsh_bands", ASCENDING)]),
+        # duplicates of a job whose approval changed (batch moderation refreshes their roles)
+        IndexModel([("duplicate_of", ASCENDING)], partialFilterExpression={"duplicate_of": {"$type": "objectId"}}),
+        # POST /jobs/bulk idempotency; hand-entered postings have no import_hash
+        IndexModel([("import_hash", ASCENDING)], unique=True, partialFilterExpression={"import_hash": {"$exists": True}}),
+    ],
+    "portfolio_items": [
+        IndexModel([("user_id", ASCENDING), ("priority", DESCENDING), ("updated_at", DESCENDING)]),
+    ],
+    "projects": [
+        IndexModel([("user_id", ASCENDING), ("created_at", DESCENDING)]),
+        IndexModel([("user_id", ASCENDING), ("title", ASCENDING)]),
+    ],
+    # GridFS files doc of the resume_files bucket; the filename is the content sha256 (store_file dedupe)
+    "resume_files.files": [
+        IndexModel([("filename", ASCENDING)], unique=True),
+    ],
+    "resume_snapshots": [
+        IndexModel([("user_id", ASCENDING), ("created_at", DESCENDING)]),
+        # ingest dedupe: raw-bytes sha256 for PDFs, normalized-text sha256 for pastes (legacy docs have no hash)
+        IndexModel(
+            [("user_id", ASCENDING), ("content_hash", ASCENDING)],
+            unique=True,
+            partialFilterExpression={"content_hash": {"$exists": True}},
+        ),
+    ],
+    # one confirmation per user per snapshot; upsert_confirmation relies on this for atomic upserts
+    "resume_skill_confirmations": [
+        IndexModel([("user_id", ASCENDING), ("resume_snapshot_id", ASCENDING)], unique=True),
+    ],
+    "project_skill_links": [
+        IndexModel([("project_id", ASCENDING), ("skill_id", ASCENDING)]),
+    ],
+    "skill_extractions": [
+        IndexModel([("resume_snapshot_id", ASCENDING), ("created_at", DESCENDING)]),
+        # one doc per snapshot per catalog; the fingerprint is the same in every process (docs from scripts have none)
+        IndexModel(
+            [("resume_snapshot_id", ASCENDING), ("catalog_fingerprint", ASCENDING)],
+            unique=True,
+            partialFilterExpression={"catalog_fingerprint": {"$exists": True}},
+        ),
+    ],
+    # job_ingests is read by {_id, user_id}; the built-in _id index already pins it to one doc
+    "job_ingests": [
+        IndexModel([("user_id", ASCENDING), ("created_at", DESCENDING)]),
+    ],
+    "skill_relations": [
+        IndexModel([("from_skill_id", ASCENDING), ("created_at", DESCENDING)]),
+        IndexModel([("to_skill_id", ASCENDING), ("created_at", DESCENDING)]),
+    ],
+    # background ingest jobs: workers claim the oldest queued (or lease-expired) job
+    "jobs_queue": [
+        IndexModel([("status", ASCENDING), ("created_at", ASCENDING)]),
+        IndexModel([("status", ASCENDING), ("lease_expires_at", ASCENDING)]),
+        IndexModel([("user_id", ASCENDING), ("created_at", DESCENDING)]),
+    ],
+    "role_skill_weights": [
+        IndexModel([("role_id", ASCENDING)], unique=True),
+    ],
+}
+
+
+def _select(unique: bool) -> dict[str, list[IndexModel]]:
+    selected = {}
+    for name, models in INDEXES.items():
+        chosen = [m for m in models if bool(m.document.get("unique")) == unique]
+        if chosen:
+            selected[name] = chosen
+    return selected
+
+
+async def ensure_indexes(db, unique: bool | None = None) -> dict[str, str]:
+    """Apply INDEXES, or only its unique / non-unique indexes; one failing collection does not stop the others."""
+    registry = INDEXES if unique is None else _select(unique)
+    results: dict[str, str] = {}
+    for name, models in registry.items():
+        try:
+            created = await db[name].create_indexes(models)
+            results[name] = f"ok ({len(created)} indexes)"
+        except Exception as e:
+            results[name] = f"error: {e}"
+            print(f"[Mongo] index build failed for {name}: {e}")
+    return results
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from pymongo import ReturnDocument
+
+from app.core.config import settings
+from app.core.file_store import read_file
+from app.core.pdf_pool import parse_pdf
+from app.core.resume_ingest import extract_snapshot_skills, find_duplicate_snapshot, insert_snapshot, snapshot_doc
+from app.utils.text import text_sha256
+
+# Background resume ingestion. Requests insert a `jobs_queue` doc and return; workers
+# in every API process claim jobs with a lease (find_one_and_update), run
+# parse -> snapshot -> extract, and record the stage and result on the job doc.
+# The lease is renewed at every stage transition and by a heartbeat while a stage runs,
+# so a slow parse or extraction is not reclaimed; a job whose worker died is picked up
+# again once its lease expires.
+
+QUEUE = "jobs_queue"
+_WORKER_PREFIX = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+_tasks: list[asyncio.Task] = []
+_wake = asyncio.Event()
+
+
+class PermanentIngestError(Exception):
+    """Input problem (unreadable PDF, text too short): fail the job without retrying."""
+
+
+def now_utc() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _lease_until(now: datetime) -> datetime:
+    return now + timedelta(seconds=settings.ingest_lease_seconds)
+
+
+async def enqueue(db, kind: str, user_id: str, payload: dict) -> dict:
+    now = now_utc()
+    doc = {
+        "kind": kind,
+        "user_id": user_id,
+        "payload": payload,
+        "status": "queued",
+        "stage": None,
+        "attempts": 0,
+        "error": None,
+        "result": None,
+        "created_at": now,
+        "updated_at": now,
+    }
+    res = await db[QUEUE].insert_one(doc)
+    _wake.set()
+    return {**doc, "_id": res.inserted_id}
+
+
+async def _claim(db, worker_id: str) -> dict | None:
+    now = now_utc()
+    return await db[QUEUE].find_one_and_update(
+        {
+            "$or": [
+                {"status": "queued"},
+                {"status": "running", "lease_expires_at": {"$lt": now}},
+            ],
+            "attempts": {"$lt": settings.ingest_max_attempts},
+        },
+        {
+            "$set": {
+                "status": "running",
+                "worker_id": worker_id,
+                "lease_expires_at": _lease_until(now),
+                "updated_at": now,
+            },
+            "$inc": {"attempts": 1},
+        },
+        sort=[("created_at", 1)],
+        return_document=ReturnDocument.AFTER,
+    )
+
+
+async def _reap(db):
+    # lease expired on the last allowed attempt: nobody will claim it again
+    await db[QUEUE].update_many(
+        {
+            "status": "running",
+            "lease_expires_at": {"$lt": now_utc()},
+            "attempts": {"$gte": settings.ingest_max_attempts},
+        },
+        {"$set": {"status": "failed", "error": "Worker lease expired.", "lease_expires_at": None, "updated_at": now_utc()}},
+    )
+
+
+async def _update(db, job: dict, worker_id: str, fields: dict) -> bool:
+    # only the lease holder may write; a worker that lost its lease stops quietly.
+    # Stage updates renew the lease; final updates clear it themselves.
+    now = now_utc()
+    lease = {} if "lease_expires_at" in fields else {"lease_expires_at": _lease_until(now)}
+    res = await db[QUEUE].update_one(
+        {"_id": job["_id"], "worker_id": worker_id},
+        {"$set": {**fields, **lease, "updated_at": now}},
+    )
+    return res.matched_count == 1
+
+
+@contextlib.asynccontextmanager
+async def _heartbeat(db, job: dict, worker_id: str):
+    """Keep renewing the job's lease while the body runs (parse waits, long extractions)."""
+
+    async def beat():
+        while True:
+            await asyncio.sleep(settings.ingest_lease_seconds / 3)
+            try:
+                res = await db[QUEUE].update_one(
+                    {"_id": job["_id"], "worker_id": worker_id, "status": "running"},
+                    {"$set": {"lease_expires_at": _lease_until(now_utc())}},
+                )
+            except Exception as e:
+                print(f"[Ingest] heartbeat failed for job {job['_id']}: {e}")
+                continue
+            if res.matched_count == 0:
+                return
+
+    task = asyncio.create_task(beat())
+    try:
+        yield
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+def _content_hash(job: dict) -> str:
+    p = job["payload"]
+    return text_sha256(p["text"]) if job["kind"] == "resume_text" else p["sha256"]
+
+
+async def _parse(db, job: dict) -> tuple[str, dict]:
+    """Returns (raw_text, snapshot metadata)."""
+    p = job["payload"]
+    if job["kind"] == "resume_text":
+        raw_text = p["text"].strip()
+        if len(raw_text) < 10:
+            raise PermanentIngestError("Resume text too short.")
+        return raw_text, {"source": "paste"}
+
+    data = await read_file(db, p["file_id"])
+    try:
+        raw_text = await parse_pdf(data)
+    except ValueError as e:
+        raise PermanentIngestError(str(e))
+    if len(raw_text) < 50:
+        raise PermanentIngestError("Extracted PDF text too short.")
+    metadata = {"source": "pdf", "filename": p["filename"], "file_id": p["file_id"], "sha256": p["sha256"], "size": p["size"]}
+    return raw_text, metadata
+
+
+async def _process(db, job: dict, worker_id: str):
+    user_id = job["user_id"]
+    content_hash = _content_hash(job)
+
+    # same content already ingested for this user: skip straight to extraction
+    snap = await find_duplicate_snapshot(db, user_id, content_hash)
+    deduplicated = snap is not None
+    if snap is None:
+        if not await _update(db, job, worker_id, {"stage": "parse"}):
+            return
+        raw_text, metadata = await _parse(db, job)
+
+        if not await _update(db, job, worker_id, {"stage": "snapshot"}):
+            return
+        source_type = "paste" if job["kind"] == "resume_text" else "pdf"
+        snap, deduplicated = await insert_snapshot(db, snapshot_doc(user_id, source_type, raw_text, metadata, content_hash))
+
+    result = {"snapshot_id": str(snap["_id"]), "deduplicated": deduplicated, "extracted": []}
+    text = snap.get("raw_text") or ""
+    # same minimum as POST /skills/extract/skills; shorter pastes are stored but not extracted
+    if len(text) >= 50:
+        if not await _update(db, job, worker_id, {"stage": "extract"}):
+            return
+        result.update(await extract_snapshot_skills(db, snap["_id"], text))
+
+    await _update(db, job, worker_id, {"status": "done", "stage": None, "result": result, "lease_expires_at": None})
+
+
+async def _fail(db, job: dict, worker_id: str, error: str, permanent: bool):
+    retry = not permanent and job["attempts"] < settings.ingest_max_attempts
+    await _update(
+        db,
+        job,
+        worker_id,
+        {"status": "queued" if retry else "failed", "error": error, "lease_expires_at": None},
+    )
+
+
+async def _worker_loop(db, worker_id: str):
+    while True:
+        try:
+            job = await _claim(db, worker_id)
+        except Exception as e:
+            print(f"[Ingest] claim failed: {e}")
+            job = None
+
+        if job is None:
+            try:
+                await _reap(db)
+            except Exception as e:
+                print(f"[Ingest] reap failed: {e}")
+            _wake.clear()
+            try:
+                await asyncio.wait_for(_wake.wait(), timeout=settings.ingest_poll_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            continue
+
+        try:
+            async with _heartbeat(db, job, worker_id):
+                await _process(db, job, worker_id)
+        except asyncio.CancelledError:
+            raise
+        except PermanentIngestError as e:
+            await _fail(db, job, worker_id, str(e), permanent=True)
+        except TimeoutError:
+            await _fail(db, job, worker_id, "PDF parsing timed out.", permanent=False)
+        except Exception as e:
+            print(f"[Ingest] job {job['_id']} failed: {e}")
+            await _fail(db, job, worker_id, str(e), permanent=False)
+
+
+def start_ingest_workers(db):
+    for i in range(settings.ingest_workers):
+        _tasks.append(asyncio.create_task(_worker_loop(db, f"{_WORKER_PREFIX}-{i}")))
+
+
+async def stop_ingest_workers():
+    for t in _tasks:
+        t.cancel()
+    await asyncio.gather(*_tasks, return_exceptions=True)
+    _tasks.clear()
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import multiprocessing
+
+from pypdf import PdfReader
+
+from app.core.config import settings
+
+# Worker processes for PDF text extraction. pypdf is pure Python and CPU-bound, so
+# parsing on the event loop stalls every other request on the worker. In-flight
+# parses are capped by a semaphore; callers beyond the cap wait (and are counted
+# as queued) instead of piling work onto the workers. Each worker is a process we
+# own with its own pipe, handing out one parse at a time. A worker can't be
+# interrupted mid-parse, so a timeout terminates that worker alone and its slot
+# starts a fresh one on the next parse; parses on other workers are unaffected.
+
+_slots: asyncio.Queue | None = None
+_workers: set[_Worker] = set()
+_semaphore: asyncio.Semaphore | None = None
+_stats = {"queued": 0, "running": 0, "completed": 0, "failed": 0, "timeouts": 0, "worker_restarts": 0}
+
+
+class _WorkerDied(Exception):
+    pass
+
+
+def _parse_pdf(file_bytes: bytes) -> str:
+    try:
+        reader = PdfReader(io.BytesIO(file_bytes))
+        parts = [page.extract_text() or "" for page in reader.pages]
+    except Exception as e:
+        raise ValueError(f"Failed to parse PDF: {e}") from None
+    return "\n".join(parts).strip()
+
+
+def _serve(conn) -> None:
+    # worker process: one PDF in, (ok, text-or-error) out, until the pipe closes
+    while True:
+        try:
+            file_bytes = conn.recv_bytes()
+        except EOFError:
+            return
+        try:
+            conn.send((True, _parse_pdf(file_bytes)))
+        except ValueError as e:
+            conn.send((False, str(e)))
+
+
+class _Worker:
+    def __init__(self):
+        self.conn, child = multiprocessing.Pipe()
+        self.proc = multiprocessing.Process(target=_serve, args=(child,), daemon=True)
+        self.proc.start()
+        child.close()
+        self.alive = True
+        _workers.add(self)
+
+    def parse(self, file_bytes: bytes, timeout: float) -> str:
+        """Blocking; run off the event loop. Terminates this worker if the parse overruns."""
+        try:
+            self.conn.send_bytes(file_bytes)
+            finished = self.conn.poll(timeout)
+            if finished:
+                ok, value = self.conn.recv()
+        except (EOFError, OSError):
+            self.stop()
+            raise _WorkerDied() from None
+        if not finished:
+            self.stop()
+            raise TimeoutError("PDF parsing timed out")
+        if not ok:
+            raise ValueError(value)
+        return value
+
+    def stop(self) -> None:
+        self.alive = False
+        _workers.discard(self)
+        self.proc.terminate()
+        self.proc.join(timeout=5)
+        self.conn.close()
+
+
+def _get_slots() -> asyncio.Queue:
+    # one entry per worker: an idle worker, or None for a slot whose worker isn't running
+    global _slots
+    if _slots is None:
+        _slots = asyncio.Queue()
+        for _ in range(settings.pdf_workers):
+            _slots.put_nowait(None)
+    return _slots
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(settings.pdf_max_concurrency)
+    return _semaphore
+
+
+def _run(worker: _Worker | None, file_bytes: bytes) -> tuple[_Worker, str | BaseException]:
+    if worker is None or not worker.alive:
+        worker = _Worker()
+    try:
+        return worker, worker.parse(file_bytes, settings.pdf_parse_timeout_seconds)
+    except Exception as e:
+        return worker, e
+
+
+async def _parse_in_pool(file_bytes: bytes) -> str:
+    sem = _get_semaphore()
+    _stats["queued"] += 1
+    try:
+        await sem.acquire()
+    finally:
+        _stats["queued"] -= 1
+
+    slots = _get_slots()
+    try:
+        worker = await slots.get()
+    except BaseException:
+        sem.release()
+        raise
+    fut = asyncio.ensure_future(asyncio.to_thread(_run, worker, file_bytes))
+    _stats["running"] += 1
+
+    # the worker and the slot are handed back when the parse is done (or its worker
+    # is terminated), not when the caller stops waiting
+    def _finished(fut) -> None:
+        _stats["running"] -= 1
+        sem.release()
+        used, result = None, None
+        if not fut.cancelled() and fut.exception() is None:
+            used, result = fut.result()
+        if used is not None and not used.alive:
+            _stats["worker_restarts"] += 1
+        slots.put_nowait(used if used is not None and used.alive else None)
+        if isinstance(result, str):
+            _stats["completed"] += 1
+        else:
+            _stats["failed"] += 1
+            if isinstance(result, TimeoutError):
+                _stats["timeouts"] += 1
+
+    fut.add_done_callback(_finished)
+    _, result = await asyncio.shield(fut)
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+
+async def parse_pdf(file_bytes: bytes) -> str:
+    """Extract text in a worker. Raises ValueError for unreadable PDFs, TimeoutError past pdf_parse_timeout_seconds."""
+    try:
+        return await _parse_in_pool(file_bytes)
+    except _WorkerDied:
+        # the worker process crashed mid-parse; try once more on a fresh one
+        try:
+            return await _parse_in_pool(file_bytes)
+        except _WorkerDied:
+            raise ValueError("Failed to parse PDF: parser process crashed") from None
+
+
+def pdf_pool_stats() -> dict:
+    return {
+        "workers": settings.pdf_workers,
+        "max_concurrency": settings.pdf_max_concurrency,
+        "timeout_seconds": settings.pdf_parse_timeout_seconds,
+        **_stats,
+    }
+
+
+def shutdown_pdf_pool():
+    global _slots
+    for worker in list(_workers):
+        worker.stop()
+    _slots = None
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from pymongo import UpdateOne
+from pymongo.errors import DuplicateKeyError
+
+from app.core.extraction_cache import cache_extraction, get_cached_extraction
+from app.core.extraction_pool import extract_many
+from app.core.skill_catalog import get_skill_catalog
+
+# Resume ingestion steps shared by the synchronous endpoints (routers/resumes.py,
+# routers/skills.py) and the background ingest workers (core/ingest_worker.py).
+
+
+def now_utc() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def snapshot_doc(user_id: str, source_type: str, raw_text: str, metadata: dict, content_hash: str) -> dict:
+    return {
+        "user_id": user_id,
+        "source_type": source_type,
+        "raw_text": raw_text,
+        "metadata": metadata,
+        "content_hash": content_hash,
+        "image_ref": "/images/resume_icon.png",
+        "created_at": now_utc(),
+    }
+
+
+async def find_duplicate_snapshot(db, user_id: str, content_hash: str) -> dict | None:
+    return await db["resume_snapshots"].find_one(
+        {"user_id": user_id, "content_hash": content_hash}, {"raw_text": 1}
+    )
+
+
+async def insert_snapshot(db, doc: dict) -> tuple[dict, bool]:
+    """Insert a snapshot; returns (snapshot, deduplicated).
+
+    (user_id, content_hash) is unique, so a concurrent identical ingest returns the winner's snapshot.
+    """
+    try:
+        res = await db["resume_snapshots"].insert_one(doc)
+    except DuplicateKeyError:
+        existing = await find_duplicate_snapshot(db, doc["user_id"], doc["content_hash"])
+        return existing, True
+    return {**doc, "_id": res.inserted_id}, False
+
+
+def _as_stored(dt: datetime) -> datetime:
+    # BSON dates are UTC with millisecond precision and come back naive
+    dt = dt.replace(microsecond=dt.microsecond // 1000 * 1000)
+    return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt
+
+
+async def find_stored_extractions(db, catalog, snapshot_oids: list) -> dict:
+    """Snapshot id -> {"skills", "created_at"} for snapshots already stored against `catalog`."""
+    if not snapshot_oids:
+        return {}
+    cursor = db["skill_extractions"].find(
+        {"resume_snapshot_id": {"$in": snapshot_oids}, "catalog_fingerprint": catalog.fingerprint},
+        {"resume_snapshot_id": 1, "skills": 1, "created_at": 1},
+    )
+    return {
+        d["resume_snapshot_id"]: {"skills": d.get("skills", []), "created_at": _as_stored(d["created_at"])}
+        async for d in cursor
+    }
+
+
+async def store_extractions(db, catalog, items: list[tuple]) -> dict:
+    """Store one skill_extractions doc per (snapshot ObjectId, extracted) pair.
+
+    (resume_snapshot_id, catalog_fingerprint) is unique, so a snapshot that already has a
+    doc for this catalog keeps it, whichever process wrote it. Returns snapshot id ->
+    created_at of the stored doc.
+    """
+    if not items:
+        return {}
+    now = _as_stored(now_utc())
+    ops = [
+        UpdateOne(
+            {"resume_snapshot_id": oid, "catalog_fingerprint": catalog.fingerprint},
+            {"$setOnInsert": {"skills": extracted, "created_at": now}},
+            upsert=True,
+        )
+        for oid, extracted in items
+    ]
+    res = await db["skill_extractions"].bulk_write(ops, ordered=False)
+    created = {items[i][0]: now for i in res.upserted_ids}
+    existing = [oid for oid, _ in items if oid not in created]
+    for oid, d in (await find_stored_extractions(db, catalog, existing)).items():
+        created[oid] = d["created_at"]
+    return created
+
+
+async def extract_snapshot_skills(db, snapshot_oid, text: str) -> dict:
+    """Match the catalog against `text` in the extraction pool and store the result.
+
+    Returns {"extracted", "created_at", "cached", "catalog_version"}. On a cache hit the
+    result is reused; a doc is written only if this snapshot doesn't have one for it yet.
+    """
+    catalog = await get_skill_catalog(db)
+    cached = get_cached_extraction(text, catalog.version)
+    if cached and snapshot_oid in cached["snapshots"]:
+        created_at = cached["snapshots"][snapshot_oid]
+        return {"extracted": cached["extracted"], "created_at": created_at, "cached": True, "catalog_version": catalog.version}
+
+    if cached:
+        extracted = cached["extracted"]
+    else:
+        [extracted] = await extract_many(catalog, [text])
+    created_at = (await store_extractions(db, catalog, [(snapshot_oid, extracted)]))[snapshot_oid]
+    cache_extraction(text, catalog.version, extracted, snapshot_oid, created_at)
+    return {"extracted": extracted, "created_at": created_at, "cached": cached is not None, "catalog_version": catalog.version}
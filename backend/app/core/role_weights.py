@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from bson import ObjectId
+from pymongo import UpdateOne
+
+from app.models.job import moderation_status_query
+
+# Role skill weights: weight = (# approved jobs in role that mention skill_id) / (# approved jobs in role).
+# Stored per role in `role_skill_weights`; recomputed on demand (POST /roles/{id}/compute_weights,
+# POST /roles/compute_weights for every role) and after batch moderation changes which jobs are approved.
+#
+# Counting happens in one aggregation: each approved job is unwound to one row per
+# (role, skill) plus a (role, None) row, so a single $group yields both the per-skill
+# counts and each role's job total without pulling jobs into Python. A near-duplicate
+# (duplicate_of set) is left out only while its original is approved; if the original
+# is pending or rejected the repost is the one that counts. Jobs with no moderation_status
+# predate moderation and count as approved, as GET /jobs reports them.
+
+
+def now_utc():
+    return datetime.now(timezone.utc)
+
+
+def _weights_pipeline(role_ids: list[str] | None) -> list[dict]:
+    match: dict = {"moderation_status": moderation_status_query("approved")}
+    if role_ids is not None:
+        match["role_ids"] = {"$in": role_ids}
+    pipeline = [
+        {"$match": match},
+        {
+            "$lookup": {
+                "from": "jobs",
+                "localField": "duplicate_of",
+                "foreignField": "_id",
+                "pipeline": [{"$match": {"moderation_status": moderation_status_query("approved")}}, {"$project": {"_id": 1}}],
+                "as": "approved_original",
+            }
+        },
+        {"$match": {"approved_original": {"$size": 0}}},
+        {
+            "$project": {
+                "role": {"$setUnion": [{"$ifNull": ["$role_ids", []]}, []]},
+                # a job counts once per skill however often the id repeats; None marks the job itself
+                "skill": {"$concatArrays": [[None], {"$setUnion": [{"$ifNull": ["$required_skill_ids", []]}, []]}]},
+            }
+        },
+        {"$unwind": "$role"},
+    ]
+    if role_ids is not None:
+        # jobs tagged with several roles also unwind into roles we weren't asked about
+        pipeline.append({"$match": {"role": {"$in": role_ids}}})
+    pipeline += [
+        {"$unwind": "$skill"},
+        {"$group": {"_id": {"role": "$role", "skill": "$skill"}, "count": {"$sum": 1}}},
+    ]
+    return pipeline
+
+
+async def _skill_names(db, skill_ids) -> dict[str, str]:
+    oids = [ObjectId(s) for s in set(skill_ids) if ObjectId.is_valid(str(s))]
+    if not oids:
+        return {}
+    cursor = db["skills"].find({"_id": {"$in": oids}}, {"name": 1})
+    return {str(s["_id"]): s.get("name", "") async for s in cursor}
+
+
+async def compute_weights(db, roles: list[dict]) -> list[dict]:
+    """Recompute and store weights for `roles` (docs with _id and name) in one aggregation."""
+    if not roles:
+        return []
+    role_ids = [str(r["_id"]) for r in roles]
+    totals: dict[str, int] = {}
+    counts: dict[str, list[tuple[str, int]]] = {}
+    cursor = db["jobs"].aggregate(_weights_pipeline(role_ids), allowDiskUse=True)
+    async for row in cursor:
+        role, skill = row["_id"]["role"], row["_id"].get("skill")
+        if skill is None:
+            totals[role] = row["count"]
+        else:
+            counts.setdefault(role, []).append((skill, row["count"]))
+
+    names = await _skill_names(db, (sid for rows in counts.values() for sid, _ in rows))
+
+    now = now_utc()
+    docs = []
+    for role in roles:
+        role_id = str(role["_id"])
+        total = totals.get(role_id, 0)
+        rows = sorted(counts.get(role_id, []), key=lambda r: (-r[1], str(r[0])))
+        weights = [
+            {"skill_id": sid, "weight": n / total, "skill_name": names.get(str(sid), "")}
+            for sid, n in rows
+        ] if total else []
+        docs.append({
+            "role_id": role["_id"],
+            "role_name": role.get("name", ""),
+            "computed_at": now,
+            "job_count": total,
+            "weights": weights,
+        })
+
+    await db["role_skill_weights"].bulk_write(
+        [UpdateOne({"role_id": d["role_id"]}, {"$set": d}, upsert=True) for d in docs],
+        ordered=False,
+    )
+    return docs
+
+
+async def recompute_role_weights(db, role: dict) -> dict:
+    [doc] = await compute_weights(db, [role])
+    return doc
+
+
+async def refresh_role_weights(db, role_ids) -> None:
+    """Recompute each distinct role once; ids that aren't valid roles are ignored."""
+    oids = list({ObjectId(r) for r in role_ids if ObjectId.is_valid(str(r))})
+    if not oids:
+        return
+    roles = await db["roles"].find({"_id": {"$in": oids}}, {"name": 1}).to_list(length=None)
+    try:
+        await compute_weights(db, roles)
+    except Exception as e:
+        print(f"[Roles] weight refresh failed for {len(roles)} roles: {e}")
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from app.core.config import settings
+from app.utils.skill_matcher import SkillMatcher
+from app.utils.skill_suggest import SuggestIndex
+
+# Process-wide snapshot of the `skills` collection shared by extraction, tailoring
+# and typeahead. Taxonomy writes call invalidate_skill_catalog(); edits made outside
+# this process (seed/cleanup scripts, other workers) are picked up after
+# skill_catalog_ttl_seconds.
+
+
+def now_utc():
+    return datetime.now(timezone.utc)
+
+
+@dataclass(frozen=True)
+class SkillCatalog:
+    version: int
+    fingerprint: str
+    skills: list[dict]
+    matcher: SkillMatcher
+    suggest_index: SuggestIndex
+    loaded_at: datetime
+
+
+_catalog: SkillCatalog | None = None
+_version = 0
+_lock = asyncio.Lock()
+
+
+def _fingerprint(skills: list[dict]) -> str:
+    h = hashlib.sha1()
+    for s in skills:
+        h.update(repr((str(s["_id"]), s.get("name"), s.get("category"), s.get("aliases"))).encode("utf-8"))
+    return h.hexdigest()
+
+
+def _compile(skills: list[dict]) -> tuple[SkillMatcher, SuggestIndex]:
+    return SkillMatcher(skills), SuggestIndex(skills)
+
+
+def _is_fresh(catalog: SkillCatalog | None) -> bool:
+    if catalog is None or catalog.version != _version:
+        return False
+    age = (now_utc() - catalog.loaded_at).total_seconds()
+    return age < settings.skill_catalog_ttl_seconds
+
+
+def current_catalog_version() -> int:
+    return _version
+
+
+def invalidate_skill_catalog() -> int:
+    """Mark the cached catalog stale after a taxonomy write; returns the new version."""
+    global _version
+    _version += 1
+    return _version
+
+
+async def get_skill_catalog(db) -> SkillCatalog:
+    global _catalog, _version
+    if _is_fresh(_catalog):
+        return _catalog
+
+    async with _lock:
+        if _is_fresh(_catalog):
+            return _catalog
+
+        version = _version
+        cursor = db["skills"].find({}, {"name": 1, "category": 1, "aliases": 1}).sort("_id", 1)
+        skills = await cursor.to_list(length=None)
+        fingerprint = _fingerprint(skills)
+
+        prev = _catalog
+        if prev is not None and prev.version == version and prev.fingerprint == fingerprint:
+            # TTL expired but nothing changed: keep the version and the compiled indexes
+            _catalog = SkillCatalog(version, fingerprint, prev.skills, prev.matcher, prev.suggest_index, now_utc())
+            return _catalog
+
+        if prev is not None and prev.version == version and version == _version:
+            # changed behind our back (another process wrote to `skills`)
+            _version += 1
+            version = _version
+
+        matcher, suggest_index = await asyncio.to_thread(_compile, skills)
+        _catalog = SkillCatalog(version, fingerprint, skills, matcher, suggest_index, now_utc())
+        return _catalog
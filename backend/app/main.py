@@ -1,11 +1,16 @@
 from fastapi import FastAPI
 from app.core.db import connect_to_mongo, close_mongo_connection, get_db
+from app.core.extraction_pool import shutdown_extraction_pool
+from app.core.indexes import ensure_indexes
+from app.core.ingest_worker import start_ingest_workers, stop_ingest_workers
+from app.core.pdf_pool import shutdown_pdf_pool
 from app.routers.health import router as health_router
 from app.routers.skills import router as skills_router
 from app.routers.confirmations import router as confirmations_router
 from app.routers.jobs import router as jobs_router
 from app.routers.evidence import router as evidence_router
 from app.routers.resumes import router as resumes_router
+from app.routers.ingest_jobs import router as ingest_jobs_router
 from app.routers.projects import router as projects_router
 from app.routers.dashboard import router as dashboard_router
 from app.routers.roles import router as roles_router
@@ -15,12 +20,7 @@ from app.routers.portfolio import router as portfolio_router
 from app.routers.auth import router as auth_router
 from fastapi.middleware.cors import CORSMiddleware
 from datetime import datetime
-
-async def ensure_indexes():
-    db = get_db()
-    await db["users"].create_index("email", unique=True)
-    await db["sessions"].create_index("token", unique=True)
-    await db["sessions"].create_index("expires_at", expireAfterSeconds=0)
+import asyncio
 
 app = FastAPI(title="SkillBridge API", version="0.3.0")
 
@@ -33,15 +33,25 @@ app.add_middleware(
     allow_credentials=False,  # set True ONLY if you use cookie-based auth
     allow_methods=["*"],
     allow_headers=["*"],
+    # readable by the frontend: list pagination and dashboard cache/timing diagnostics
+    expose_headers=["X-Next-Cursor", "X-Cache", "Server-Timing"],
 )
 
 @app.on_event("startup")
 async def on_startup():
     await connect_to_mongo()
-    await ensure_indexes()
+    # auth (users.email, sessions.token) and the dedupe upserts need their unique indexes
+    # before the first request; secondary index builds can take a while on large
+    # collections, so startup doesn't wait for those
+    app.state.unique_indexes = await ensure_indexes(get_db(), unique=True)
+    app.state.index_task = asyncio.create_task(ensure_indexes(get_db(), unique=False))
+    start_ingest_workers(get_db())
 
 @app.on_event("shutdown")
 async def on_shutdown():
+    await stop_ingest_workers()
+    shutdown_extraction_pool()
+    shutdown_pdf_pool()
     await close_mongo_connection()
 
 app.include_router(health_router, prefix="/health", tags=["health"])
@@ -50,6 +60,7 @@ app.include_router(confirmations_router, prefix="/skills/confirmations", tags=["
 app.include_router(jobs_router, prefix="/jobs", tags=["jobs"])
 app.include_router(evidence_router, prefix="/evidence", tags=["evidence"])
 app.include_router(resumes_router, prefix="/ingest/resume", tags=["resume"])
+app.include_router(ingest_jobs_router, prefix="/ingest/jobs", tags=["ingest"])
 app.include_router(projects_router, prefix="/projects", tags=["projects"])
 app.include_router(dashboard_router, prefix="/dashboard", tags=["dashboard"])
 app.include_router(roles_router, prefix="/roles", tags=["roles"])
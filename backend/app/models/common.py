@@ -1,5 +1,16 @@
-from pydantic import BaseModel, Field
+from typing import Annotated
+
+from bson import ObjectId
+from pydantic import AfterValidator, BaseModel, Field
+
+def _check_object_id(v: str) -> str:
+    if not ObjectId.is_valid(v):
+        raise ValueError("must be a 24-character hex ObjectId")
+    return v
+
+# Skill ids travel as strings in the API and are stored as ObjectIds in every
+# collection (evidence.skill_ids, confirmations, project_skill_links).
+ObjectIdStr = Annotated[str, AfterValidator(_check_object_id)]
 
 class MongoOut(BaseModel):
     id: str = Field(..., description="MongoDB ObjectId as string")
-
@@ -4,21 +4,23 @@ from datetime import datetime
 from typing import List, Optional
 from pydantic import BaseModel, Field
 
+from app.models.common import ObjectIdStr
+
 
 class ConfirmedSkillEntry(BaseModel):
-    skill_id: str
+    skill_id: ObjectIdStr
     skill_name: str
     proficiency: int = Field(default=0, ge=0, le=5)
 
 
 class RejectedSkill(BaseModel):
-    skill_id: str
+    skill_id: ObjectIdStr
     skill_name: str
 
 
 class EditedSkill(BaseModel):
     from_text: str
-    to_skill_id: str
+    to_skill_id: ObjectIdStr
 
 
 class ConfirmationIn(BaseModel):
@@ -37,4 +39,23 @@ class ConfirmationOut(BaseModel):
     rejected: List[RejectedSkill] = Field(default_factory=list)
     edited: List[EditedSkill] = Field(default_factory=list)
     created_at: Optional[datetime] = None
-    updated_at: Optional[datetime] = None
\ No newline at end of file
+    updated_at: Optional[datetime] = None
+
+class ProficiencyChange(BaseModel):
+    skill_id: ObjectIdStr
+    proficiency: int = Field(..., ge=0, le=5)
+
+
+class ConfirmationPatchIn(BaseModel):
+    user_id: str = Field(..., min_length=1)
+    add: List[ProficiencyChange] = Field(default_factory=list)
+    remove: List[ObjectIdStr] = Field(default_factory=list)
+    set_proficiency: List[ProficiencyChange] = Field(default_factory=list)
+    reject: List[ObjectIdStr] = Field(default_factory=list)
+    unreject: List[ObjectIdStr] = Field(default_factory=list)
+
+
+class ConfirmationPatchOut(BaseModel):
+    id: str
+    modified: int
+    updated_at: datetime
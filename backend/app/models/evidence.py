@@ -4,6 +4,8 @@ from pydantic import BaseModel, Field
 from typing import List, Literal, Optional
 from datetime import datetime
 
+from app.models.common import ObjectIdStr
+
 EvidenceType = Literal["resume", "paper", "job_posting", "project", "cert", "other"]
 
 class EvidenceIn(BaseModel):
@@ -17,7 +19,7 @@ class EvidenceIn(BaseModel):
     text_excerpt: str = Field(..., min_length=1)
 
     # NEW: associations
-    skill_ids: List[str] = Field(default_factory=list)
+    skill_ids: List[ObjectIdStr] = Field(default_factory=list)
     project_id: Optional[str] = None
 
     # misc metadata
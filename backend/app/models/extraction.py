@@ -1,6 +1,6 @@
 from __future__ import annotations
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import List, Literal, Optional
 from datetime import datetime
 
 
@@ -16,3 +16,18 @@ class SkillExtractionOut(BaseModel):
     extracted: List[ExtractedSkill]
     created_at: datetime
 
+
+class SkillExtractionBatchIn(BaseModel):
+    snapshot_ids: List[str] = Field(..., min_length=1, max_length=1000)
+
+
+class SkillExtractionBatchItem(BaseModel):
+    snapshot_id: str
+    status: Literal["extracted", "cached", "invalid_id", "not_found", "too_short"]
+    extracted: List[ExtractedSkill] = Field(default_factory=list)
+    created_at: Optional[datetime] = None
+
+
+class SkillExtractionBatchOut(BaseModel):
+    catalog_version: int
+    results: List[SkillExtractionBatchItem]
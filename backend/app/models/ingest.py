@@ -0,0 +1,18 @@
+from __future__ import annotations
+from pydantic import BaseModel
+from typing import Any, Dict, Literal, Optional
+from datetime import datetime
+
+
+class IngestJobOut(BaseModel):
+    id: str
+    user_id: str
+    kind: Literal["resume_pdf", "resume_text"]
+    status: Literal["queued", "running", "done", "failed"]
+    stage: Optional[str] = None  # parse | snapshot | extract
+    attempts: int = 0
+    error: Optional[str] = None
+    # done: {snapshot_id, deduplicated, catalog_version, cached, extracted: [...]}
+    result: Optional[Dict[str, Any]] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
@@ -6,6 +6,15 @@ from datetime import datetime
 
 ModerationStatus = Literal["pending", "approved", "rejected"]
 
+# postings stored before moderation existed have no moderation_status; they count as approved
+DEFAULT_MODERATION_STATUS: ModerationStatus = "approved"
+
+
+def moderation_status_query(*statuses: str):
+    """Mongo condition on moderation_status for `statuses`; a missing status matches the default."""
+    values = list(statuses) + ([None] if DEFAULT_MODERATION_STATUS in statuses else [])
+    return values[0] if len(values) == 1 else {"$in": values}
+
 class JobIn(BaseModel):
     title: str = Field(..., min_length=1)
     company: str = Field(..., min_length=1)
@@ -38,6 +47,9 @@ class JobOut(BaseModel):
     moderation_status: ModerationStatus = "approved"
     moderation_reason: Optional[str] = None
     submitted_by_user_id: Optional[str] = None
+    # near-duplicate of an earlier posting (MinHash estimate of description similarity)
+    duplicate_of: Optional[str] = None
+    duplicate_score: Optional[float] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
@@ -47,3 +59,37 @@ class JobModerationIn(BaseModel):
 
 class JobRoleTagIn(BaseModel):
     role_id: str = Field(..., min_length=1)
+
+class JobBulkError(BaseModel):
+    line: int
+    error: str
+
+class JobBulkImportOut(BaseModel):
+    inserted: int = 0
+    skipped: int = 0  # already imported (same title/company/location/description)
+    failed: int = 0
+    errors: List[JobBulkError] = Field(default_factory=list)  # first failures only
+
+class JobModerationFilter(BaseModel):
+    moderation_status: Optional[ModerationStatus] = None
+    role_id: Optional[str] = None
+    source: Optional[str] = None
+    submitted_by_user_id: Optional[str] = None
+
+class JobBatchModerationIn(BaseModel):
+    moderation_status: ModerationStatus
+    moderation_reason: Optional[str] = None
+    # exactly one of job_ids / filter
+    job_ids: Optional[List[str]] = Field(default=None, min_length=1, max_length=5000)
+    filter: Optional[JobModerationFilter] = None
+    limit: int = Field(default=1000, ge=1, le=5000)  # filter mode: max jobs moderated per call
+
+class JobBatchModerationItem(BaseModel):
+    id: str
+    status: Literal["updated", "not_found", "invalid_id"]
+
+class JobBatchModerationOut(BaseModel):
+    moderation_status: ModerationStatus
+    updated: int
+    results: List[JobBatchModerationItem]
+    roles_refreshing: List[str] = Field(default_factory=list)
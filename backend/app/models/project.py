@@ -4,6 +4,8 @@ from datetime import datetime
 from typing import List, Optional
 from pydantic import BaseModel, Field
 
+from app.models.common import ObjectIdStr
+
 class ProjectIn(BaseModel):
     user_id: str = Field(..., min_length=1)
     title: str = Field(..., min_length=1)
@@ -24,7 +26,7 @@ class ProjectOut(BaseModel):
     updated_at: Optional[datetime] = None
 
 class ProjectSkillLinkIn(BaseModel):
-    skill_id: str = Field(..., min_length=1)
+    skill_id: ObjectIdStr
 
 class ProjectSkillLinkOut(BaseModel):
     id: str
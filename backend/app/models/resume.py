@@ -12,6 +12,8 @@ class ResumeSnapshotIn(BaseModel):
 class ResumeSnapshotOut(BaseModel):
     snapshot_id: str
     preview: str
+    # True when the same content was already ingested for this user and the existing snapshot is returned
+    deduplicated: bool = False
 
 
 class ResumeSnapshotDB(BaseModel):
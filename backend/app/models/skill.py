@@ -1,6 +1,6 @@
 from __future__ import annotations
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import List, Literal, Optional
 from datetime import datetime
 
 
@@ -24,4 +24,12 @@ class SkillOut(BaseModel):
 
 class SkillUpdate(BaseModel):
     proficiency: Optional[int] = Field(default=None, ge=0, le=5)
-    last_used_at: Optional[datetime] = None
\ No newline at end of file
+    last_used_at: Optional[datetime] = None
+
+class SkillSuggestionOut(BaseModel):
+    id: str
+    name: str
+    category: str
+    matched_on: Literal["name", "alias"]
+    match_type: Literal["exact", "prefix"]
+    matched_text: str
@@ -1,14 +1,19 @@
 from fastapi import APIRouter, Query, HTTPException
 from app.core.db import get_db
+from app.core.dashboard_cache import invalidate_dashboard
 from app.models.confirmations import (
     ConfirmationIn,
     ConfirmationOut,
+    ConfirmationPatchIn,
+    ConfirmationPatchOut,
     ConfirmedSkillEntry,
     RejectedSkill,
     EditedSkill,
 )
 from app.utils.mongo import oid_str
 from bson import ObjectId
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import DuplicateKeyError
 from datetime import datetime, timezone
 
 router = APIRouter()
@@ -18,107 +23,19 @@ def now_utc() -> datetime:
     return datetime.now(timezone.utc)
 
 
-@router.post("/", response_model=ConfirmationOut)
-async def upsert_confirmation(payload: ConfirmationIn):
-    db = get_db()
-
-    # Validate snapshot id
-    try:
-        snapshot_oid = ObjectId(payload.resume_snapshot_id)
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid resume_snapshot_id")
-
-    snap = await db["resume_snapshots"].find_one({"_id": snapshot_oid})
-    if not snap:
-        raise HTTPException(status_code=404, detail="Resume snapshot not found")
-
-    # Build confirmed entries with skill_name + proficiency
-    confirmed_docs = []
-    for entry in payload.confirmed:
-        try:
-            skill_oid = ObjectId(entry.skill_id)
-        except Exception:
-            raise HTTPException(status_code=400, detail=f"Invalid skill_id: {entry.skill_id}")
-
-        skill = await db["skills"].find_one({"_id": skill_oid})
-        if not skill:
-            raise HTTPException(status_code=404, detail=f"Skill not found: {entry.skill_id}")
-
-        skill_name = skill.get("name") or skill.get("skill_name") or "Unknown"
-
-        confirmed_docs.append(
-            {
-                "skill_id": skill_oid,
-                "skill_name": skill_name,
-                "proficiency": entry.proficiency,
-            }
-        )
-
-    # Build rejected entries with skill_name
-    rejected_docs = []
-    for r in payload.rejected:
-        try:
-            skill_oid = ObjectId(r.skill_id)
-        except Exception:
-            raise HTTPException(status_code=400, detail=f"Invalid rejected.skill_id: {r.skill_id}")
-
-        skill = await db["skills"].find_one({"_id": skill_oid})
-        if not skill:
-            raise HTTPException(status_code=404, detail=f"Skill not found: {r.skill_id}")
-
-        skill_name = skill.get("name") or skill.get("skill_name") or r.skill_name or "Unknown"
-        rejected_docs.append({"skill_id": skill_oid, "skill_name": skill_name})
-
-    # Edited entries: validate to_skill_id exists
-    edited_docs = []
-    for e in payload.edited:
-        try:
-            to_skill_oid = ObjectId(e.to_skill_id)
-        except Exception:
-            raise HTTPException(status_code=400, detail=f"Invalid edited.to_skill_id: {e.to_skill_id}")
+async def _resolve_skill_names(db, skill_oids: list[ObjectId]) -> dict[ObjectId, str]:
+    """Map each referenced skill id to its name; 404 if any id is not in the catalog."""
+    if not skill_oids:
+        return {}
+    cursor = db["skills"].find({"_id": {"$in": list(set(skill_oids))}}, {"name": 1, "skill_name": 1})
+    found = {s["_id"]: s.get("name") or s.get("skill_name") or "" async for s in cursor}
+    for oid in skill_oids:
+        if oid not in found:
+            raise HTTPException(status_code=404, detail=f"Skill not found: {oid_str(oid)}")
+    return found
 
-        skill = await db["skills"].find_one({"_id": to_skill_oid})
-        if not skill:
-            raise HTTPException(status_code=404, detail=f"Skill not found: {e.to_skill_id}")
-
-        edited_docs.append({"from_text": e.from_text, "to_skill_id": to_skill_oid})
-
-    # Upsert (one confirmation per user per snapshot)
-    q = {"user_id": payload.user_id, "resume_snapshot_id": snapshot_oid}
-    now = now_utc()
-
-    existing = await db["resume_skill_confirmations"].find_one(q)
-    if existing:
-        created_at = existing.get("created_at", now)
-        await db["resume_skill_confirmations"].update_one(
-            {"_id": existing["_id"]},
-            {
-                "$set": {
-                    "confirmed": confirmed_docs,
-                    "rejected": rejected_docs,
-                    "edited": edited_docs,
-                    "updated_at": now,
-                }
-            },
-        )
-        doc_id = existing["_id"]
-    else:
-        doc = {
-            "user_id": payload.user_id,
-            "resume_snapshot_id": snapshot_oid,
-            "confirmed": confirmed_docs,
-            "rejected": rejected_docs,
-            "edited": edited_docs,
-            "created_at": now,
-            "updated_at": now,
-        }
-        res = await db["resume_skill_confirmations"].insert_one(doc)
-        doc_id = res.inserted_id
-        created_at = doc["created_at"]
-
-    # Read back the updated document to return consistent payload
-    d = await db["resume_skill_confirmations"].find_one({"_id": doc_id})
 
+def _confirmation_out(d: dict) -> ConfirmationOut:
     return ConfirmationOut(
         id=oid_str(d["_id"]),
         user_id=d["user_id"],
@@ -150,6 +67,118 @@ async def upsert_confirmation(payload: ConfirmationIn):
     )
 
 
+@router.post("/", response_model=ConfirmationOut)
+async def upsert_confirmation(payload: ConfirmationIn):
+    db = get_db()
+
+    # Validate snapshot id
+    try:
+        snapshot_oid = ObjectId(payload.resume_snapshot_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid resume_snapshot_id")
+
+    snap = await db["resume_snapshots"].find_one({"_id": snapshot_oid})
+    if not snap:
+        raise HTTPException(status_code=404, detail="Resume snapshot not found")
+
+    confirmed_oids = [ObjectId(c.skill_id) for c in payload.confirmed]
+    rejected_oids = [ObjectId(r.skill_id) for r in payload.rejected]
+    edited_oids = [ObjectId(e.to_skill_id) for e in payload.edited]
+
+    # Validate and name-resolve every referenced skill with one $in query
+    skill_names = await _resolve_skill_names(db, confirmed_oids + rejected_oids + edited_oids)
+
+    confirmed_docs = [
+        {"skill_id": oid, "skill_name": skill_names[oid] or "Unknown", "proficiency": entry.proficiency}
+        for oid, entry in zip(confirmed_oids, payload.confirmed)
+    ]
+    rejected_docs = [
+        {"skill_id": oid, "skill_name": skill_names[oid] or r.skill_name or "Unknown"}
+        for oid, r in zip(rejected_oids, payload.rejected)
+    ]
+    edited_docs = [{"from_text": e.from_text, "to_skill_id": oid} for oid, e in zip(edited_oids, payload.edited)]
+
+    # Upsert (one confirmation per user per snapshot, enforced by a unique index)
+    q = {"user_id": payload.user_id, "resume_snapshot_id": snapshot_oid}
+    now = now_utc()
+    update = {
+        "$set": {
+            "confirmed": confirmed_docs,
+            "rejected": rejected_docs,
+            "edited": edited_docs,
+            "updated_at": now,
+        },
+        "$setOnInsert": {"created_at": now},
+    }
+    try:
+        d = await db["resume_skill_confirmations"].find_one_and_update(
+            q, update, upsert=True, return_document=ReturnDocument.AFTER
+        )
+    except DuplicateKeyError:
+        # a concurrent request inserted the doc first; our write now matches it
+        d = await db["resume_skill_confirmations"].find_one_and_update(
+            q, update, upsert=True, return_document=ReturnDocument.AFTER
+        )
+
+    invalidate_dashboard(payload.user_id)
+
+    return _confirmation_out(d)
+
+
+@router.patch("/{confirmation_id}", response_model=ConfirmationPatchOut)
+async def patch_confirmation(confirmation_id: str, payload: ConfirmationPatchIn):
+    """Apply incremental changes instead of resending the full confirmed/rejected/edited arrays."""
+    db = get_db()
+    try:
+        conf_oid = ObjectId(confirmation_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid confirmation_id")
+
+    added = [(ObjectId(a.skill_id), a.proficiency) for a in payload.add]
+    rejected = [ObjectId(s) for s in payload.reject]
+    skill_names = await _resolve_skill_names(db, [oid for oid, _ in added] + rejected)
+
+    # Every op is scoped to the owner; if nothing matches, the confirmation doesn't exist for this user.
+    q = {"_id": conf_oid, "user_id": payload.user_id}
+    now = now_utc()
+    ops = [UpdateOne(q, {"$set": {"updated_at": now}})]
+
+    pulled = [ObjectId(s) for s in payload.remove] + rejected
+    if pulled:
+        ops.append(UpdateOne(q, {"$pull": {"confirmed": {"skill_id": {"$in": pulled}}}}))
+    for oid, proficiency in added:
+        # conditional push: confirmed holds at most one entry per skill
+        ops.append(
+            UpdateOne(
+                {**q, "confirmed.skill_id": {"$ne": oid}},
+                {"$push": {"confirmed": {"skill_id": oid, "skill_name": skill_names[oid] or "Unknown", "proficiency": proficiency}}},
+            )
+        )
+    if added:
+        ops.append(UpdateOne(q, {"$pull": {"rejected": {"skill_id": {"$in": [oid for oid, _ in added]}}}}))
+    for c in payload.set_proficiency:
+        oid = ObjectId(c.skill_id)
+        ops.append(UpdateOne({**q, "confirmed.skill_id": oid}, {"$set": {"confirmed.$.proficiency": c.proficiency}}))
+    for oid in rejected:
+        ops.append(
+            UpdateOne(
+                {**q, "rejected.skill_id": {"$ne": oid}},
+                {"$push": {"rejected": {"skill_id": oid, "skill_name": skill_names[oid] or "Unknown"}}},
+            )
+        )
+    if payload.unreject:
+        ops.append(UpdateOne(q, {"$pull": {"rejected": {"skill_id": {"$in": [ObjectId(s) for s in payload.unreject]}}}}))
+
+    res = await db["resume_skill_confirmations"].bulk_write(ops, ordered=True)
+    if res.matched_count == 0:
+        raise HTTPException(status_code=404, detail="Confirmation not found")
+
+    invalidate_dashboard(payload.user_id)
+
+    # the updated_at $set always modifies the doc; report only the requested changes
+    return ConfirmationPatchOut(id=confirmation_id, modified=max(res.modified_count - 1, 0), updated_at=now)
+
+
 @router.get("/", response_model=list[ConfirmationOut])
 async def list_confirmations(user_id: str | None = Query(default=None)):
     db = get_db()
@@ -159,35 +188,4 @@ async def list_confirmations(user_id: str | None = Query(default=None)):
 
     docs = await db["resume_skill_confirmations"].find(q).to_list(length=500)
 
-    return [
-        ConfirmationOut(
-            id=oid_str(d["_id"]),
-            user_id=d["user_id"],
-            resume_snapshot_id=oid_str(d["resume_snapshot_id"]),
-            confirmed=[
-                ConfirmedSkillEntry(
-                    skill_id=oid_str(c["skill_id"]),
-                    skill_name=c.get("skill_name", ""),
-                    proficiency=int(c.get("proficiency", 0)),
-                )
-                for c in d.get("confirmed", [])
-            ],
-            rejected=[
-                RejectedSkill(
-                    skill_id=oid_str(r["skill_id"]),
-                    skill_name=r.get("skill_name", ""),
-                )
-                for r in d.get("rejected", [])
-            ],
-            edited=[
-                EditedSkill(
-                    from_text=e.get("from_text", ""),
-                    to_skill_id=oid_str(e["to_skill_id"]),
-                )
-                for e in d.get("edited", [])
-            ],
-            created_at=d.get("created_at"),
-            updated_at=d.get("updated_at"),
-        )
-        for d in docs
-    ]
\ No newline at end of file
+    return [_confirmation_out(d) for d in docs]
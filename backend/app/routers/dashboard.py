@@ -1,79 +1,114 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Query
+import asyncio
+import time
+
+from fastapi import APIRouter, Query, Response
 from bson import ObjectId
 from app.core.db import get_db
+from app.core.dashboard_cache import cache_summary, dashboard_cache_stats, dashboard_generation, get_cached_summary
 from app.utils.mongo import oid_str
 
 router = APIRouter()
 
-# UC 1.4 – Dashboard Summary (Skill coverage + evidence + recent projects)
-@router.get("/summary")
-async def dashboard_summary(user_id: str = Query(..., min_length=1), top_n: int = Query(default=10, ge=1, le=50)):
-    db = get_db()
+async def _timed(timings: dict, stage: str, coro):
+    t0 = time.perf_counter()
+    try:
+        return await coro
+    finally:
+        timings[stage] = round((time.perf_counter() - t0) * 1000, 2)
 
-    # Recent projects
-    projects = await (
+async def _recent_projects(db, user_id: str) -> list[dict]:
+    # find + count_documents, both answered from the (user_id, created_at) index; a
+    # $facet would fetch every project of the user to sort and count them in memory
+    return await (
         db["projects"]
-        .find({"user_id": user_id}, {"title": 1, "description": 1, "created_at": 1})
+        .find({"user_id": user_id}, {"title": 1, "created_at": 1})
         .sort("created_at", -1)
         .limit(10)
         .to_list(length=10)
     )
-    proj_out = [{"id": oid_str(p["_id"]), "title": p.get("title",""), "created_at": p.get("created_at")} for p in projects]
 
-    # Evidence counts per skill (via evidence.skill_ids)
+async def _evidence_stats(db, user_id: str, top_n: int) -> dict:
+    # Evidence counts per skill (via evidence.skill_ids) + total evidence, in one $facet.
+    # skill_ids are ObjectIds, so the skills join is a plain _id lookup.
     pipeline = [
         {"$match": {"user_id": user_id}},
-        {"$unwind": {"path": "$skill_ids", "preserveNullAndEmptyArrays": False}},
-        {"$group": {"_id": "$skill_ids", "evidence_count": {"$sum": 1}}},
-        {"$sort": {"evidence_count": -1}},
-        {"$limit": top_n},
         {
-            "$lookup": {
-                "from": "skills",
-                "let": {"sid": "$_id"},
-                "pipeline": [
-                    {"$match": {"$expr": {"$eq": ["$_id", {"$toObjectId": "$$sid"}]}}},
-                    {"$project": {"name": 1, "category": 1}},
+            "$facet": {
+                "top_skills": [
+                    {"$unwind": {"path": "$skill_ids", "preserveNullAndEmptyArrays": False}},
+                    {"$group": {"_id": "$skill_ids", "evidence_count": {"$sum": 1}}},
+                    {"$sort": {"evidence_count": -1}},
+                    {"$limit": top_n},
+                    {
+                        "$lookup": {
+                            "from": "skills",
+                            "localField": "_id",
+                            "foreignField": "_id",
+                            "as": "skill",
+                        }
+                    },
                 ],
-                "as": "skill",
+                "total": [{"$count": "n"}],
             }
         },
     ]
+    rows = await db["evidence"].aggregate(pipeline).to_list(length=1)
+    return rows[0] if rows else {"top_skills": [], "total": []}
+
+def _facet_count(rows: list[dict]) -> int:
+    return int(rows[0]["n"]) if rows else 0
+
+# UC 1.4 – Dashboard Summary (Skill coverage + evidence + recent projects)
+@router.get("/summary")
+async def dashboard_summary(response: Response, user_id: str = Query(..., min_length=1), top_n: int = Query(default=10, ge=1, le=50)):
+    # cached summaries carry no timings_ms: those describe the reads of the request that computed them
+    cached = get_cached_summary(user_id, top_n)
+    if cached is not None:
+        response.headers["X-Cache"] = "hit"
+        return cached
+
+    db = get_db()
+    generation = dashboard_generation(user_id)
+
+    # independent collections are read concurrently; latency is bounded by the slowest
+    timings: dict[str, float] = {}
+    t0 = time.perf_counter()
+    projects, project_count, evidence_stats, confirmed_count = await asyncio.gather(
+        _timed(timings, "projects", _recent_projects(db, user_id)),
+        _timed(timings, "project_count", db["projects"].count_documents({"user_id": user_id})),
+        _timed(timings, "evidence", _evidence_stats(db, user_id, top_n)),
+        _timed(timings, "confirmations", db["resume_skill_confirmations"].count_documents({"user_id": user_id})),
+    )
+    timings["total"] = round((time.perf_counter() - t0) * 1000, 2)
+
+    proj_out = [{"id": oid_str(p["_id"]), "title": p.get("title",""), "created_at": p.get("created_at")} for p in projects]
 
-    # Mongo $toObjectId needs MongoDB 4.0+; if your cluster doesn't support it, keep the basic counts.
-    # We'll try the pipeline and fall back to a less strict join if it errors.
     top_skills = []
-    try:
-        rows = await db["evidence"].aggregate(pipeline).to_list(length=top_n)
-        for r in rows:
-            skill_doc = (r.get("skill") or [{}])[0]
-            top_skills.append({
-                "skill_id": r["_id"],
-                "skill_name": skill_doc.get("name", ""),
-                "category": skill_doc.get("category", ""),
-                "evidence_count": int(r.get("evidence_count", 0)),
-            })
-    except Exception:
-        # fallback: just counts
-        rows = await (
-            db["evidence"]
-            .aggregate([
-                {"$match": {"user_id": user_id}},
-                {"$unwind": {"path": "$skill_ids", "preserveNullAndEmptyArrays": False}},
-                {"$group": {"_id": "$skill_ids", "evidence_count": {"$sum": 1}}},
-                {"$sort": {"evidence_count": -1}},
-                {"$limit": top_n},
-            ])
-            .to_list(length=top_n)
-        )
-        top_skills = [{"skill_id": r["_id"], "evidence_count": int(r.get("evidence_count", 0))} for r in rows]
+    for r in evidence_stats["top_skills"]:
+        skill_doc = (r.get("skill") or [{}])[0]
+        top_skills.append({
+            "skill_id": oid_str(r["_id"]),
+            "skill_name": skill_doc.get("name", ""),
+            "category": skill_doc.get("category", ""),
+            "evidence_count": int(r.get("evidence_count", 0)),
+        })
 
     totals = {
-        "projects": await db["projects"].count_documents({"user_id": user_id}),
-        "evidence": await db["evidence"].count_documents({"user_id": user_id}),
-        "confirmed_skills": await db["resume_skill_confirmations"].count_documents({"user_id": user_id}),
+        "projects": project_count,
+        "evidence": _facet_count(evidence_stats["total"]),
+        "confirmed_skills": confirmed_count,
     }
 
-    return {"user_id": user_id, "totals": totals, "recent_projects": proj_out, "top_skills_by_evidence": top_skills}
+    summary = {"user_id": user_id, "totals": totals, "recent_projects": proj_out, "top_skills_by_evidence": top_skills}
+    # a write for this user landed while we were reading: serve the result, don't cache it
+    cache_summary(user_id, top_n, summary, generation)
+
+    response.headers["X-Cache"] = "miss"
+    response.headers["Server-Timing"] = ", ".join(f"{k};dur={v}" for k, v in timings.items())
+    return {**summary, "timings_ms": timings}
+
+@router.get("/cache/stats")
+async def dashboard_cache_statistics():
+    return dashboard_cache_stats()
@@ -4,8 +4,10 @@ from fastapi import APIRouter, Query, HTTPException
 from datetime import datetime, timezone
 from bson import ObjectId
 from app.core.db import get_db
+from app.core.dashboard_cache import invalidate_dashboard
+from app.core.evidence_counts import record_evidence_counts
 from app.models.evidence import EvidenceIn, EvidenceOut
-from app.utils.mongo import oid_str
+from app.utils.mongo import oid_str, to_object_ids
 
 router = APIRouter()
 
@@ -26,7 +28,10 @@ async def list_evidence(
     if user_id:
         q["user_id"] = user_id
     if skill_id:
-        q["skill_ids"] = skill_id
+        try:
+            q["skill_ids"] = ObjectId(skill_id)
+        except Exception:
+            raise HTTPException(status_code=400, detail="Invalid skill_id")
     if project_id:
         q["project_id"] = project_id
 
@@ -59,7 +64,7 @@ async def list_evidence(
                 "title": d["title"],
                 "source": d["source"],
                 "text_excerpt": d["text_excerpt"],
-                "skill_ids": d.get("skill_ids", []),
+                "skill_ids": [oid_str(s) for s in d.get("skill_ids", [])],
                 "project_id": d.get("project_id"),
                 "tags": d.get("tags", []),
                 "created_at": d.get("created_at"),
@@ -86,17 +91,16 @@ async def create_evidence(payload: EvidenceIn):
             raise HTTPException(status_code=404, detail="Project not found")
 
     for sid in payload.skill_ids:
-        try:
-            soid = ObjectId(sid)
-        except Exception:
-            raise HTTPException(status_code=400, detail=f"Invalid skill_id: {sid}")
-        if not await db["skills"].find_one({"_id": soid}):
+        if not await db["skills"].find_one({"_id": ObjectId(sid)}):
             raise HTTPException(status_code=404, detail=f"Skill not found: {sid}")
 
     doc = payload.model_dump()
+    doc["skill_ids"] = to_object_ids(payload.skill_ids)
     now = now_utc()
     doc["created_at"] = now
     doc["updated_at"] = now
 
     res = await db["evidence"].insert_one(doc)
-    return {"id": oid_str(res.inserted_id), **doc}
+    await record_evidence_counts(db, [doc])
+    invalidate_dashboard(payload.user_id)
+    return {"id": oid_str(res.inserted_id), **doc, "skill_ids": [oid_str(s) for s in doc["skill_ids"]]}
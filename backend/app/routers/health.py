@@ -1,5 +1,7 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 from app.core.db import get_db
+from app.core.extraction_cache import extraction_cache_stats
+from app.core.pdf_pool import pdf_pool_stats
 
 router = APIRouter()
 
@@ -20,5 +22,23 @@ async def db_counts():
         "jobs": await db["jobs"].count_documents({}),
     }
 
+@router.get("/indexes")
+async def index_status(request: Request):
+    # startup applies app/core/indexes.py: unique indexes before serving, the rest in the background
+    unique = getattr(request.app.state, "unique_indexes", None)
+    task = getattr(request.app.state, "index_task", None)
+    if task is None:
+        return {"status": "not_started", "unique": unique}
+    if not task.done():
+        return {"status": "building", "unique": unique}
+    return {"status": "done", "unique": unique, "collections": task.result()}
 
+@router.get("/pdf_pool")
+async def pdf_pool_status():
+    # queued = uploads waiting for a parse slot
+    return pdf_pool_stats()
 
+@router.get("/extraction_cache")
+async def extraction_cache_status():
+    # per-process; resets whenever the skill catalog version changes
+    return extraction_cache_stats()
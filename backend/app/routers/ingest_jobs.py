@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+from bson import ObjectId
+from fastapi import APIRouter, File, Form, HTTPException, Query, Request, UploadFile
+from fastapi.responses import StreamingResponse
+
+from app.core.config import settings
+from app.core.db import get_db
+from app.core.file_store import UploadTooLarge, read_upload, store_file
+from app.core.ingest_worker import QUEUE, enqueue
+from app.models.ingest import IngestJobOut
+from app.models.resume import ResumeSnapshotIn
+from app.utils.mongo import oid_str
+
+router = APIRouter()
+
+# Asynchronous counterpart of /ingest/resume: each POST stores its input, queues an
+# ingest job and returns at once (202). Clients poll GET /{job_id} or follow
+# GET /{job_id}/events (server-sent events) until the job is done or failed.
+
+TERMINAL = {"done", "failed"}
+
+
+def _job_out(d: dict) -> dict:
+    return {
+        "id": oid_str(d["_id"]),
+        "user_id": d["user_id"],
+        "kind": d["kind"],
+        "status": d["status"],
+        "stage": d.get("stage"),
+        "attempts": d.get("attempts", 0),
+        "error": d.get("error"),
+        "result": d.get("result"),
+        "created_at": d["created_at"],
+        "updated_at": d.get("updated_at"),
+    }
+
+
+async def _get_job(db, job_id: str) -> dict:
+    try:
+        oid = ObjectId(job_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid job_id")
+    d = await db[QUEUE].find_one({"_id": oid}, {"payload": 0})
+    if not d:
+        raise HTTPException(status_code=404, detail="Ingest job not found")
+    return d
+
+
+@router.post("/resume/pdf", response_model=IngestJobOut, status_code=202)
+async def enqueue_resume_pdf(user_id: str = Form(...), file: UploadFile = File(...)):
+    db = get_db()
+    if not file.filename.lower().endswith(".pdf"):
+        raise HTTPException(status_code=400, detail="Only PDF files are supported.")
+    try:
+        b, sha256 = await read_upload(file, settings.resume_upload_max_bytes)
+    except UploadTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    if not b:
+        raise HTTPException(status_code=400, detail="Empty file.")
+
+    # the worker reads the original back from GridFS, so the job doc stays small
+    file_id = await store_file(db, b, sha256, file.filename, file.content_type)
+    payload = {"file_id": file_id, "filename": file.filename, "sha256": sha256, "size": len(b)}
+    return _job_out(await enqueue(db, "resume_pdf", user_id, payload))
+
+
+@router.post("/resume/text", response_model=IngestJobOut, status_code=202)
+async def enqueue_resume_text(payload: ResumeSnapshotIn):
+    db = get_db()
+    if len(payload.text.strip()) < 10:
+        raise HTTPException(status_code=400, detail="Resume text too short.")
+    return _job_out(await enqueue(db, "resume_text", payload.user_id, {"text": payload.text}))
+
+
+@router.get("/", response_model=list[IngestJobOut])
+async def list_ingest_jobs(user_id: str = Query(...), limit: int = Query(default=50, ge=1, le=200)):
+    db = get_db()
+    cursor = db[QUEUE].find({"user_id": user_id}, {"payload": 0}).sort("created_at", -1).limit(limit)
+    return [_job_out(d) async for d in cursor]
+
+
+@router.get("/{job_id}", response_model=IngestJobOut)
+async def get_ingest_job(job_id: str):
+    return _job_out(await _get_job(get_db(), job_id))
+
+
+@router.get("/{job_id}/events")
+async def ingest_job_events(job_id: str, request: Request):
+    db = get_db()
+    first = await _get_job(db, job_id)
+
+    async def stream():
+        d, last = first, None
+        while True:
+            out = _job_out(d)
+            state = (out["status"], out["stage"], out["attempts"])
+            if state != last:
+                last = state
+                yield f"event: {out['status']}\ndata: {json.dumps(out, default=str)}\n\n"
+            else:
+                yield ": keep-alive\n\n"
+            if out["status"] in TERMINAL or await request.is_disconnected():
+                return
+            await asyncio.sleep(0.5)
+            d = await db[QUEUE].find_one({"_id": d["_id"]}, {"payload": 0})
+            if d is None:
+                return
+
+    return StreamingResponse(stream(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
@@ -1,10 +1,35 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Query, HTTPException
+import asyncio
+import base64
+import hashlib
+import json
+
+from fastapi import APIRouter, BackgroundTasks, Query, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 from datetime import datetime, timezone
+from typing import Literal
 from bson import ObjectId
+from pydantic import ValidationError
+from pymongo.errors import BulkWriteError
 from app.core.db import get_db
-from app.models.job import JobIn, JobOut, JobModerationIn, JobRoleTagIn
+from app.core.config import settings
+from app.core.extraction_pool import analyze_jobs
+from app.core.role_weights import refresh_role_weights
+from app.core.skill_catalog import SkillCatalog, get_skill_catalog
+from app.models.job import (
+    JobIn,
+    JobOut,
+    JobModerationIn,
+    JobRoleTagIn,
+    JobBulkImportOut,
+    JobBatchModerationIn,
+    JobBatchModerationOut,
+    ModerationStatus,
+    DEFAULT_MODERATION_STATUS,
+    moderation_status_query,
+)
+from app.utils.minhash import lsh_bands, signature, similarity
 from app.utils.mongo import oid_str
 
 router = APIRouter()
@@ -12,72 +37,149 @@ router = APIRouter()
 def now_utc():
     return datetime.now(timezone.utc)
 
+JOB_FIELDS = {
+    "title": 1,
+    "company": 1,
+    "location": 1,
+    "source": 1,
+    "description_excerpt": 1,
+    "required_skills": 1,
+    "required_skill_ids": 1,
+    "role_ids": 1,
+    "moderation_status": 1,
+    "moderation_reason": 1,
+    "submitted_by_user_id": 1,
+    "duplicate_of": 1,
+    "duplicate_score": 1,
+    "created_at": 1,
+    "updated_at": 1,
+}
+
+def _job_out(d: dict) -> dict:
+    return {
+        "id": oid_str(d["_id"]),
+        "title": d.get("title", ""),
+        "company": d.get("company", ""),
+        "location": d.get("location", ""),
+        "source": d.get("source", ""),
+        "description_excerpt": d.get("description_excerpt", ""),
+        "required_skills": d.get("required_skills", []),
+        "required_skill_ids": d.get("required_skill_ids", []),
+        "role_ids": d.get("role_ids", []),
+        "moderation_status": d.get("moderation_status") or DEFAULT_MODERATION_STATUS,
+        "moderation_reason": d.get("moderation_reason"),
+        "submitted_by_user_id": d.get("submitted_by_user_id"),
+        "duplicate_of": oid_str(d["duplicate_of"]) if d.get("duplicate_of") else None,
+        "duplicate_score": d.get("duplicate_score"),
+        "created_at": d.get("created_at"),
+        "updated_at": d.get("updated_at"),
+    }
+
+# Keyset pagination over (created_at desc, _id desc). The continuation token is the
+# last returned key, base64-encoded; it stays valid while new jobs are inserted.
+
+def _encode_cursor(d: dict) -> str:
+    created_at = d.get("created_at")
+    key = {"t": created_at.isoformat() if created_at else None, "i": oid_str(d["_id"])}
+    return base64.urlsafe_b64encode(json.dumps(key).encode("utf-8")).decode("ascii")
+
+def _after_cursor(token: str) -> dict:
+    try:
+        key = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+        last_id = ObjectId(key["i"])
+        last_t = datetime.fromisoformat(key["t"]) if key["t"] else None
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if last_t is None:
+        # jobs without created_at sort after every dated job
+        return {"created_at": None, "_id": {"$lt": last_id}}
+    return {
+        "$or": [
+            {"created_at": {"$lt": last_t}},
+            {"created_at": last_t, "_id": {"$lt": last_id}},
+            {"created_at": None},
+        ]
+    }
+
 @router.get("/", response_model=list[JobOut])
 async def list_jobs(
+    response: Response,
     status: str | None = Query(default=None, description="pending|approved|rejected"),
     role_id: str | None = Query(default=None),
+    cursor: str | None = Query(default=None, description="X-Next-Cursor from the previous page"),
+    limit: int | None = Query(default=None, ge=1, le=1000, description="page size (json: default 500; ndjson: unlimited)"),
+    format: Literal["json", "ndjson"] = Query(default="json"),
 ):
     db = get_db()
     q: dict = {}
     if status:
-        q["moderation_status"] = status
+        q["moderation_status"] = moderation_status_query(status)
     if role_id:
         q["role_ids"] = role_id
+    if cursor:
+        q = {"$and": [q, _after_cursor(cursor)]} if q else _after_cursor(cursor)
+
+    docs = db["jobs"].find(q, JOB_FIELDS).sort([("created_at", -1), ("_id", -1)])
 
+    if format == "ndjson":
+        # stream documents as the cursor yields them; memory stays flat for any queue size
+        if limit:
+            docs = docs.limit(limit)
+
+        async def lines():
+            async for d in docs.batch_size(500):
+                yield JobOut.model_validate(_job_out(d)).model_dump_json() + "\n"
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    page_size = limit or 500
+    page = await docs.limit(page_size + 1).to_list(length=page_size + 1)
+    if len(page) > page_size:
+        page = page[:page_size]
+        response.headers["X-Next-Cursor"] = _encode_cursor(page[-1])
+    return [_job_out(d) for d in page]
+
+# Near-duplicate detection: every posting stores a MinHash signature of its
+# description_excerpt and the LSH band keys (multikey index); a submission is
+# compared only against live (approved or pending) postings sharing a band, so a
+# rejected posting never makes a later one a duplicate.
+
+MAX_DUPLICATE_CANDIDATES = 200
+
+async def _minhash_fields(description: str) -> dict:
+    sig = await asyncio.to_thread(signature, description)
+    return {"minhash": sig, "lsh_bands": lsh_bands(sig)}
+
+async def _find_near_duplicate(db, fields: dict) -> tuple[ObjectId, float] | None:
+    if not fields["lsh_bands"]:
+        return None
     cursor = db["jobs"].find(
-        q,
-        {
-            "title": 1,
-            "company": 1,
-            "location": 1,
-            "source": 1,
-            "description_excerpt": 1,
-            "required_skills": 1,
-            "required_skill_ids": 1,
-            "role_ids": 1,
-            "moderation_status": 1,
-            "moderation_reason": 1,
-            "submitted_by_user_id": 1,
-            "created_at": 1,
-            "updated_at": 1,
-        },
-    ).sort("created_at", -1)
-
-    docs = await cursor.to_list(length=500)
-    out = []
-    for d in docs:
-        out.append(
-            {
-                "id": oid_str(d["_id"]),
-                "title": d.get("title", ""),
-                "company": d.get("company", ""),
-                "location": d.get("location", ""),
-                "source": d.get("source", ""),
-                "description_excerpt": d.get("description_excerpt", ""),
-                "required_skills": d.get("required_skills", []),
-                "required_skill_ids": d.get("required_skill_ids", []),
-                "role_ids": d.get("role_ids", []),
-                "moderation_status": d.get("moderation_status", "approved"),
-                "moderation_reason": d.get("moderation_reason"),
-                "submitted_by_user_id": d.get("submitted_by_user_id"),
-                "created_at": d.get("created_at"),
-                "updated_at": d.get("updated_at"),
-            }
-        )
-    return out
+        {"lsh_bands": {"$in": fields["lsh_bands"]}, "moderation_status": moderation_status_query("approved", "pending")},
+        {"minhash": 1},
+    ).limit(MAX_DUPLICATE_CANDIDATES)
+    best = None
+    async for c in cursor:
+        score = similarity(fields["minhash"], c.get("minhash") or [])
+        if score >= settings.job_duplicate_threshold and (best is None or score > best[1]):
+            best = (c["_id"], score)
+    return best
 
-# Community submission (defaults to pending)
+# Community submission (defaults to pending); reposts are flagged with duplicate_of
 @router.post("/submit", response_model=JobOut)
 async def submit_job(payload: JobIn):
     db = get_db()
     now = now_utc()
     doc = payload.model_dump()
+    doc.update(await _minhash_fields(doc["description_excerpt"]))
+    dup = await _find_near_duplicate(db, doc)
+    doc["duplicate_of"] = dup[0] if dup else None
+    doc["duplicate_score"] = dup[1] if dup else None
     doc["moderation_status"] = "pending"
     doc["moderation_reason"] = None
     doc["created_at"] = now
     doc["updated_at"] = now
     res = await db["jobs"].insert_one(doc)
-    return {"id": oid_str(res.inserted_id), **doc}
+    return _job_out({**doc, "_id": res.inserted_id})
 
 # Direct create (admin/system) defaults to approved (keeps your original POST /jobs behavior but safer)
 @router.post("/", response_model=JobOut)
@@ -85,12 +187,226 @@ async def create_job(payload: JobIn):
     db = get_db()
     now = now_utc()
     doc = payload.model_dump()
+    doc.update(await _minhash_fields(doc["description_excerpt"]))
     doc["moderation_status"] = "approved"
     doc["moderation_reason"] = None
     doc["created_at"] = now
     doc["updated_at"] = now
     res = await db["jobs"].insert_one(doc)
-    return {"id": oid_str(res.inserted_id), **doc}
+    return _job_out({**doc, "_id": res.inserted_id})
+
+# Bulk import: NDJSON in the shape of data/processed/sample_jobs.jsonl (one posting per line).
+# `description` is cut down to description_excerpt; free-text required_skills are resolved to
+# catalog ids, and postings without any are tagged from their description in the extraction pool.
+# Re-importing the same file is a no-op: each posting carries a unique import_hash.
+# A line longer than MAX_LINE_BYTES is reported as failed without being buffered.
+
+DESCRIPTION_EXCERPT_CHARS = 1000
+MAX_REPORTED_ERRORS = 100
+MAX_LINE_BYTES = 1024 * 1024
+
+def _import_hash(raw: dict) -> str:
+    parts = [str(raw.get(k) or "") for k in ("title", "company", "location", "description", "description_excerpt")]
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+def _bulk_doc(raw: dict, catalog: SkillCatalog, status: str, now: datetime) -> tuple[dict, str | None]:
+    """Validated job doc plus the text to derive skills from (None when the posting lists its own)."""
+    description = str(raw.get("description") or raw.get("description_excerpt") or "")
+    payload = JobIn.model_validate(
+        {**raw, "description_excerpt": (raw.get("description_excerpt") or description)[:DESCRIPTION_EXCERPT_CHARS]}
+    )
+    doc = payload.model_dump()
+
+    matcher = catalog.matcher
+    ids = list(doc["required_skill_ids"])
+    for name in doc["required_skills"]:
+        idx = matcher.lookup(name)
+        if idx is not None and matcher.skill_ids[idx] not in ids:
+            ids.append(matcher.skill_ids[idx])
+    doc["required_skill_ids"] = ids
+
+    if isinstance(raw.get("metadata"), dict):
+        doc["metadata"] = raw["metadata"]
+    doc["moderation_status"] = status
+    doc["moderation_reason"] = None
+    doc["import_hash"] = _import_hash(raw)
+    doc["created_at"] = now
+    doc["updated_at"] = now
+    return doc, (description if not doc["required_skills"] and not ids else None)
+
+async def _analyze_batch(catalog: SkillCatalog, batch: list[tuple[int, dict, str | None]]):
+    # skill tagging and MinHash signatures run in the extraction pool; imports are not
+    # checked against each other for near-duplicates, but later submissions are checked against them
+    matcher = catalog.matcher
+    analyzed = await analyze_jobs(catalog, [(text, doc["description_excerpt"]) for _, doc, text in batch])
+    for (_, doc, _), (found, sig) in zip(batch, analyzed):
+        doc["minhash"] = sig
+        doc["lsh_bands"] = lsh_bands(sig)
+        if found is not None:
+            ranked = sorted(found, key=lambda idx: (-found[idx][0], matcher.skill_names[idx].lower()))
+            doc["required_skill_ids"] = [matcher.skill_ids[idx] for idx in ranked]
+            doc["required_skills"] = [matcher.skill_names[idx] for idx in ranked]
+
+async def _insert_batch(db, batch: list[tuple[int, dict, str | None]], out: dict):
+    try:
+        res = await db["jobs"].insert_many([doc for _, doc, _ in batch], ordered=False)
+        out["inserted"] += len(res.inserted_ids)
+    except BulkWriteError as e:
+        out["inserted"] += e.details.get("nInserted", 0)
+        for err in e.details.get("writeErrors", []):
+            if err.get("code") == 11000:
+                out["skipped"] += 1
+            else:
+                _record_failure(out, batch[err["index"]][0], err.get("errmsg", "write error"))
+
+def _record_failure(out: dict, line: int, error: str):
+    out["failed"] += 1
+    if len(out["errors"]) < MAX_REPORTED_ERRORS:
+        out["errors"].append({"line": line, "error": error})
+
+async def _ndjson_lines(request: Request):
+    # the body is consumed as it arrives; only the current line is buffered, and once it
+    # outgrows MAX_LINE_BYTES the rest of it is dropped as it streams in. Such a line is
+    # yielded as None so line numbers stay right.
+    buf = b""
+    oversized = False
+    async for chunk in request.stream():
+        buf += chunk
+        *lines, buf = buf.split(b"\n")
+        for line in lines:
+            yield None if oversized or len(line) > MAX_LINE_BYTES else line
+            oversized = False
+        if len(buf) > MAX_LINE_BYTES:
+            oversized, buf = True, b""
+    if buf or oversized:
+        yield None if oversized else buf
+
+@router.post("/bulk", response_model=JobBulkImportOut)
+async def bulk_import_jobs(
+    request: Request,
+    moderation_status: ModerationStatus = Query(default="approved"),
+    batch_size: int = Query(default=1000, ge=1, le=5000),
+):
+    db = get_db()
+    catalog = await get_skill_catalog(db)
+    now = now_utc()
+    out = {"inserted": 0, "skipped": 0, "failed": 0, "errors": []}
+
+    batch: list[tuple[int, dict, str | None]] = []
+    line_no = 0
+    async for line in _ndjson_lines(request):
+        line_no += 1
+        if line is None:
+            _record_failure(out, line_no, f"line exceeds {MAX_LINE_BYTES} bytes")
+            continue
+        if not line.strip():
+            continue
+        try:
+            raw = json.loads(line)
+        except ValueError as e:
+            _record_failure(out, line_no, f"invalid JSON: {e}")
+            continue
+        if not isinstance(raw, dict):
+            _record_failure(out, line_no, f"expected a JSON object, got {type(raw).__name__}")
+            continue
+        try:
+            doc, text = _bulk_doc(raw, catalog, moderation_status, now)
+        except ValidationError as e:
+            _record_failure(out, line_no, "; ".join(f"{'.'.join(map(str, er['loc']))}: {er['msg']}" for er in e.errors()))
+            continue
+
+        batch.append((line_no, doc, text))
+        if len(batch) >= batch_size:
+            await _analyze_batch(catalog, batch)
+            await _insert_batch(db, batch, out)
+            batch = []
+
+    if batch:
+        await _analyze_batch(catalog, batch)
+        await _insert_batch(db, batch, out)
+    return out
+
+# UC 4.1 – Batch moderation: a list of ids, or every job matching a filter (up to `limit`).
+# One update_many for the whole batch; role weights are refreshed afterwards, in the
+# background and once per role whose set of approved jobs changed.
+@router.post("/moderate", response_model=JobBatchModerationOut)
+async def moderate_jobs(payload: JobBatchModerationIn, background_tasks: BackgroundTasks):
+    db = get_db()
+    if (payload.job_ids is None) == (payload.filter is None):
+        raise HTTPException(status_code=400, detail="Provide exactly one of job_ids or filter")
+
+    results: dict[str, str] = {}
+    if payload.job_ids is not None:
+        order = list(dict.fromkeys(payload.job_ids))
+        oids = {}
+        for job_id in order:
+            try:
+                oids[job_id] = ObjectId(job_id)
+            except Exception:
+                results[job_id] = "invalid_id"
+        q = {"_id": {"$in": list(oids.values())}}
+        docs = await db["jobs"].find(q, {"role_ids": 1, "moderation_status": 1}).to_list(length=None)
+    else:
+        f = payload.filter
+        q = {}
+        if f.moderation_status:
+            q["moderation_status"] = moderation_status_query(f.moderation_status)
+        if f.role_id:
+            q["role_ids"] = f.role_id
+        if f.source:
+            q["source"] = f.source
+        if f.submitted_by_user_id:
+            q["submitted_by_user_id"] = f.submitted_by_user_id
+        docs = await (
+            db["jobs"].find(q, {"role_ids": 1, "moderation_status": 1})
+            .sort([("created_at", -1), ("_id", -1)])
+            .limit(payload.limit)
+            .to_list(length=payload.limit)
+        )
+        oids = {oid_str(d["_id"]): d["_id"] for d in docs}
+        order = list(oids)
+
+    found = {d["_id"] for d in docs}
+    updated = 0
+    if docs:
+        # pin the update to the ids read above so concurrent inserts don't slip into the batch
+        res = await db["jobs"].update_many(
+            {"_id": {"$in": [d["_id"] for d in docs]}},
+            {
+                "$set": {
+                    "moderation_status": payload.moderation_status,
+                    "moderation_reason": payload.moderation_reason,
+                    "updated_at": now_utc(),
+                }
+            },
+        )
+        updated = res.modified_count
+
+    # weights count approved jobs only: a role changes when a job enters or leaves "approved"
+    flipped = [
+        d for d in docs
+        if ((d.get("moderation_status") or DEFAULT_MODERATION_STATUS) == "approved") != (payload.moderation_status == "approved")
+    ]
+    roles = {r for d in flipped for r in d.get("role_ids") or []}
+    if flipped:
+        # approved duplicates count only while their original is not approved
+        dups = db["jobs"].find(
+            {"duplicate_of": {"$in": [d["_id"] for d in flipped]}, "moderation_status": moderation_status_query("approved")},
+            {"role_ids": 1},
+        )
+        roles.update(r async for d in dups for r in d.get("role_ids") or [])
+    if roles:
+        background_tasks.add_task(refresh_role_weights, db, roles)
+
+    return {
+        "moderation_status": payload.moderation_status,
+        "updated": updated,
+        "results": [
+            {"id": job_id, "status": results.get(job_id) or ("updated" if oids[job_id] in found else "not_found")}
+            for job_id in order
+        ],
+        "roles_refreshing": sorted(roles),
+    }
 
 # UC 4.1 – Moderate job postings (approve/reject)
 @router.patch("/{job_id}/moderate", response_model=JobOut)
@@ -111,22 +427,7 @@ async def moderate_job(job_id: str, payload: JobModerationIn):
         raise HTTPException(status_code=404, detail="Job not found")
 
     d = await db["jobs"].find_one({"_id": oid})
-    return {
-        "id": oid_str(d["_id"]),
-        "title": d.get("title", ""),
-        "company": d.get("company", ""),
-        "location": d.get("location", ""),
-        "source": d.get("source", ""),
-        "description_excerpt": d.get("description_excerpt", ""),
-        "required_skills": d.get("required_skills", []),
-        "required_skill_ids": d.get("required_skill_ids", []),
-        "role_ids": d.get("role_ids", []),
-        "moderation_status": d.get("moderation_status", "pending"),
-        "moderation_reason": d.get("moderation_reason"),
-        "submitted_by_user_id": d.get("submitted_by_user_id"),
-        "created_at": d.get("created_at"),
-        "updated_at": d.get("updated_at"),
-    }
+    return _job_out(d)
 
 # UC 4.2 – Tag a posting by role (role_id)
 @router.post("/{job_id}/roles", response_model=JobOut)
@@ -148,19 +449,4 @@ async def add_role_tag(job_id: str, payload: JobRoleTagIn):
     d = await db["jobs"].find_one({"_id": oid})
     if not d:
         raise HTTPException(status_code=404, detail="Job not found")
-    return {
-        "id": oid_str(d["_id"]),
-        "title": d.get("title", ""),
-        "company": d.get("company", ""),
-        "location": d.get("location", ""),
-        "source": d.get("source", ""),
-        "description_excerpt": d.get("description_excerpt", ""),
-        "required_skills": d.get("required_skills", []),
-        "required_skill_ids": d.get("required_skill_ids", []),
-        "role_ids": d.get("role_ids", []),
-        "moderation_status": d.get("moderation_status", "pending"),
-        "moderation_reason": d.get("moderation_reason"),
-        "submitted_by_user_id": d.get("submitted_by_user_id"),
-        "created_at": d.get("created_at"),
-        "updated_at": d.get("updated_at"),
-    }
+    return _job_out(d)
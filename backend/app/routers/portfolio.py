@@ -35,7 +35,7 @@ async def list_portfolio_items(
     if visibility:
         q["visibility"] = visibility
 
-    cursor = db["portfolio_items"].find(q).sort("priority", -1).sort("updated_at", -1)
+    cursor = db["portfolio_items"].find(q).sort([("priority", -1), ("updated_at", -1)])
     docs = await cursor.to_list(length=500)
     out = []
     for d in docs:
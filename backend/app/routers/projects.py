@@ -4,6 +4,7 @@ from fastapi import APIRouter, Query, HTTPException
 from datetime import datetime, timezone
 from bson import ObjectId
 from app.core.db import get_db
+from app.core.dashboard_cache import invalidate_dashboard
 from app.utils.mongo import oid_str
 from app.models.project import (
     ProjectIn,
@@ -49,6 +50,7 @@ async def create_project(payload: ProjectIn):
     doc["created_at"] = now
     doc["updated_at"] = now
     res = await db["projects"].insert_one(doc)
+    invalidate_dashboard(payload.user_id)
     return {"id": oid_str(res.inserted_id), **doc}
 
 @router.get("/{project_id}", response_model=ProjectOut)
@@ -81,10 +83,7 @@ async def link_skill_to_project(project_id: str, payload: ProjectSkillLinkIn):
         project_oid = ObjectId(project_id)
     except Exception:
         raise HTTPException(status_code=400, detail="Invalid project_id")
-    try:
-        skill_oid = ObjectId(payload.skill_id)
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid skill_id")
+    skill_oid = ObjectId(payload.skill_id)
 
     if not await db["projects"].find_one({"_id": project_oid}):
         raise HTTPException(status_code=404, detail="Project not found")
@@ -3,27 +3,26 @@ from __future__ import annotations
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException
 from datetime import datetime, timezone
 from bson import ObjectId
+from pymongo import ReturnDocument, UpdateOne
+from app.core.config import settings
 from app.core.db import get_db
+from app.core.dashboard_cache import invalidate_dashboard
+from app.core.evidence_counts import record_evidence_counts
+from app.core.file_store import UploadTooLarge, read_upload, store_file
+from app.core.pdf_pool import parse_pdf
+from app.core.resume_ingest import find_duplicate_snapshot, insert_snapshot, snapshot_doc
 from app.models.resume import ResumeSnapshotIn, ResumeSnapshotOut
-from app.utils.mongo import oid_str
-from pypdf import PdfReader
-import io
+from app.utils.mongo import oid_str, to_object_id
+from app.utils.text import text_sha256
 
 router = APIRouter()
 
 def now_utc():
     return datetime.now(timezone.utc)
 
-def extract_pdf_text(file_bytes: bytes) -> str:
-    try:
-        reader = PdfReader(io.BytesIO(file_bytes))
-        parts = []
-        for page in reader.pages:
-            t = page.extract_text() or ""
-            parts.append(t)
-        return "\n".join(parts).strip()
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Failed to parse PDF: {e}")
+def _snapshot_out(snapshot_id, raw_text: str, deduplicated: bool = False) -> dict:
+    preview = raw_text[:200] + ("..." if len(raw_text) > 200 else "")
+    return {"snapshot_id": str(snapshot_id), "preview": preview, "deduplicated": deduplicated}
 
 # UC 3.1 – Resume Ingestion (already implemented)
 @router.post("/text", response_model=ResumeSnapshotOut)
@@ -33,41 +32,48 @@ async def ingest_resume_text(payload: ResumeSnapshotIn):
     if len(raw_text) < 10:
         raise HTTPException(status_code=400, detail="Resume text too short.")
 
-    doc = {
-        "user_id": payload.user_id,
-        "source_type": "paste",
-        "raw_text": raw_text,
-        "metadata": {"source": "paste"},
-        "image_ref": "/images/resume_icon.png",
-        "created_at": now_utc(),
-    }
-    res = await db["resume_snapshots"].insert_one(doc)
-    preview = raw_text[:200] + ("..." if len(raw_text) > 200 else "")
-    return {"snapshot_id": str(res.inserted_id), "preview": preview}
+    content_hash = text_sha256(raw_text)
+    existing = await find_duplicate_snapshot(db, payload.user_id, content_hash)
+    if existing:
+        return _snapshot_out(existing["_id"], existing.get("raw_text", ""), deduplicated=True)
+
+    doc = snapshot_doc(payload.user_id, "paste", raw_text, {"source": "paste"}, content_hash)
+    snap, deduplicated = await insert_snapshot(db, doc)
+    return _snapshot_out(snap["_id"], snap.get("raw_text", ""), deduplicated)
 
 @router.post("/pdf", response_model=ResumeSnapshotOut)
 async def ingest_resume_pdf(user_id: str = Form(...), file: UploadFile = File(...)):
     db = get_db()
     if not file.filename.lower().endswith(".pdf"):
         raise HTTPException(status_code=400, detail="Only PDF files are supported.")
-    b = await file.read()
+    try:
+        b, sha256 = await read_upload(file, settings.resume_upload_max_bytes)
+    except UploadTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
     if not b:
         raise HTTPException(status_code=400, detail="Empty file.")
-    raw_text = extract_pdf_text(b)
+
+    # identical bytes were already ingested: skip parsing and storage entirely
+    existing = await find_duplicate_snapshot(db, user_id, sha256)
+    if existing:
+        return _snapshot_out(existing["_id"], existing.get("raw_text", ""), deduplicated=True)
+
+    try:
+        raw_text = await parse_pdf(b)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except TimeoutError:
+        raise HTTPException(status_code=504, detail="PDF parsing timed out.")
     if len(raw_text) < 50:
         raise HTTPException(status_code=400, detail="Extracted PDF text too short.")
 
-    doc = {
-        "user_id": user_id,
-        "source_type": "pdf",
-        "raw_text": raw_text,
-        "metadata": {"source": "pdf", "filename": file.filename},
-        "image_ref": "/images/resume_icon.png",
-        "created_at": now_utc(),
-    }
-    res = await db["resume_snapshots"].insert_one(doc)
-    preview = raw_text[:200] + ("..." if len(raw_text) > 200 else "")
-    return {"snapshot_id": str(res.inserted_id), "preview": preview}
+    # keep the original so the snapshot can be re-parsed later
+    file_id = await store_file(db, b, sha256, file.filename, file.content_type)
+
+    metadata = {"source": "pdf", "filename": file.filename, "file_id": file_id, "sha256": sha256, "size": len(b)}
+    doc = snapshot_doc(user_id, "pdf", raw_text, metadata, sha256)
+    snap, deduplicated = await insert_snapshot(db, doc)
+    return _snapshot_out(snap["_id"], snap.get("raw_text", ""), deduplicated)
 
 # UC 3.4 – Save confirmed resume-derived skills/projects into dashboard entities
 # Minimal implementation: converts confirmed skills into evidence records (type="resume") tied to user_id,
@@ -80,7 +86,7 @@ async def promote_confirmed_skills(snapshot_id: str, user_id: str = Form(...)):
     except Exception:
         raise HTTPException(status_code=400, detail="Invalid snapshot_id")
 
-    snap = await db["resume_snapshots"].find_one({"_id": snap_oid})
+    snap = await db["resume_snapshots"].find_one({"_id": snap_oid}, {"_id": 1})
     if not snap:
         raise HTTPException(status_code=404, detail="Resume snapshot not found")
 
@@ -94,61 +100,75 @@ async def promote_confirmed_skills(snapshot_id: str, user_id: str = Form(...)):
 
     # Create (or reuse) a resume project anchor
     proj_title = f"Resume Snapshot {snapshot_id[:8]}"
-    existing_proj = await db["projects"].find_one({"user_id": user_id, "title": proj_title})
-    if existing_proj:
-        project_oid = existing_proj["_id"]
-    else:
-        pdoc = {
-            "user_id": user_id,
-            "title": proj_title,
-            "description": "Auto-created from resume promotion.",
-            "tags": ["resume"],
-            "created_at": now_utc(),
-            "updated_at": now_utc(),
-        }
-        pres = await db["projects"].insert_one(pdoc)
-        project_oid = pres.inserted_id
-
-    # Promote each confirmed skill: link project<->skill + create evidence
-    promoted = 0
+    now = now_utc()
+    project = await db["projects"].find_one_and_update(
+        {"user_id": user_id, "title": proj_title},
+        {
+            "$setOnInsert": {
+                "user_id": user_id,
+                "title": proj_title,
+                "description": "Auto-created from resume promotion.",
+                "tags": ["resume"],
+                "created_at": now,
+                "updated_at": now,
+            }
+        },
+        upsert=True,
+        projection={"_id": 1},
+        return_document=ReturnDocument.AFTER,
+    )
+    project_oid = project["_id"]
+    project_id = oid_str(project_oid)
+    source = f"resume_snapshot:{snapshot_id}"
+
+    # one entry per skill, in confirmation order
+    names: dict[ObjectId, str] = {}
     for c in confirmed:
-        skill_oid = c.get("skill_id")
-        if not skill_oid:
-            continue
-
-        # link project-skill
-        await db["project_skill_links"].update_one(
-            {"project_id": project_oid, "skill_id": skill_oid},
-            {"$setOnInsert": {"project_id": project_oid, "skill_id": skill_oid, "created_at": now_utc()}},
-            upsert=True,
+        if c.get("skill_id"):
+            names.setdefault(to_object_id(str(c["skill_id"])), c.get("skill_name", "Resume Evidence"))
+
+    # link project<->skill for every confirmed skill in one round trip
+    if names:
+        await db["project_skill_links"].bulk_write(
+            [
+                UpdateOne(
+                    {"project_id": project_oid, "skill_id": skill_oid},
+                    {"$setOnInsert": {"project_id": project_oid, "skill_id": skill_oid, "created_at": now}},
+                    upsert=True,
+                )
+                for skill_oid in names
+            ],
+            ordered=False,
         )
 
-        # evidence record (dedupe by snapshot+skill)
-        q = {
-            "user_id": user_id,
-            "type": "resume",
-            "project_id": oid_str(project_oid),
-            "skill_ids": [oid_str(skill_oid)],
-            "source": f"resume_snapshot:{snapshot_id}",
-        }
-        exists = await db["evidence"].find_one(q)
-        if exists:
-            continue
+    # evidence records (dedupe by snapshot+skill): fetch the keys already promoted, insert the rest
+    cursor = db["evidence"].find(
+        {"user_id": user_id, "type": "resume", "project_id": project_id, "source": source},
+        {"skill_ids": 1},
+    )
+    already = {to_object_id(str(d["skill_ids"][0])) async for d in cursor if len(d.get("skill_ids") or []) == 1}
 
-        edoc = {
+    new_docs = [
+        {
             "user_id": user_id,
             "user_email": None,
             "type": "resume",
-            "title": c.get("skill_name", "Resume Evidence"),
-            "source": f"resume_snapshot:{snapshot_id}",
+            "title": name,
+            "source": source,
             "text_excerpt": "Promoted from confirmed resume skills.",
-            "skill_ids": [oid_str(skill_oid)],
-            "project_id": oid_str(project_oid),
+            "skill_ids": [skill_oid],
+            "project_id": project_id,
             "tags": ["resume", "promoted"],
-            "created_at": now_utc(),
-            "updated_at": now_utc(),
+            "created_at": now,
+            "updated_at": now,
         }
-        await db["evidence"].insert_one(edoc)
-        promoted += 1
-
+        for skill_oid, name in names.items()
+        if skill_oid not in already
+    ]
+    if new_docs:
+        await db["evidence"].insert_many(new_docs)
+        await record_evidence_counts(db, new_docs)
+    promoted = len(new_docs)
+
+    invalidate_dashboard(user_id)
     return {"snapshot_id": snapshot_id, "user_id": user_id, "promoted": promoted, "project_id": oid_str(project_oid)}
@@ -4,6 +4,7 @@ from fastapi import APIRouter, HTTPException, Query
 from datetime import datetime, timezone
 from bson import ObjectId
 from app.core.db import get_db
+from app.core.role_weights import compute_weights, recompute_role_weights
 from app.utils.mongo import oid_str
 from app.models.role import RoleIn, RoleOut
 
@@ -41,8 +42,27 @@ async def create_role(payload: RoleIn):
     res = await db["roles"].insert_one(doc)
     return {"id": oid_str(res.inserted_id), **doc}
 
-# UC 4.3 – Aggregate postings by role and compute skill weights
-# Simple heuristic: weight = (# approved jobs in role that mention skill_id) / (# approved jobs in role)
+# UC 4.3 – Aggregate postings by role and compute skill weights (app/core/role_weights.py)
+@router.post("/compute_weights")
+async def compute_all_role_weights():
+    # every role in one aggregation over approved jobs, written back with one bulk_write
+    db = get_db()
+    roles = await db["roles"].find({}, {"name": 1}).to_list(length=None)
+    docs = await compute_weights(db, roles)
+    return {
+        "roles": len(docs),
+        "computed_at": docs[0]["computed_at"] if docs else now_utc(),
+        "results": [
+            {
+                "role_id": oid_str(d["role_id"]),
+                "role_name": d["role_name"],
+                "job_count": d["job_count"],
+                "skill_count": len(d["weights"]),
+            }
+            for d in docs
+        ],
+    }
+
 @router.post("/{role_id}/compute_weights")
 async def compute_role_weights(role_id: str):
     db = get_db()
@@ -55,45 +75,8 @@ async def compute_role_weights(role_id: str):
     if not role:
         raise HTTPException(status_code=404, detail="Role not found")
 
-    # pull approved jobs tagged with this role
-    jobs = await db["jobs"].find(
-        {"moderation_status": "approved", "role_ids": role_id},
-        {"required_skill_ids": 1, "required_skills": 1},
-    ).to_list(length=2000)
-
-    total = len(jobs)
-    if total == 0:
-        weights = []
-    else:
-        counts = {}
-        for j in jobs:
-            for sid in (j.get("required_skill_ids") or []):
-                counts[sid] = counts.get(sid, 0) + 1
-        # normalize
-        weights = [{"skill_id": sid, "weight": counts[sid] / total} for sid in sorted(counts, key=lambda k: counts[k], reverse=True)]
-        # add skill name if available
-        for w in weights[:200]:
-            try:
-                soid = ObjectId(w["skill_id"])
-                s = await db["skills"].find_one({"_id": soid}, {"name": 1})
-                w["skill_name"] = (s or {}).get("name", "")
-            except Exception:
-                w["skill_name"] = ""
-
-    doc = {
-        "role_id": role_oid,
-        "role_name": role.get("name",""),
-        "computed_at": now_utc(),
-        "weights": weights,
-    }
-
-    await db["role_skill_weights"].update_one(
-        {"role_id": role_oid},
-        {"$set": doc},
-        upsert=True,
-    )
-
-    return {"role_id": role_id, "computed_at": doc["computed_at"], "weights": weights}
+    doc = await recompute_role_weights(db, role)
+    return {"role_id": role_id, "computed_at": doc["computed_at"], "weights": doc["weights"]}
 
 @router.get("/{role_id}/weights")
 async def get_role_weights(role_id: str):
@@ -1,7 +1,13 @@
 from fastapi import APIRouter, Query, HTTPException
 from app.core.db import get_db
-from app.models.skill import SkillIn, SkillOut, SkillUpdate
+from app.models.skill import SkillIn, SkillOut, SkillUpdate, SkillSuggestionOut
+from app.models.extraction import SkillExtractionBatchIn, SkillExtractionBatchOut
 from app.utils.mongo import oid_str
+from app.utils.text import text_sha256
+from app.core.skill_catalog import get_skill_catalog, invalidate_skill_catalog
+from app.core.extraction_pool import extract_many
+from app.core.extraction_cache import cache_extraction, get_cached_extraction
+from app.core.resume_ingest import extract_snapshot_skills, find_stored_extractions, store_extractions
 from bson import ObjectId
 from pymongo import ReturnDocument
 from datetime import datetime, timezone
@@ -60,11 +66,23 @@ async def list_skills(
         for d in docs
     ]
 
+# Typeahead: served from the in-memory catalog index instead of an unanchored $regex scan
+@router.get("/suggest", response_model=list[SkillSuggestionOut])
+async def suggest_skills(
+    q: str = Query(..., min_length=1, description="Prefix typed so far"),
+    category: str | None = Query(default=None),
+    limit: int = Query(default=10, ge=1, le=50),
+):
+    catalog = await get_skill_catalog(get_db())
+    return catalog.suggest_index.suggest(q, limit=limit, category=category)
+
 @router.post("/", response_model=SkillOut)
 async def create_skill(payload: SkillIn):
     db = get_db()
     doc = payload.model_dump()
+    doc["evidence_count"] = 0
     res = await db["skills"].insert_one(doc)
+    invalidate_skill_catalog()
     return {"id": oid_str(res.inserted_id), **doc}
 
 @router.delete("/{skill_id}")
@@ -79,6 +97,7 @@ async def delete_skill(skill_id: str):
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Skill not found")
 
+    invalidate_skill_catalog()
     return {"ok": True}
 
 class SkillPatch(BaseModel):
@@ -103,6 +122,7 @@ async def patch_skill(skill_id: str, payload: SkillPatch):
     )
     if not result:
         raise HTTPException(status_code=404, detail="Skill not found")
+    invalidate_skill_catalog()
     return {
         "id": oid_str(result["_id"]),
         "name": result["name"],
@@ -131,6 +151,7 @@ async def update_skill(skill_id: str, payload: SkillUpdate):
     res = await db["skills"].update_one({"_id": oid}, {"$set": updates})
     if res.matched_count == 0:
         raise HTTPException(status_code=404, detail="Skill not found")
+    invalidate_skill_catalog()
 
     doc = await db["skills"].find_one({"_id": oid})
     return {
@@ -146,16 +167,6 @@ async def update_skill(skill_id: str, payload: SkillUpdate):
 def now_utc():
     return datetime.now(timezone.utc)
 
-def make_snippet(text: str, needle: str, window: int = 80) -> str:
-    t = text.lower()
-    n = needle.lower()
-    idx = t.find(n)
-    if idx == -1:
-        return ""
-    start = max(0, idx - window)
-    end = min(len(text), idx + len(needle) + window)
-    return text[start:end].strip()
-
 @router.post("/extract/skills/{snapshot_id}")
 async def extract_skills(snapshot_id: str):
     db = get_db()
@@ -173,82 +184,118 @@ async def extract_skills(snapshot_id: str):
     if len(text) < 50:
         raise HTTPException(status_code=400, detail="Snapshot text too short")
 
-    # Pull skills (Motor async)
-    skills_cursor = db["skills"].find({}, {"name": 1, "aliases": 1}).limit(20000)
-    skills = await skills_cursor.to_list(length=20000)
-
-    found = []
-    lowered = text.lower()
-
-    for s in skills:
-        name = (s.get("name") or "").strip()
-        aliases = s.get("aliases") or []
-        candidates = [name] + aliases
-
-        best = None
-        best_conf = 0.0
-
-        for c in candidates:
-            c_norm = str(c).strip()
-            if not c_norm:
-                continue
-            if c_norm.lower() in lowered:
-                conf = 0.9 if c_norm.lower() == name.lower() else 0.75
-                if conf > best_conf:
-                    best_conf = conf
-                    best = c_norm
-
-        if best and name:
-            found.append({
-                "skill_id": oid_str(s["_id"]),
-                "skill_name": name,
-                "confidence": best_conf,
-                "evidence_snippet": make_snippet(text, best),
-            })
-
-    uniq = {item["skill_id"]: item for item in found}
-    extracted = list(uniq.values())
-
-    doc = {
-        "resume_snapshot_id": sid,
-        "skills": extracted,
-        "created_at": now_utc(),
+    # Shared catalog snapshot matched in the extraction pool; the same text against the
+    # same catalog version reuses the cached result; a snapshot is stored at most once per result
+    result = await extract_snapshot_skills(db, sid, text)
+
+    return {
+        "snapshot_id": snapshot_id,
+        "extracted": result["extracted"],
+        "created_at": result["created_at"],
+        "cached": result["cached"],
     }
-    await db["skill_extractions"].insert_one(doc)
 
-    #remove before release
-    print("snapshot_text_len:", len(text))
-    print("skills_loaded:", len(skills))
+@router.post("/extract/batch", response_model=SkillExtractionBatchOut)
+async def extract_skills_batch(payload: SkillExtractionBatchIn):
+    db = get_db()
 
+    # valid ids are keyed in canonical (lowercase hex) form so they match the fetched snapshots
+    snapshot_ids = []
+    results: dict[str, dict] = {}
+    oids: dict[str, ObjectId] = {}
+    for raw_id in payload.snapshot_ids:
+        try:
+            oid = ObjectId(raw_id)
+        except Exception:
+            snapshot_ids.append(raw_id)
+            results[raw_id] = {"snapshot_id": raw_id, "status": "invalid_id"}
+            continue
+        snapshot_ids.append(oid_str(oid))
+        oids[oid_str(oid)] = oid
+    snapshot_ids = list(dict.fromkeys(snapshot_ids))
+
+    snaps = await db["resume_snapshots"].find(
+        {"_id": {"$in": list(oids.values())}}, {"raw_text": 1}
+    ).to_list(length=None)
+    text_by_id = {oid_str(d["_id"]): (d.get("raw_text") or "") for d in snaps}
+
+    pending = []
+    for snapshot_id in oids:
+        text = text_by_id.get(snapshot_id)
+        if text is None:
+            results[snapshot_id] = {"snapshot_id": snapshot_id, "status": "not_found"}
+        elif len(text) < 50:
+            results[snapshot_id] = {"snapshot_id": snapshot_id, "status": "too_short"}
+        else:
+            pending.append(snapshot_id)
+
+    catalog = await get_skill_catalog(db)
+
+    # snapshots already stored against this catalog (by any process) are answered from their doc
+    sid_by_oid = {oids[sid]: sid for sid in pending}
+    for oid, d in (await find_stored_extractions(db, catalog, list(sid_by_oid))).items():
+        sid = sid_by_oid[oid]
+        results[sid] = {"snapshot_id": sid, "status": "cached", "extracted": d["skills"], "created_at": d["created_at"]}
+    pending = [sid for sid in pending if sid not in results]
+
+    # identical texts are extracted once; the cache answers texts seen before
+    by_text: dict[str, list[str]] = {}
+    for sid in pending:
+        by_text.setdefault(text_sha256(text_by_id[sid]), []).append(sid)
+    skills_by_text: dict[str, list] = {}
+    seen: dict[str, dict] = {}
+    misses = []
+    for h, sids in by_text.items():
+        cached = get_cached_extraction(text_by_id[sids[0]], catalog.version)
+        if cached:
+            skills_by_text[h] = cached["extracted"]
+            seen[h] = cached["snapshots"]
+        else:
+            misses.append(h)
+
+    # CPU work runs in the extraction pool, off the event loop
+    extracted = await extract_many(catalog, [text_by_id[by_text[h][0]] for h in misses])
+    skills_by_text.update(zip(misses, extracted))
 
-    return {"snapshot_id": snapshot_id, "extracted": extracted, "created_at": doc["created_at"]}
+    to_store = [
+        (oids[sid], skills_by_text[h])
+        for h, sids in by_text.items()
+        for sid in sids
+        if oids[sid] not in seen.get(h, {})
+    ]
+    created = await store_extractions(db, catalog, to_store)
+
+    fresh = set(misses)
+    for h, sids in by_text.items():
+        for sid in sids:
+            created_at = created.get(oids[sid]) or seen[h][oids[sid]]
+            results[sid] = {
+                "snapshot_id": sid,
+                "status": "extracted" if h in fresh else "cached",
+                "extracted": skills_by_text[h],
+                "created_at": created_at,
+            }
+            cache_extraction(text_by_id[sid], catalog.version, skills_by_text[h], oids[sid], created_at)
+
+    return {"catalog_version": catalog.version, "results": [results[sid] for sid in snapshot_ids]}
 
 @router.get("/gaps")
 async def skill_gaps(threshold: int = Query(default=0, ge=0, le=10)):
     db = get_db()
 
-    pipeline = [
-        {
-            "$lookup": {
-                "from": "evidence",
-                "localField": "_id",
-                "foreignField": "skill_ids",
-                "as": "evidence_docs",
-            }
-        },
-        {"$addFields": {"evidence_count": {"$size": "$evidence_docs"}}},
-        {"$match": {"evidence_count": {"$lte": threshold}}},
-        {"$project": {"name": 1, "category": 1, "evidence_count": 1}},
-        {"$sort": {"evidence_count": 1, "name": 1}},
-        {"$limit": 200},
-    ]
-
-    cursor = db["skills"].aggregate(pipeline)
+    # range query on the materialized counter; skills never counted have no field yet
+    cursor = (
+        db["skills"]
+        .find({"evidence_count": {"$not": {"$gt": threshold}}}, {"name": 1, "category": 1, "evidence_count": 1})
+        .sort([("evidence_count", 1), ("name", 1)])
+        .limit(200)
+    )
     rows = await cursor.to_list(length=200)
 
     # stringify ids for JSON
     for r in rows:
         r["_id"] = oid_str(r["_id"])
+        r["evidence_count"] = r.get("evidence_count", 0)
 
     return {"threshold": threshold, "results": rows}
 
@@ -259,42 +306,33 @@ async def confirmed_skill_gaps(
     threshold: int = Query(default=0, ge=0, le=100),
 ):
     db = get_db()
-    pipeline = [
-        {"$match": {"user_id": user_id}},
-        {"$unwind": "$confirmed"},
-        {"$group": {"_id": "$confirmed.skill_id"}},
-        {
-            "$lookup": {
-                "from": "skills",
-                "localField": "_id",
-                "foreignField": "_id",
-                "as": "skill",
-            }
-        },
-        {
-            "$lookup": {
-                "from": "evidence",
-                "localField": "_id",
-                "foreignField": "skill_ids",
-                "as": "evidence_docs",
-            }
-        },
-        {"$addFields": {"evidence_count": {"$size": "$evidence_docs"}}},
-        {"$match": {"evidence_count": {"$lte": threshold}}},
-    ]
-    cursor = db["resume_skill_confirmations"].aggregate(pipeline)
-    rows = await cursor.to_list(length=500)
-    for r in rows:
-        r["skill_id"] = oid_str(r["_id"])
-        if r.get("skill"):
-            skill = r["skill"][0] if r["skill"] else {}
-            r["skill_name"] = skill.get("name", "")
-            r["category"] = skill.get("category", "")
-        else:
-            r["skill_name"] = ""
-            r["category"] = ""
-        r["evidence_count"] = r.get("evidence_count", 0)
-        del r["_id"]
-        del r["skill"]
-        del r["evidence_docs"]
+    confirmed_ids = await db["resume_skill_confirmations"].distinct("confirmed.skill_id", {"user_id": user_id})
+
+    # this user's skills above the threshold; every other confirmed skill is a gap
+    counts = await db["skill_evidence_counts"].find(
+        {"user_id": user_id, "evidence_count": {"$gt": threshold}},
+        {"skill_id": 1, "evidence_count": 1},
+    ).to_list(length=None)
+    covered = {c["skill_id"] for c in counts}
+    gap_ids = [sid for sid in confirmed_ids if sid not in covered][:500]
+
+    # current counts for the gap skills; no counter doc means zero evidence
+    low_counts = await db["skill_evidence_counts"].find(
+        {"user_id": user_id, "skill_id": {"$in": gap_ids}},
+        {"skill_id": 1, "evidence_count": 1},
+    ).to_list(length=None)
+    count_by_id = {c["skill_id"]: c.get("evidence_count", 0) for c in low_counts}
+
+    skills = await db["skills"].find({"_id": {"$in": gap_ids}}, {"name": 1, "category": 1}).to_list(length=None)
+    skill_by_id = {s["_id"]: s for s in skills}
+
+    rows = []
+    for sid in gap_ids:
+        skill = skill_by_id.get(sid, {})
+        rows.append({
+            "skill_id": oid_str(sid),
+            "skill_name": skill.get("name", ""),
+            "category": skill.get("category", ""),
+            "evidence_count": count_by_id.get(sid, 0),
+        })
     return {"user_id": user_id, "threshold": threshold, "results": rows}
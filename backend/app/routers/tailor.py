@@ -3,13 +3,13 @@ from __future__ import annotations
 import re
 import tempfile
 from datetime import datetime, timezone
-from typing import Iterable
 
 from bson import ObjectId
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import FileResponse
 
 from app.core.db import get_db
+from app.core.skill_catalog import get_skill_catalog
 from app.models.tailor import (
     JobIngestIn,
     JobIngestOut,
@@ -19,6 +19,7 @@ from app.models.tailor import (
     ResumeSection,
 )
 from app.utils.mongo import oid_str
+from app.utils.skill_matcher import SkillMatcher
 
 router = APIRouter()
 
@@ -42,43 +43,20 @@ def _tokenize_keywords(text: str) -> list[str]:
             break
     return out
 
-async def _load_skill_catalog(db) -> list[dict]:
-    cursor = db["skills"].find({}, {"name": 1, "aliases": 1})
-    return await cursor.to_list(length=5000)
-
-def _match_skills(job_text: str, skills: Iterable[dict]) -> list[ExtractedSkill]:
-    text = job_text.lower()
-    matches: dict[str, ExtractedSkill] = {}
-
-    def bump(sid: str, name: str, matched_on: str):
-        key = sid
-        if key not in matches:
-            matches[key] = ExtractedSkill(skill_id=sid, skill_name=name, matched_on=matched_on, count=1)
-        else:
-            matches[key].count += 1
-
-    for s in skills:
-        sid = str(s["_id"])
-        name = (s.get("name") or "").strip()
-        if not name:
-            continue
-
-        # word-boundary match for names; allow special tokens like C++ / C# via loose matching
-        n = name.lower()
-        if len(n) >= 2:
-            if re.search(rf"(?<![A-Za-z0-9]){re.escape(n)}(?![A-Za-z0-9])", text):
-                bump(sid, name, "name")
-
-        for a in s.get("aliases", []) or []:
-            a = (a or "").strip()
-            if not a:
-                continue
-            al = a.lower()
-            if re.search(rf"(?<![A-Za-z0-9]){re.escape(al)}(?![A-Za-z0-9])", text):
-                bump(sid, name, "alias")
+def _match_skills(job_text: str, matcher: SkillMatcher) -> list[ExtractedSkill]:
+    # single pass over the posting; counts are real occurrences of the name or any alias
+    matches = [
+        ExtractedSkill(
+            skill_id=matcher.skill_ids[idx],
+            skill_name=matcher.skill_names[idx],
+            matched_on="name" if by_name else "alias",
+            count=count,
+        )
+        for idx, (count, by_name) in matcher.count_occurrences(job_text).items()
+    ]
 
     # sort by count desc then name
-    return sorted(matches.values(), key=lambda x: (-x.count, x.skill_name.lower()))
+    return sorted(matches, key=lambda x: (-x.count, x.skill_name.lower()))
 
 async def _load_user_items(db, user_id: str) -> list[dict]:
     # prefer unified portfolio_items
@@ -127,8 +105,8 @@ def _render_plain_text(sections: list[ResumeSection]) -> str:
 @router.post("/job/ingest", response_model=JobIngestOut)
 async def ingest_job(payload: JobIngestIn):
     db = get_db()
-    skills = await _load_skill_catalog(db)
-    extracted = _match_skills(payload.text, skills)
+    catalog = await get_skill_catalog(db)
+    extracted = _match_skills(payload.text, catalog.matcher)
     keywords = _tokenize_keywords(payload.text)
 
     now = now_utc()
@@ -224,8 +202,8 @@ async def preview_tailored_resume(payload: TailorPreviewIn):
     else:
         if not job_text or len(job_text) < 50:
             raise HTTPException(status_code=400, detail="Provide job_id or job_text (>=50 chars)")
-        skills = await _load_skill_catalog(db)
-        extracted = _match_skills(job_text, skills)
+        catalog = await get_skill_catalog(db)
+        extracted = _match_skills(job_text, catalog.matcher)
         keywords = _tokenize_keywords(job_text)
 
     job_skill_ids = {e.skill_id for e in extracted[:50]}
@@ -4,6 +4,7 @@ from fastapi import APIRouter, HTTPException
 from datetime import datetime, timezone
 from bson import ObjectId
 from app.core.db import get_db
+from app.core.skill_catalog import invalidate_skill_catalog
 from app.utils.mongo import oid_str
 from app.models.taxonomy import SkillAliasesUpdate, SkillRelationIn, SkillRelationOut
 
@@ -24,6 +25,7 @@ async def set_skill_aliases(skill_id: str, payload: SkillAliasesUpdate):
     res = await db["skills"].update_one({"_id": oid}, {"$set": {"aliases": payload.aliases, "updated_at": now_utc()}})
     if res.matched_count == 0:
         raise HTTPException(status_code=404, detail="Skill not found")
+    invalidate_skill_catalog()
 
     doc = await db["skills"].find_one({"_id": oid}, {"name": 1, "category": 1, "aliases": 1})
     return {"skill_id": skill_id, "name": doc.get("name",""), "category": doc.get("category",""), "aliases": doc.get("aliases", [])}
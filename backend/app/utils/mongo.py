@@ -7,3 +7,7 @@ def oid_str(oid: ObjectId) -> str:
 def to_object_id(id_str: str) -> ObjectId:
     return ObjectId(id_str)
 
+def to_object_ids(ids) -> list[ObjectId]:
+    # accepts ObjectIds or their string form (legacy docs stored strings)
+    return [i if isinstance(i, ObjectId) else ObjectId(str(i)) for i in ids or []]
+
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Iterable, NamedTuple
+
+
+class SkillHit(NamedTuple):
+    start: int
+    end: int
+    skill_index: int
+    term: str
+    is_name: bool
+
+
+def _fold(text: str) -> str:
+    # lowercase without changing length, so offsets map back onto the original text
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return "".join(c if len(c.lower()) != 1 else c.lower() for c in text)
+
+
+def _is_word_char(c: str) -> bool:
+    return c.isascii() and c.isalnum()
+
+
+def make_snippet(text: str, start: int, end: int, window: int = 80) -> str:
+    lo = max(0, start - window)
+    hi = min(len(text), end + window)
+    return text[lo:hi].strip()
+
+
+class SkillMatcher:
+    """Aho-Corasick automaton over every skill name and alias in the catalog.
+
+    Built once from `skills` docs ({_id, name, aliases}); `find_all` then scans
+    a text in a single pass regardless of how many skills the catalog holds.
+    """
+
+    def __init__(self, skills: Iterable[dict]):
+        self.skill_ids: list[str] = []
+        self.skill_names: list[str] = []
+        # term -> [(skill_index, is_name)]
+        self.terms: dict[str, list[tuple[int, bool]]] = {}
+
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[str | None] = [None]
+        self._dict_link: list[int] = [0]
+
+        for s in skills:
+            name = (s.get("name") or "").strip()
+            if not name:
+                continue
+            idx = len(self.skill_ids)
+            self.skill_ids.append(str(s["_id"]))
+            self.skill_names.append(name)
+
+            self._add_term(_fold(name), idx, True)
+            # an alias equal to the name is kept as its own entry: short names are
+            # skipped by count_occurrences, but the alias still counts
+            aliases = (_fold(str(a or "").strip()) for a in s.get("aliases") or [])
+            for term in dict.fromkeys(a for a in aliases if a):
+                self._add_term(term, idx, False)
+
+        self._build_links()
+
+    def __len__(self) -> int:
+        return len(self.skill_ids)
+
+    def lookup(self, term: str) -> int | None:
+        """Skill index whose name (preferred) or alias equals `term`, ignoring case."""
+        entries = self.terms.get(_fold(term.strip()))
+        if not entries:
+            return None
+        for skill_index, is_name in entries:
+            if is_name:
+                return skill_index
+        return entries[0][0]
+
+    def _add_term(self, term: str, skill_index: int, is_name: bool):
+        entries = self.terms.get(term)
+        if entries is not None:
+            entries.append((skill_index, is_name))
+            return
+        self.terms[term] = [(skill_index, is_name)]
+
+        node = 0
+        for ch in term:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(None)
+                self._dict_link.append(0)
+            node = nxt
+        self._out[node] = term
+
+    def _build_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                f = self._fail[node]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                fc = self._fail[child] = self._goto[f].get(ch, 0)
+                self._dict_link[child] = fc if self._out[fc] is not None else self._dict_link[fc]
+
+    def find_all(self, text: str) -> list[SkillHit]:
+        """Every (possibly overlapping) occurrence of a catalog term, case-insensitive."""
+        goto, fail, out, dict_link, terms = self._goto, self._fail, self._out, self._dict_link, self.terms
+        hits: list[SkillHit] = []
+        node = 0
+        for i, ch in enumerate(_fold(text)):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+
+            n = node if out[node] is not None else dict_link[node]
+            while n:
+                term = out[n]
+                start = i + 1 - len(term)
+                for skill_index, is_name in terms[term]:
+                    hits.append(SkillHit(start, i + 1, skill_index, term, is_name))
+                n = dict_link[n]
+        return hits
+
+    def count_occurrences(self, text: str, min_name_len: int = 2) -> dict[int, tuple[int, bool]]:
+        """Word-bounded occurrences per skill: {skill_index: (count, matched_on_name)}.
+
+        A hit counts only when it is not glued to a letter or digit on either
+        side, so tokens like C++ and C# match while "java" inside "javascript"
+        does not. Names shorter than `min_name_len` are ignored.
+        """
+        counts: dict[int, tuple[int, bool]] = {}
+        seen: set[tuple[int, int, int]] = set()
+        n = len(text)
+        for h in self.find_all(text):
+            if h.is_name and len(h.term) < min_name_len:
+                continue
+            if (h.skill_index, h.start, h.end) in seen:
+                continue
+            seen.add((h.skill_index, h.start, h.end))
+            if h.start > 0 and _is_word_char(text[h.start - 1]):
+                continue
+            if h.end < n and _is_word_char(text[h.end]):
+                continue
+            count, by_name = counts.get(h.skill_index, (0, False))
+            counts[h.skill_index] = (count + 1, by_name or h.is_name)
+        return counts
+
+    def extract(self, text: str) -> list[dict]:
+        """Resume extraction: best name/alias hit per skill with an evidence snippet.
+
+        A name hit scores 0.9 and an alias hit 0.75; the snippet is taken around
+        the first occurrence of the best-scoring term.
+        """
+        best: dict[int, tuple[float, int, int]] = {}
+        for h in self.find_all(text):
+            conf = 0.9 if h.is_name else 0.75
+            cur = best.get(h.skill_index)
+            if cur is None or conf > cur[0] or (conf == cur[0] and h.start < cur[1]):
+                best[h.skill_index] = (conf, h.start, h.end)
+
+        return [
+            {
+                "skill_id": self.skill_ids[idx],
+                "skill_name": self.skill_names[idx],
+                "confidence": conf,
+                "evidence_snippet": make_snippet(text, start, end),
+            }
+            for idx, (conf, start, end) in sorted(best.items())
+        ]
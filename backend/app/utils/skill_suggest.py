@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import heapq
+from bisect import bisect_left
+from typing import Iterable
+
+# Short prefixes ("p", "py") match a large slice of the catalog, so their top
+# results are ranked once at build time instead of per keystroke.
+SHORT_PREFIX_LEN = 2
+SHORT_PREFIX_TOP = 50
+
+
+def _norm(s: str) -> str:
+    return " ".join(str(s or "").lower().split())
+
+
+class SuggestIndex:
+    """Sorted term array over skill names and aliases for typeahead lookups.
+
+    Prefix matches are a contiguous range found with two bisects. Results rank
+    exact name, exact alias, name prefix, then alias prefix; ties go to the
+    shorter, then alphabetically first, skill name.
+    """
+
+    def __init__(self, skills: Iterable[dict]):
+        self.ids: list[str] = []
+        self.names: list[str] = []
+        self.categories: list[str] = []
+
+        entries: list[tuple[str, int, bool]] = []
+        for s in skills:
+            name = (s.get("name") or "").strip()
+            if not name:
+                continue
+            idx = len(self.ids)
+            self.ids.append(str(s["_id"]))
+            self.names.append(name)
+            self.categories.append(s.get("category") or "")
+
+            seen = {_norm(name)}
+            entries.append((_norm(name), idx, True))
+            for a in s.get("aliases") or []:
+                term = _norm(a)
+                if term and term not in seen:
+                    seen.add(term)
+                    entries.append((term, idx, False))
+
+        entries.sort()
+        self._terms = [e[0] for e in entries]
+        self._entries = entries
+
+        # keyed by (category or None, prefix)
+        self._short: dict[tuple[str | None, str], list[tuple]] = {}
+        for term, idx, is_name in entries:
+            for n in range(1, min(SHORT_PREFIX_LEN, len(term)) + 1):
+                r = self._rank(term[:n], term, idx, is_name)
+                self._short.setdefault((None, term[:n]), []).append(r)
+                self._short.setdefault((self.categories[idx], term[:n]), []).append(r)
+        for key, ranked in self._short.items():
+            self._short[key] = self._best_per_skill(ranked, SHORT_PREFIX_TOP)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _rank(self, q: str, term: str, idx: int, is_name: bool) -> tuple:
+        tier = (0 if term == q else 2) + (0 if is_name else 1)
+        name = self.names[idx]
+        return (tier, len(name), name.lower(), idx, term)
+
+    @staticmethod
+    def _best_per_skill(ranked: Iterable[tuple], limit: int) -> list[tuple]:
+        best: dict[int, tuple] = {}
+        for r in ranked:
+            cur = best.get(r[3])
+            if cur is None or r < cur:
+                best[r[3]] = r
+        return heapq.nsmallest(limit, best.values())
+
+    def suggest(self, q: str, limit: int = 10, category: str | None = None) -> list[dict]:
+        q = _norm(q)
+        if not q:
+            return []
+
+        if len(q) <= SHORT_PREFIX_LEN and limit <= SHORT_PREFIX_TOP:
+            ranked = self._short.get((category, q), [])[:limit]
+        else:
+            lo = bisect_left(self._terms, q)
+            hi = bisect_left(self._terms, q + "\uffff", lo)
+            ranked = self._best_per_skill(
+                (
+                    self._rank(q, term, idx, is_name)
+                    for term, idx, is_name in self._entries[lo:hi]
+                    if category is None or self.categories[idx] == category
+                ),
+                limit,
+            )
+
+        return [
+            {
+                "id": self.ids[idx],
+                "name": self.names[idx],
+                "category": self.categories[idx],
+                "matched_on": "name" if tier % 2 == 0 else "alias",
+                "match_type": "exact" if tier < 2 else "prefix",
+                "matched_text": term,
+            }
+            for tier, _, _, idx, term in ranked
+        ]
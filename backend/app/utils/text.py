@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+import hashlib
+
+
+def normalize_text(text: str) -> str:
+    # collapse whitespace so re-pastes and re-parses of the same content compare equal
+    return " ".join((text or "").split())
+
+
+def text_sha256(text: str) -> str:
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
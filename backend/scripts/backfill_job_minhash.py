@@ -0,0 +1,84 @@
+"""backfill_job_minhash.py
+
+Computes MinHash signatures and LSH band keys (jobs.minhash / jobs.lsh_bands) for
+postings stored before near-duplicate detection, so new submissions are compared
+against them too. With --flag-duplicates, postings are also walked oldest first and
+each one that is a near-duplicate of an earlier approved or pending posting gets
+duplicate_of / duplicate_score (existing flags are recomputed), the same rule
+POST /jobs/submit applies.
+
+Usage:
+python scripts/backfill_job_minhash.py --mongo-uri "mongodb://localhost:27017" --db skillbridge [--flag-duplicates]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from pymongo import MongoClient, UpdateOne
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.utils.minhash import lsh_bands, signature, similarity  # noqa: E402
+
+
+def parse_args():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--mongo-uri", default="mongodb://localhost:27017")
+    ap.add_argument("--db", default="skillbridge")
+    ap.add_argument("--batch-size", type=int, default=1000)
+    ap.add_argument("--flag-duplicates", action="store_true")
+    ap.add_argument("--threshold", type=float, default=0.8)
+    return ap.parse_args()
+
+
+def main():
+    args = parse_args()
+    db = MongoClient(args.mongo_uri)[args.db]
+
+    if args.flag_duplicates:
+        q, order = {}, [("created_at", 1), ("_id", 1)]
+    else:
+        q, order = {"minhash": {"$exists": False}}, [("_id", 1)]
+
+    # band key -> earlier postings' (_id, signature); only needed when flagging
+    seen: dict[str, list[tuple]] = {}
+    ops = []
+    stats = {"signed": 0, "flagged": 0}
+
+    for job in db["jobs"].find(q, {"description_excerpt": 1, "minhash": 1, "moderation_status": 1}).sort(order):
+        sig = job.get("minhash") or signature(job.get("description_excerpt") or "")
+        bands = lsh_bands(sig)
+        fields = {"minhash": sig, "lsh_bands": bands}
+
+        if args.flag_duplicates:
+            best = None
+            for key in bands:
+                for other_id, other_sig in seen.get(key, []):
+                    score = similarity(sig, other_sig)
+                    if score >= args.threshold and (best is None or score > best[1]):
+                        best = (other_id, score)
+            fields["duplicate_of"] = best[0] if best else None
+            fields["duplicate_score"] = best[1] if best else None
+            # rejected postings are never anyone's original
+            if job.get("moderation_status", "pending") in ("approved", "pending"):
+                for key in bands:
+                    seen.setdefault(key, []).append((job["_id"], sig))
+            stats["flagged"] += 1 if best else 0
+
+        ops.append(UpdateOne({"_id": job["_id"]}, {"$set": fields}))
+        stats["signed"] += 1
+        if len(ops) >= args.batch_size:
+            db["jobs"].bulk_write(ops, ordered=False)
+            ops = []
+            print(f"processed={stats['signed']} flagged={stats['flagged']}")
+
+    if ops:
+        db["jobs"].bulk_write(ops, ordered=False)
+    print(stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+"""bench_query_plans.py
+
+Query-plan regression benchmark. Seeds a large synthetic dataset into a
+dedicated database (--seed drops its collections first, so it only runs against
+a database whose name ends in "_bench" unless --yes-drop is given), applies the
+index registry, then captures
+explain("executionStats") for every router's canonical query
+(scripts/query_plans.py): docsExamined, keysExamined, nReturned, time, the
+indexes used and whether a COLLSCAN was used. Results are compared with the
+stored baseline (scripts/query_plan_baseline.json) and regressions are flagged
+(exit code 1). A missing baseline is an error too, unless the run is
+--update-baseline.
+
+Only the plan shape is gated: a new COLLSCAN, a different index, or more
+documents/keys examined per document returned. Timings depend on the machine
+and are printed for information only. Baseline entries may omit fields; only
+the recorded ones are compared.
+
+Usage:
+python scripts/bench_query_plans.py --mongo-uri "mongodb://localhost:27017" --seed
+python scripts/bench_query_plans.py --update-baseline      # accept current numbers
+python scripts/bench_query_plans.py                        # compare against baseline
+
+Requires:
+  pip install pymongo
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from bson import ObjectId
+from pymongo import MongoClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.core.indexes import INDEXES  # noqa: E402
+from query_plans import canonical_queries, explain, plan_indexes, plan_stages  # noqa: E402
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "query_plan_baseline.json"
+BENCH_USER = "bench_user_0"
+
+
+def now_utc() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def parse_args():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--mongo-uri", default="mongodb://localhost:27017")
+    ap.add_argument("--db", default="skillbridge_bench")
+    ap.add_argument("--seed", action="store_true", help="drop and re-seed the synthetic dataset")
+    ap.add_argument("--yes-drop", action="store_true", help="allow --seed on a database not named *_bench")
+    ap.add_argument("--users", type=int, default=500)
+    ap.add_argument("--skills", type=int, default=10000)
+    ap.add_argument("--jobs", type=int, default=100000)
+    ap.add_argument("--evidence", type=int, default=200000)
+    ap.add_argument("--repeat", type=int, default=3, help="runs per query; the median time is kept")
+    ap.add_argument("--baseline", default=str(DEFAULT_BASELINE))
+    ap.add_argument("--update-baseline", action="store_true")
+    ap.add_argument("--tolerance", type=float, default=0.25, help="allowed relative growth in docs/keys examined per returned")
+    args = ap.parse_args()
+    if args.seed and not args.db.endswith("_bench") and not args.yes_drop:
+        ap.error(f"--seed drops every registry collection in {args.db!r}; use a *_bench database or pass --yes-drop")
+    return args
+
+
+def insert_batches(coll, docs, batch_size: int = 5000):
+    batch = []
+    for d in docs:
+        batch.append(d)
+        if len(batch) >= batch_size:
+            coll.insert_many(batch, ordered=False)
+            batch = []
+    if batch:
+        coll.insert_many(batch, ordered=False)
+
+
+def seed(db, args):
+    rnd = random.Random(42)
+    for name in INDEXES:
+        db[name].drop()
+    db["roles"].drop()
+
+    t0 = now_utc() - timedelta(days=365)
+
+    def ts():
+        return t0 + timedelta(seconds=rnd.randint(0, 365 * 86400))
+
+    categories = ["Programming", "Backend", "Frontend", "Database", "DevOps", "ML", "MLOps", "Soft Skills"]
+    skill_ids = [ObjectId() for _ in range(args.skills)]
+    insert_batches(db["skills"], (
+        {"_id": sid, "name": f"Skill {i:06d}", "category": rnd.choice(categories), "aliases": [f"sk{i}"], "evidence_count": 0}
+        for i, sid in enumerate(skill_ids)
+    ))
+
+    role_ids = [ObjectId() for _ in range(25)]
+    db["roles"].insert_many([{"_id": rid, "name": f"Role {i}", "description": "", "created_at": ts()} for i, rid in enumerate(role_ids)])
+
+    users = [BENCH_USER] + [f"bench_user_{i}" for i in range(1, args.users)]
+    projects = [{"_id": ObjectId(), "user_id": rnd.choice(users), "title": f"Project {i}", "created_at": ts()} for i in range(args.users * 4)]
+    projects.append({"_id": ObjectId(), "user_id": BENCH_USER, "title": "Bench project", "created_at": ts()})
+    insert_batches(db["projects"], projects)
+
+    insert_batches(db["project_skill_links"], (
+        {"project_id": p["_id"], "skill_id": sid, "created_at": ts()}
+        for p in projects
+        for sid in rnd.sample(skill_ids, 5)
+    ))
+
+    insert_batches(db["evidence"], (
+        {
+            "user_id": rnd.choice(users),
+            "type": "project",
+            "title": f"Evidence {i}",
+            "source": "bench",
+            "text_excerpt": "synthetic",
+            "skill_ids": rnd.sample(skill_ids, rnd.randint(1, 4)),
+            "project_id": str(rnd.choice(projects)["_id"]),
+            "created_at": ts(),
+        }
+        for i in range(args.evidence)
+    ))
+
+    insert_batches(db["jobs"], (
+        {
+            "title": f"Job {i}",
+            "company": "Bench Co",
+            "location": "Remote",
+            "source": "bench",
+            "description_excerpt": "synthetic posting",
+            "required_skill_ids": [str(s) for s in rnd.sample(skill_ids, rnd.randint(3, 10))],
+            "role_ids": [str(rnd.choice(role_ids))],
+            "moderation_status": rnd.choices(["approved", "pending", "rejected"], weights=[80, 15, 5])[0],
+            "created_at": ts(),
+        }
+        for i in range(args.jobs)
+    ))
+
+    snapshots = [{"_id": ObjectId(), "user_id": u, "source_type": "bench", "raw_text": "synthetic", "created_at": ts()} for u in users]
+    insert_batches(db["resume_snapshots"], snapshots)
+    insert_batches(db["resume_skill_confirmations"], (
+        {
+            "user_id": s["user_id"],
+            "resume_snapshot_id": s["_id"],
+            "confirmed": [{"skill_id": sid, "skill_name": "", "proficiency": 3} for sid in rnd.sample(skill_ids, 20)],
+            "rejected": [],
+            "edited": [],
+            "created_at": s["created_at"],
+        }
+        for s in snapshots
+    ))
+
+    insert_batches(db["portfolio_items"], (
+        {"user_id": rnd.choice(users), "type": "project", "title": f"Item {i}", "priority": rnd.randint(0, 5), "updated_at": ts()}
+        for i in range(args.users * 10)
+    ))
+    insert_batches(db["job_ingests"], (
+        {"user_id": rnd.choice(users), "text": "synthetic", "created_at": ts()} for _ in range(args.users * 5)
+    ))
+    db["job_ingests"].insert_one({"user_id": BENCH_USER, "text": "synthetic", "created_at": ts()})
+    insert_batches(db["skill_relations"], (
+        {"from_skill_id": rnd.choice(skill_ids), "to_skill_id": rnd.choice(skill_ids), "relation_type": "related_to", "created_at": ts()}
+        for _ in range(args.skills)
+    ))
+
+    print(f"Seeded {args.db}: {args.skills} skills, {args.jobs} jobs, {args.evidence} evidence, {args.users} users")
+
+
+def sample_ids(db) -> dict:
+    def first_id(coll, q=None):
+        return str(db[coll].find_one(q or {}, {"_id": 1})["_id"])
+
+    return {
+        "user_id": BENCH_USER,
+        "role_id": first_id("roles"),
+        "skill_id": first_id("skills"),
+        "project_id": first_id("projects", {"user_id": BENCH_USER}),
+        "snapshot_id": first_id("resume_snapshots", {"user_id": BENCH_USER}),
+        "job_ingest_id": first_id("job_ingests", {"user_id": BENCH_USER}),
+    }
+
+
+def execution_stats(plan) -> list[dict]:
+    """executionStats blocks of a find or aggregate explain (aggregations nest them per $cursor stage)."""
+    found = []
+    if isinstance(plan, dict):
+        if isinstance(plan.get("executionStats"), dict):
+            found.append(plan["executionStats"])
+        for key, v in plan.items():
+            if key != "executionStats":
+                found.extend(execution_stats(v))
+    elif isinstance(plan, list):
+        for v in plan:
+            found.extend(execution_stats(v))
+    return found
+
+
+def measure(db, q: dict, repeat: int) -> dict:
+    times = []
+    for _ in range(repeat):
+        plan = explain(db, q, verbosity="executionStats")
+        stats = execution_stats(plan)
+        times.append(sum(s.get("executionTimeMillis", 0) for s in stats))
+    docs = sum(s.get("totalDocsExamined", 0) for s in stats)
+    keys = sum(s.get("totalKeysExamined", 0) for s in stats)
+    returned = sum(s.get("nReturned", 0) for s in stats)
+    return {
+        "docs_examined": docs,
+        "keys_examined": keys,
+        "n_returned": returned,
+        "docs_per_returned": round(docs / max(returned, 1), 3),
+        "keys_per_returned": round(keys / max(returned, 1), 3),
+        "time_ms": statistics.median(times),
+        "collscan": "COLLSCAN" in plan_stages(plan),
+        "indexes": plan_indexes(plan),
+    }
+
+
+def regressions(name: str, cur: dict, base: dict, args) -> list[str]:
+    """Plan-shape regressions against the fields the baseline records; time_ms is never gated."""
+    out = []
+    if cur["collscan"] and not base.get("collscan", False):
+        out.append(f"{name}: now uses COLLSCAN")
+    if "indexes" in base and cur["indexes"] != base["indexes"]:
+        out.append(f"{name}: indexes {base['indexes']} -> {cur['indexes']}")
+    for key in ("docs_per_returned", "keys_per_returned"):
+        if key not in base:
+            continue
+        limit = base[key] * (1 + args.tolerance) + 1
+        if cur[key] > limit:
+            out.append(f"{name}: {key} {base[key]} -> {cur[key]}")
+    return out
+
+
+def main():
+    args = parse_args()
+    db = MongoClient(args.mongo_uri)[args.db]
+
+    if args.seed:
+        seed(db, args)
+    for name, models in INDEXES.items():
+        db[name].create_indexes(models)
+
+    results = {}
+    print(f"{'query':42} {'docs':>9} {'keys':>9} {'returned':>9} {'ms':>7}  plan (ms is informational)")
+    for q in canonical_queries(sample_ids(db)):
+        r = measure(db, q, args.repeat)
+        results[q["name"]] = r
+        plan = "COLLSCAN" if r["collscan"] else ", ".join(r["indexes"]) or "no index"
+        print(f"{q['name']:42} {r['docs_examined']:>9} {r['keys_examined']:>9} {r['n_returned']:>9} {r['time_ms']:>7}  {plan}")
+
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        baseline_path.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        print(f"\nBaseline written: {baseline_path}")
+        return
+
+    if not baseline_path.exists():
+        print(f"\nNo baseline at {baseline_path}; run with --update-baseline to record one.")
+        sys.exit(1)
+
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    problems = []
+    for name, cur in results.items():
+        if name in baseline:
+            problems.extend(regressions(name, cur, baseline[name], args))
+        else:
+            print(f"(new query, no baseline) {name}")
+
+    if problems:
+        print("\nRegressions:")
+        for p in problems:
+            print(f"  {p}")
+        sys.exit(1)
+    print("\nNo regressions against baseline.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""check_query_plans.py
+
+Applies the index registry (app/core/indexes.py) and runs explain() on every
+router's canonical query (scripts/query_plans.py), reporting any COLLSCAN.
+Exits non-zero when a collection scan is found, so it can gate CI.
+
+Usage:
+python scripts/check_query_plans.py --mongo-uri "mongodb://localhost:27017" --db skillbridge [--no-apply]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from bson import ObjectId
+from pymongo import MongoClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.core.indexes import INDEXES  # noqa: E402
+from query_plans import canonical_queries, explain, plan_stages  # noqa: E402
+
+
+def parse_args():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--mongo-uri", default="mongodb://localhost:27017")
+    ap.add_argument("--db", default="skillbridge")
+    ap.add_argument("--user-id", default="student1")
+    ap.add_argument("--no-apply", action="store_true", help="only explain; don't create registry indexes first")
+    return ap.parse_args()
+
+
+def sample_ids(db, user_id: str) -> dict:
+    # real ids where available so the planner sees representative values
+    def first_id(coll, q=None):
+        d = db[coll].find_one(q or {}, {"_id": 1})
+        return str(d["_id"]) if d else str(ObjectId())
+
+    return {
+        "user_id": user_id,
+        "role_id": first_id("roles"),
+        "skill_id": first_id("skills"),
+        "project_id": first_id("projects", {"user_id": user_id}),
+        "snapshot_id": first_id("resume_snapshots", {"user_id": user_id}),
+        "job_ingest_id": first_id("job_ingests", {"user_id": user_id}),
+    }
+
+
+def main():
+    args = parse_args()
+    db = MongoClient(args.mongo_uri)[args.db]
+
+    if not args.no_apply:
+        for name, models in INDEXES.items():
+            db[name].create_indexes(models)
+
+    scans = []
+    for q in canonical_queries(sample_ids(db, args.user_id)):
+        stages = plan_stages(explain(db, q))
+        flag = "COLLSCAN" if "COLLSCAN" in stages else "ok"
+        if flag == "COLLSCAN":
+            scans.append(q["name"])
+        print(f"{flag:9} {q['collection']:28} {q['name']:40} {' > '.join(dict.fromkeys(stages))}")
+
+    if scans:
+        print(f"\n{len(scans)} queries use a collection scan: {', '.join(scans)}")
+        sys.exit(1)
+    print("\nNo collection scans.")
+
+
+if __name__ == "__main__":
+    main()
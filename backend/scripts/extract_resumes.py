@@ -0,0 +1,194 @@
+"""extract_resumes.py
+
+Backfills skill extractions for resume dumps shaped like
+data/processed/sample_resumes.jsonl, using the same SkillMatcher as
+POST /skills/extract/skills/{snapshot_id}. Records are streamed through a
+multiprocessing pool; results go to `skill_extractions` in bulk or to a JSONL file.
+
+Records without a resume_snapshot_id (or _id) are linked to the user's resume_snapshots
+doc for the same text, created if missing, keyed on (user_id, content_hash) like
+POST /ingest/resume/text. Records with neither a snapshot id nor a user_id can't be
+linked and are skipped. JSONL output leaves such rows with resume_snapshot_id null.
+
+Usage:
+python scripts/extract_resumes.py --input data/processed/sample_resumes.jsonl --mongo-uri "mongodb://localhost:27017" --db skillbridge
+python scripts/extract_resumes.py --input dump.jsonl --out extractions.jsonl --skills-json data/taxonomy/skills.json
+
+Requires:
+  pip install pymongo
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime, timezone
+from multiprocessing import Pool
+from pathlib import Path
+
+from bson import ObjectId
+from pymongo import MongoClient, UpdateOne
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.core.resume_ingest import snapshot_doc  # noqa: E402
+from app.utils.skill_matcher import SkillMatcher  # noqa: E402
+from app.utils.text import text_sha256  # noqa: E402
+
+_matcher: SkillMatcher | None = None
+
+
+def now_utc() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def parse_args():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--input", required=True, help="JSONL with raw_text per line")
+    ap.add_argument("--mongo-uri", default="mongodb://localhost:27017")
+    ap.add_argument("--db", default="skillbridge")
+    ap.add_argument("--out", default=None, help="write JSONL here instead of inserting into Mongo")
+    ap.add_argument("--skills-json", default=None, help="load the catalog from a taxonomy file instead of Mongo (requires --out)")
+    ap.add_argument("--workers", type=int, default=None)
+    ap.add_argument("--batch-size", type=int, default=500)
+    ap.add_argument("--chunksize", type=int, default=16)
+    args = ap.parse_args()
+    # taxonomy skills are keyed by name, not ObjectId; such rows must never reach skill_extractions
+    if args.skills_json and not args.out:
+        ap.error("--skills-json requires --out")
+    return args
+
+
+def load_catalog(args, db) -> list[dict]:
+    if args.skills_json:
+        # taxonomy entries have no _id; the skill name stands in for it
+        skills = json.loads(Path(args.skills_json).read_text(encoding="utf-8"))
+        return [{"_id": s["name"], "name": s["name"], "aliases": s.get("aliases", [])} for s in skills]
+    return list(db["skills"].find({}, {"name": 1, "aliases": 1}))
+
+
+def _init_worker(matcher: SkillMatcher):
+    global _matcher
+    _matcher = matcher
+
+
+def _extract_line(item: tuple[int, str]) -> dict | None:
+    line_no, line = item
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        rec = json.loads(line)
+    except json.JSONDecodeError:
+        return {"line": line_no, "error": "invalid json"}
+
+    text = rec.get("raw_text") or ""
+    if len(text) < 50:
+        return {"line": line_no, "error": "text too short"}
+
+    out = {
+        "line": line_no,
+        "resume_snapshot_id": rec.get("resume_snapshot_id") or rec.get("_id"),
+        "user_id": rec.get("user_id"),
+        "metadata": rec.get("metadata", {}),
+        "skills": _matcher.extract(text),
+    }
+    if out["resume_snapshot_id"] is None:
+        # what link_snapshots needs to find or create the snapshot
+        out["snapshot"] = {"source_type": rec.get("source_type") or "import", "raw_text": text, "content_hash": text_sha256(text)}
+    return out
+
+
+def link_snapshots(db, docs: list[dict]) -> int:
+    """Set resume_snapshot_id on docs that came without one; returns how many snapshots were created."""
+    pending = [d for d in docs if "snapshot" in d]
+    if not pending:
+        return 0
+    ops = {}
+    for d in pending:
+        snap = d["snapshot"]
+        key = (d["user_id"], snap["content_hash"])
+        if key not in ops:
+            doc = snapshot_doc(d["user_id"], snap["source_type"], snap["raw_text"], d["metadata"], snap["content_hash"])
+            del doc["user_id"], doc["content_hash"]
+            ops[key] = UpdateOne({"user_id": key[0], "content_hash": key[1]}, {"$setOnInsert": doc}, upsert=True)
+    created = db["resume_snapshots"].bulk_write(list(ops.values()), ordered=False).upserted_count
+    ids = {
+        (s["user_id"], s["content_hash"]): s["_id"]
+        for s in db["resume_snapshots"].find(
+            {"$or": [{"user_id": u, "content_hash": h} for u, h in ops]}, {"user_id": 1, "content_hash": 1}
+        )
+    }
+    for d in pending:
+        d["resume_snapshot_id"] = ids[(d["user_id"], d.pop("snapshot")["content_hash"])]
+    return created
+
+
+def main():
+    args = parse_args()
+    db = None if (args.out and args.skills_json) else MongoClient(args.mongo_uri)[args.db]
+
+    t0 = time.perf_counter()
+    matcher = SkillMatcher(load_catalog(args, db))
+    print(f"Catalog: {len(matcher)} skills compiled in {time.perf_counter() - t0:.2f}s")
+
+    out_f = open(args.out, "w", encoding="utf-8") if args.out else None
+    batch: list[dict] = []
+    done = skipped = created = 0
+
+    def flush():
+        nonlocal created
+        if not batch:
+            return
+        if out_f:
+            for doc in batch:
+                out_f.write(json.dumps(doc, ensure_ascii=False, default=str) + "\n")
+        else:
+            created += link_snapshots(db, batch)
+            db["skill_extractions"].insert_many(batch, ordered=False)
+        batch.clear()
+
+    t0 = time.perf_counter()
+    with open(args.input, encoding="utf-8") as f, Pool(args.workers, initializer=_init_worker, initargs=(matcher,)) as pool:
+        for res in pool.imap(_extract_line, enumerate(f, start=1), chunksize=args.chunksize):
+            if res is None:
+                continue
+            if "error" in res:
+                skipped += 1
+                print(f"line {res['line']}: {res['error']}", file=sys.stderr)
+                continue
+
+            sid = res.pop("resume_snapshot_id")
+            if sid and ObjectId.is_valid(str(sid)):
+                sid = ObjectId(str(sid))
+            res["resume_snapshot_id"] = sid
+            if out_f:
+                res.pop("snapshot", None)
+            elif sid is None and not res["user_id"]:
+                skipped += 1
+                print(f"line {res['line']}: no resume_snapshot_id or user_id to link a snapshot to", file=sys.stderr)
+                continue
+            res["source"] = f"{Path(args.input).name}:{res.pop('line')}"
+            res["created_at"] = now_utc()
+            batch.append(res)
+            done += 1
+            if len(batch) >= args.batch_size:
+                flush()
+                elapsed = time.perf_counter() - t0
+                print(f"{done} docs, {done / elapsed:.1f} docs/sec")
+        flush()
+
+    if out_f:
+        out_f.close()
+
+    elapsed = time.perf_counter() - t0
+    print(f"Done: {done} extracted, {skipped} skipped in {elapsed:.2f}s ({done / max(elapsed, 1e-9):.1f} docs/sec)")
+    if not out_f:
+        print(f"Snapshots created for records without a snapshot id: {created}")
+    print(f"Output: {args.out or f'{args.db}.skill_extractions'}")
+
+
+if __name__ == "__main__":
+    main()
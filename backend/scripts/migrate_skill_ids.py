@@ -0,0 +1,172 @@
+"""migrate_skill_ids.py
+
+Rewrites legacy string skill ids to ObjectIds so every collection joins
+`skills._id` directly:
+- evidence.skill_ids[]
+- resume_skill_confirmations.confirmed[].skill_id / rejected[].skill_id / edited[].to_skill_id
+- project_skill_links.skill_id / project_id
+
+Documents are scanned in _id order in batches and rewritten with bulk_write.
+Progress is checkpointed in the `migrations` collection, so an interrupted run
+resumes where it stopped (use --restart to scan from the beginning again).
+Strings that are not valid ObjectIds are left alone and reported.
+
+Usage:
+python scripts/migrate_skill_ids.py --mongo-uri "mongodb://localhost:27017" --db skillbridge [--dry-run]
+"""
+
+from __future__ import annotations
+
+import argparse
+from datetime import datetime, timezone
+
+from bson import ObjectId
+from pymongo import DeleteOne, MongoClient, UpdateOne
+
+MIGRATION_ID = "skill_ids_to_objectid"
+
+
+def now_utc() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def parse_args():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--mongo-uri", default="mongodb://localhost:27017")
+    ap.add_argument("--db", default="skillbridge")
+    ap.add_argument("--batch-size", type=int, default=500)
+    ap.add_argument("--dry-run", action="store_true")
+    ap.add_argument("--restart", action="store_true", help="ignore the saved checkpoint")
+    return ap.parse_args()
+
+
+def as_oid(v):
+    if isinstance(v, str) and ObjectId.is_valid(v):
+        return ObjectId(v)
+    return v
+
+
+def fix_evidence(doc) -> dict:
+    ids = doc.get("skill_ids") or []
+    fixed = [as_oid(s) for s in ids]
+    return {"skill_ids": fixed} if fixed != ids else {}
+
+
+def fix_confirmation(doc) -> dict:
+    out = {}
+    for field, key in (("confirmed", "skill_id"), ("rejected", "skill_id"), ("edited", "to_skill_id")):
+        entries = doc.get(field) or []
+        fixed = [{**e, key: as_oid(e.get(key))} for e in entries]
+        if fixed != entries:
+            out[field] = fixed
+    return out
+
+
+def fix_link(doc) -> dict:
+    out = {}
+    for key in ("skill_id", "project_id"):
+        v = as_oid(doc.get(key))
+        if v != doc.get(key):
+            out[key] = v
+    return out
+
+
+MIGRATIONS = [
+    ("evidence", {"skill_ids": {"$type": "string"}}, fix_evidence),
+    (
+        "resume_skill_confirmations",
+        {
+            "$or": [
+                {"confirmed.skill_id": {"$type": "string"}},
+                {"rejected.skill_id": {"$type": "string"}},
+                {"edited.to_skill_id": {"$type": "string"}},
+            ]
+        },
+        fix_confirmation,
+    ),
+    ("project_skill_links", {"$or": [{"skill_id": {"$type": "string"}}, {"project_id": {"$type": "string"}}]}, fix_link),
+]
+
+
+def link_ops(db, batch: list[tuple[dict, dict]]) -> list:
+    # A legacy link may already have a canonical twin; drop the legacy doc instead of duplicating it.
+    pairs = [{"project_id": {**d, **f}.get("project_id"), "skill_id": {**d, **f}.get("skill_id")} for d, f in batch]
+    twins = {
+        (t["project_id"], t["skill_id"])
+        for t in db["project_skill_links"].find({"$or": pairs}, {"project_id": 1, "skill_id": 1})
+    }
+    ops = []
+    for (doc, fields), pair in zip(batch, pairs):
+        if (pair["project_id"], pair["skill_id"]) in twins:
+            ops.append(DeleteOne({"_id": doc["_id"]}))
+        else:
+            ops.append(UpdateOne({"_id": doc["_id"]}, {"$set": fields}))
+            twins.add((pair["project_id"], pair["skill_id"]))
+    return ops
+
+
+def migrate_collection(db, name: str, filt: dict, fix, args, checkpoint: dict) -> dict:
+    coll = db[name]
+    last_id = checkpoint.get(name)
+    stats = {"scanned": 0, "updated": 0, "deleted": 0, "invalid": 0}
+
+    while True:
+        q = dict(filt)
+        if last_id is not None:
+            q = {"$and": [filt, {"_id": {"$gt": last_id}}]}
+        docs = list(coll.find(q).sort("_id", 1).limit(args.batch_size))
+        if not docs:
+            break
+
+        batch = []
+        for d in docs:
+            fields = fix(d)
+            if fields:
+                batch.append((d, fields))
+            else:
+                stats["invalid"] += 1
+        stats["scanned"] += len(docs)
+        last_id = docs[-1]["_id"]
+
+        if batch and not args.dry_run:
+            if name == "project_skill_links":
+                ops = link_ops(db, batch)
+            else:
+                ops = [UpdateOne({"_id": d["_id"]}, {"$set": f}) for d, f in batch]
+            res = coll.bulk_write(ops, ordered=False)
+            stats["updated"] += res.modified_count
+            stats["deleted"] += res.deleted_count
+            db["migrations"].update_one(
+                {"_id": MIGRATION_ID},
+                {"$set": {f"checkpoint.{name}": last_id, "updated_at": now_utc()}},
+                upsert=True,
+            )
+        elif batch:
+            stats["updated"] += len(batch)
+
+        print(f"[{name}] scanned={stats['scanned']} updated={stats['updated']} last_id={last_id}")
+
+    return stats
+
+
+def main():
+    args = parse_args()
+    db = MongoClient(args.mongo_uri)[args.db]
+
+    state = db["migrations"].find_one({"_id": MIGRATION_ID}) or {}
+    checkpoint = {} if args.restart else state.get("checkpoint", {})
+
+    for name, filt, fix in MIGRATIONS:
+        stats = migrate_collection(db, name, filt, fix, args, checkpoint)
+        print(f"{name}: {stats}" + (" (dry run)" if args.dry_run else ""))
+
+    if not args.dry_run:
+        db["migrations"].update_one(
+            {"_id": MIGRATION_ID},
+            {"$set": {"completed_at": now_utc()}},
+            upsert=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
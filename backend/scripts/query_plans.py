@@ -0,0 +1,249 @@
+"""query_plans.py
+
+Canonical query each router issues, in a form that can be explain()ed with
+pymongo. Shared by check_query_plans.py (COLLSCAN report) and
+bench_query_plans.py (executionStats regression benchmark). Keep in sync with
+the routers when their filters or sorts change.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from bson import ObjectId
+
+# role_weights: a near-duplicate is skipped while its original is approved.
+# A missing moderation_status counts as approved (app.models.job.DEFAULT_MODERATION_STATUS).
+APPROVED_ORIGINAL_LOOKUP = {
+    "$lookup": {
+        "from": "jobs",
+        "localField": "duplicate_of",
+        "foreignField": "_id",
+        "pipeline": [{"$match": {"moderation_status": {"$in": ["approved", None]}}}, {"$project": {"_id": 1}}],
+        "as": "approved_original",
+    }
+}
+
+
+def canonical_queries(sample: dict) -> list[dict]:
+    """`sample` supplies realistic ids: user_id, role_id, skill_id, project_id, snapshot_id, job_ingest_id."""
+    user_id = sample["user_id"]
+    role_id = sample["role_id"]
+    skill_oid = ObjectId(sample["skill_id"])
+    project_oid = ObjectId(sample["project_id"])
+    snapshot_oid = ObjectId(sample["snapshot_id"])
+
+    return [
+        # skills.py
+        {"name": "list_skills", "collection": "skills", "filter": {}, "sort": [("name", 1)], "limit": 50},
+        {"name": "list_skills_by_category", "collection": "skills", "filter": {"category": "Backend"}, "sort": [("name", 1)], "limit": 50},
+        {
+            "name": "skill_gaps",
+            "collection": "skills",
+            "filter": {"evidence_count": {"$not": {"$gt": 0}}},
+            "sort": [("evidence_count", 1), ("name", 1)],
+            "limit": 200,
+        },
+        {"name": "confirmed_skill_gaps.confirmed", "collection": "resume_skill_confirmations", "filter": {"user_id": user_id}},
+        {
+            "name": "confirmed_skill_gaps.counts",
+            "collection": "skill_evidence_counts",
+            "filter": {"user_id": user_id, "evidence_count": {"$gt": 0}},
+        },
+        # evidence.py
+        {"name": "list_evidence", "collection": "evidence", "filter": {"user_id": user_id}, "sort": [("created_at", -1)], "limit": 500},
+        {"name": "list_evidence_by_skill", "collection": "evidence", "filter": {"skill_ids": skill_oid}, "sort": [("created_at", -1)], "limit": 500},
+        # jobs.py
+        {"name": "list_jobs", "collection": "jobs", "filter": {}, "sort": [("created_at", -1), ("_id", -1)], "limit": 501},
+        {
+            "name": "list_jobs_next_page",
+            "collection": "jobs",
+            "filter": {
+                "$or": [
+                    {"created_at": {"$lt": datetime.now(timezone.utc)}},
+                    {"created_at": datetime.now(timezone.utc), "_id": {"$lt": ObjectId()}},
+                    {"created_at": None},
+                ]
+            },
+            "sort": [("created_at", -1), ("_id", -1)],
+            "limit": 501,
+        },
+        {
+            "name": "list_jobs_pending",
+            "collection": "jobs",
+            "filter": {"moderation_status": "pending"},
+            "sort": [("created_at", -1), ("_id", -1)],
+            "limit": 501,
+        },
+        {
+            "name": "list_jobs_by_role",
+            "collection": "jobs",
+            "filter": {"moderation_status": {"$in": ["approved", None]}, "role_ids": role_id},
+            "sort": [("created_at", -1), ("_id", -1)],
+            "limit": 501,
+        },
+        {
+            "name": "submit_job.near_duplicates",
+            "collection": "jobs",
+            "filter": {
+                "lsh_bands": {"$in": [f"{i}:{0:016x}" for i in range(16)]},
+                "moderation_status": {"$in": ["approved", "pending", None]},
+            },
+            "projection": {"minhash": 1},
+            "limit": 200,
+        },
+        {
+            "name": "moderate_jobs.duplicates",
+            "collection": "jobs",
+            "filter": {"duplicate_of": {"$in": [ObjectId()]}, "moderation_status": {"$in": ["approved", None]}},
+            "projection": {"role_ids": 1},
+        },
+        # roles.py
+        {
+            "name": "compute_role_weights",
+            "collection": "jobs",
+            "pipeline": [
+                {"$match": {"moderation_status": {"$in": ["approved", None]}, "role_ids": {"$in": [role_id]}}},
+                APPROVED_ORIGINAL_LOOKUP,
+                {"$match": {"approved_original": {"$size": 0}}},
+                {"$project": {"role": "$role_ids", "skill": "$required_skill_ids"}},
+            ],
+        },
+        {
+            "name": "compute_all_role_weights",
+            "collection": "jobs",
+            "pipeline": [
+                {"$match": {"moderation_status": {"$in": ["approved", None]}}},
+                APPROVED_ORIGINAL_LOOKUP,
+                {"$match": {"approved_original": {"$size": 0}}},
+                {"$project": {"role": "$role_ids", "skill": "$required_skill_ids"}},
+            ],
+        },
+        # dashboard.py
+        {
+            "name": "dashboard_summary.projects",
+            "collection": "projects",
+            "filter": {"user_id": user_id},
+            "projection": {"title": 1, "created_at": 1},
+            "sort": [("created_at", -1)],
+            "limit": 10,
+        },
+        {"name": "dashboard_summary.project_count", "collection": "projects", "filter": {"user_id": user_id}},
+        {
+            "name": "dashboard_summary.evidence",
+            "collection": "evidence",
+            "pipeline": [
+                {"$match": {"user_id": user_id}},
+                {
+                    "$facet": {
+                        "top_skills": [
+                            {"$unwind": "$skill_ids"},
+                            {"$group": {"_id": "$skill_ids", "evidence_count": {"$sum": 1}}},
+                            {"$sort": {"evidence_count": -1}},
+                            {"$limit": 10},
+                            {"$lookup": {"from": "skills", "localField": "_id", "foreignField": "_id", "as": "skill"}},
+                        ],
+                        "total": [{"$count": "n"}],
+                    }
+                },
+            ],
+        },
+        {"name": "dashboard_summary.confirmations", "collection": "resume_skill_confirmations", "filter": {"user_id": user_id}},
+        # portfolio.py
+        {
+            "name": "list_portfolio_items",
+            "collection": "portfolio_items",
+            "filter": {"user_id": user_id},
+            "sort": [("priority", -1), ("updated_at", -1)],
+            "limit": 500,
+        },
+        # projects.py / resumes.py
+        {"name": "list_projects", "collection": "projects", "filter": {"user_id": user_id}, "sort": [("created_at", -1)], "limit": 500},
+        {"name": "list_project_skills", "collection": "project_skill_links", "filter": {"project_id": project_oid}},
+        {
+            "name": "promote_confirmed_skills.confirmation",
+            "collection": "resume_skill_confirmations",
+            "filter": {"user_id": user_id, "resume_snapshot_id": snapshot_oid},
+        },
+        {
+            "name": "promote_confirmed_skills.evidence",
+            "collection": "evidence",
+            "filter": {"user_id": user_id, "type": "resume", "project_id": sample["project_id"], "source": "resume_snapshot:0"},
+            "projection": {"skill_ids": 1},
+        },
+        {
+            "name": "ingest_resume.dedupe",
+            "collection": "resume_snapshots",
+            "filter": {"user_id": user_id, "content_hash": "0" * 64},
+        },
+        # ingest_jobs.py / core/ingest_worker.py
+        {
+            "name": "ingest_worker.claim",
+            "collection": "jobs_queue",
+            "filter": {"$or": [{"status": "queued"}, {"status": "running", "lease_expires_at": {"$lt": datetime.now(timezone.utc)}}], "attempts": {"$lt": 3}},
+            "sort": [("created_at", 1)],
+            "limit": 1,
+        },
+        {"name": "list_ingest_jobs", "collection": "jobs_queue", "filter": {"user_id": user_id}, "sort": [("created_at", -1)], "limit": 50},
+        # tailor.py
+        {
+            "name": "match_job",
+            "collection": "job_ingests",
+            "filter": {"_id": ObjectId(sample["job_ingest_id"]), "user_id": user_id},
+        },
+        # taxonomy.py
+        {
+            "name": "list_relations",
+            "collection": "skill_relations",
+            "filter": {"$or": [{"from_skill_id": skill_oid}, {"to_skill_id": skill_oid}]},
+            "sort": [("created_at", -1)],
+            "limit": 500,
+        },
+    ]
+
+
+def explain(db, q: dict, verbosity: str = "queryPlanner") -> dict:
+    if "pipeline" in q:
+        cmd = {"aggregate": q["collection"], "pipeline": q["pipeline"], "cursor": {}}
+        return db.command("explain", cmd, verbosity=verbosity)
+
+    cmd = {"find": q["collection"], "filter": q.get("filter", {})}
+    if q.get("projection"):
+        cmd["projection"] = q["projection"]
+    if q.get("sort"):
+        cmd["sort"] = dict(q["sort"])
+    if q.get("limit"):
+        cmd["limit"] = q["limit"]
+    return db.command("explain", cmd, verbosity=verbosity)
+
+
+def plan_stages(plan) -> list[str]:
+    """Every `stage` name anywhere in an explain document (find or aggregate)."""
+    stages: list[str] = []
+    if isinstance(plan, dict):
+        if isinstance(plan.get("stage"), str):
+            stages.append(plan["stage"])
+        for key, v in plan.items():
+            if key == "rejectedPlans":
+                continue
+            stages.extend(plan_stages(v))
+    elif isinstance(plan, list):
+        for v in plan:
+            stages.extend(plan_stages(v))
+    return stages
+
+
+def plan_indexes(plan) -> list[str]:
+    """Sorted names of the indexes the winning plan(s) use (find or aggregate)."""
+    names: set[str] = set()
+    if isinstance(plan, dict):
+        if isinstance(plan.get("indexName"), str):
+            names.add(plan["indexName"])
+        for key, v in plan.items():
+            if key == "rejectedPlans":
+                continue
+            names.update(plan_indexes(v))
+    elif isinstance(plan, list):
+        for v in plan:
+            names.update(plan_indexes(v))
+    return sorted(names)
@@ -0,0 +1,76 @@
+"""rebuild_evidence_counts.py
+
+Recomputes the materialized evidence counters from the `evidence` collection:
+- skills.evidence_count (all evidence citing the skill)
+- skill_evidence_counts {user_id, skill_id, evidence_count}
+
+The API keeps both up to date incrementally; run this once after deploying the
+counters, or whenever evidence was written outside the API.
+
+Usage:
+python scripts/rebuild_evidence_counts.py --mongo-uri "mongodb://localhost:27017" --db skillbridge
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections import Counter
+
+from bson import ObjectId
+from pymongo import MongoClient, UpdateOne
+
+
+def parse_args():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--mongo-uri", default="mongodb://localhost:27017")
+    ap.add_argument("--db", default="skillbridge")
+    ap.add_argument("--batch-size", type=int, default=1000)
+    return ap.parse_args()
+
+
+def as_oid(sid):
+    if isinstance(sid, ObjectId):
+        return sid
+    return ObjectId(str(sid)) if ObjectId.is_valid(str(sid)) else None
+
+
+def write_batches(coll, ops, batch_size: int):
+    for i in range(0, len(ops), batch_size):
+        coll.bulk_write(ops[i : i + batch_size], ordered=False)
+
+
+def main():
+    args = parse_args()
+    db = MongoClient(args.mongo_uri)[args.db]
+
+    global_counts: Counter = Counter()
+    user_counts: Counter = Counter()
+    for ev in db["evidence"].find({}, {"user_id": 1, "skill_ids": 1}):
+        for soid in {as_oid(s) for s in ev.get("skill_ids") or []} - {None}:
+            global_counts[soid] += 1
+            if ev.get("user_id"):
+                user_counts[(ev["user_id"], soid)] += 1
+
+    db["skills"].update_many({}, {"$set": {"evidence_count": 0}})
+    write_batches(
+        db["skills"],
+        [UpdateOne({"_id": soid}, {"$set": {"evidence_count": n}}) for soid, n in global_counts.items()],
+        args.batch_size,
+    )
+
+    db["skill_evidence_counts"].delete_many({})
+    write_batches(
+        db["skill_evidence_counts"],
+        [
+            UpdateOne({"user_id": uid, "skill_id": soid}, {"$set": {"evidence_count": n}}, upsert=True)
+            for (uid, soid), n in user_counts.items()
+        ],
+        args.batch_size,
+    )
+
+    print(f"skills with evidence: {len(global_counts)}")
+    print(f"user/skill counters: {len(user_counts)}")
+
+
+if __name__ == "__main__":
+    main()
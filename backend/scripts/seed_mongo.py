@@ -161,7 +161,7 @@ def main():
             "title": "API Repo README",
             "source": "https://github.com/example/skillbridge",
             "text_excerpt": "Implements FastAPI routers and Mongo collections.",
-            "skill_ids": [str(skill_ids["FastAPI"]), str(skill_ids["MongoDB"])],
+            "skill_ids": [skill_ids["FastAPI"], skill_ids["MongoDB"]],
             "project_id": str(proj1),
             "tags": ["github"],
             "created_at": now_utc(),
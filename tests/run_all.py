@@ -183,27 +183,59 @@ def main():
 
     # Ordered roughly by user-facing flows:
     scripts = [
+        # In-process checks of shared utilities (no server needed)
+        "test_skill_matcher.py",
+        "test_ingest_lease.py",
+        "test_pdf_pool.py",
+        "test_dashboard_cache.py",
+
         # Portfolio CRUD + Tailor pipeline (new)
         "test_tailor_portfolio_crud.py",
         "test_tailor_job_ingest.py",
+        "test_tailor_skill_matching.py",
         "test_tailor_preview_from_job.py",
         "test_tailor_exports.py",
 
         # Existing
         "test_uc_11_12_projects.py",
         "test_uc_13_evidence.py",
+        "test_uc_13_skill_id_types.py",
         "test_uc_14_dashboard.py",
+        "test_uc_14_dashboard_cache.py",
+        "test_uc_14_dashboard_totals.py",
+        "test_uc_21_skill_suggest.py",
         "test_uc_22_update_proficiency_last_used.py",
         "test_uc_23_skill_detail.py",
         "test_uc_24_confirmed_skill_gaps_user_specific.py",
+        "test_uc_24_evidence_counters.py",
         "test_uc_31_resume_ingestion_text.py",
+        "test_uc_31_resume_ingestion_pdf.py",
+        "test_uc_31_resume_upload_storage.py",
+        "test_uc_31_resume_dedupe.py",
+        "test_uc_31_ingest_jobs.py",
         "test_uc_32_skill_extraction.py",
+        "test_uc_32_skill_extraction_batch.py",
+        "test_uc_32_extraction_cache.py",
         "test_uc_33_confirm_reject_extracted_skills.py",
+        "test_uc_33_confirmation_upsert.py",
+        "test_uc_33_confirmation_patch.py",
         "test_uc_34_promote.py",
+        "test_uc_34_promote_bulk.py",
         "test_uc_41_moderation.py",
+        "test_uc_41_batch_moderation.py",
+        "test_uc_41_jobs_pagination.py",
+        "test_uc_41_job_duplicates.py",
+        "test_uc_41_jobs_bulk_import.py",
         "test_uc_42_roles_and_tagging.py",
         "test_uc_43_role_weights.py",
+        "test_uc_43_role_weights_all.py",
         "test_uc_44_taxonomy.py",
+        "test_uc_44_skill_catalog_cache.py",
+
+        # Maintenance scripts (need MongoDB at localhost:27017)
+        "test_index_registry.py",
+        "test_query_plan_bench.py",
+        "test_extract_resumes_cli.py",
     ]
 
     results: List[TestResult] = []
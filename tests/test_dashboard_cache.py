@@ -0,0 +1,66 @@
+"""Dashboard Summary Cache Invalidation (app/core/dashboard_cache.py)
+
+What is being tested (in-process, no server needed; the invalidation record is capped at
+3 users):
+- A summary whose reads started before its user was invalidated is not cached; one
+  started after is.
+- Invalidating another user does not stop a summary from being cached.
+- Invalidating many distinct users keeps the record at the cap.
+- A user pruned from the record is still safe: a summary computed before the prune is
+  not cached, and a fresh one is.
+
+Pass criteria:
+- every assertion below holds.
+"""
+
+import sys
+from pathlib import Path
+
+from _common import parse_args, ok, pretty, die
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "backend"))
+
+from app.core import dashboard_cache as dc  # noqa: E402
+from app.core.config import settings  # noqa: E402
+
+SUMMARY = {"top_skills": []}
+
+
+def check(cond: bool, msg: str):
+    if not cond:
+        die(msg)
+
+
+def main():
+    parse_args()
+    settings.dashboard_cache_size = 3
+
+    before = dc.dashboard_generation("alice")
+    dc.invalidate_dashboard("alice")
+    check(not dc.cache_summary("alice", 5, SUMMARY, before), "summary read before the invalidation was cached")
+    check(dc.cache_summary("alice", 5, SUMMARY, dc.dashboard_generation("alice")), "fresh summary was not cached")
+    check(dc.get_cached_summary("alice", 5) == SUMMARY, "cached summary not returned")
+    ok("Summaries read before an invalidation are not cached")
+
+    before = dc.dashboard_generation("bob")
+    dc.invalidate_dashboard("carol")
+    check(dc.cache_summary("bob", 5, SUMMARY, before), "another user's invalidation blocked caching")
+    ok("Invalidations are per user")
+
+    stale = dc.dashboard_generation("alice")
+    dc.invalidate_dashboard("alice")
+    for n in range(50):
+        dc.invalidate_dashboard(f"user-{n}")
+    check(len(dc._invalidated) == settings.dashboard_cache_size, f"invalidation record grew to {len(dc._invalidated)}")
+    check("alice" not in dc._invalidated, "alice should have been pruned")
+    ok("Invalidation record stays at the cap")
+
+    check(not dc.cache_summary("alice", 5, SUMMARY, stale), "pruned user's stale summary was cached")
+    check(dc.cache_summary("alice", 5, SUMMARY, dc.dashboard_generation("alice")), "pruned user's fresh summary was not cached")
+    ok("Pruned users still refuse stale summaries")
+
+    pretty({"tracked": list(dc._invalidated), "sequence": dc._sequence, "pruned_up_to": dc._pruned_up_to})
+
+
+if __name__ == "__main__":
+    main()
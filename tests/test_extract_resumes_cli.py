@@ -0,0 +1,109 @@
+"""Offline Resume Extraction CLI (scripts/extract_resumes.py)
+
+What is being tested:
+- --skills-json without --out is refused (argparse exit 2): taxonomy skills have no
+  ObjectIds, so their results must never be inserted into skill_extractions.
+- --skills-json with --out runs fully offline: valid records are extracted through the
+  multiprocessing pool into JSONL, and bad lines are skipped and reported.
+- Mongo mode (throwaway database skillbridge_uc_extract_cli on localhost:27017): records
+  without a snapshot id are linked to a resume_snapshots doc per (user_id, text), created
+  once and reused on re-runs; a record with neither a snapshot id nor a user_id is
+  skipped and reported, so no extraction is written with resume_snapshot_id null.
+
+Pass criteria:
+- exit code 2 for the refused run; exit code 0 and the expected JSONL rows and
+  documents otherwise.
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from pymongo import MongoClient
+from _common import parse_args, ok, pretty, die
+
+SCRIPT = Path(__file__).resolve().parents[1] / "backend" / "scripts" / "extract_resumes.py"
+MONGO_DB = "skillbridge_uc_extract_cli"
+
+
+def run(*argv: str) -> subprocess.CompletedProcess:
+    proc = subprocess.run([sys.executable, str(SCRIPT), *argv], capture_output=True, text=True, timeout=120)
+    print(f"$ extract_resumes.py {' '.join(argv)}  -> rc={proc.returncode}")
+    print(proc.stdout[-2000:], proc.stderr[-2000:])
+    return proc
+
+
+def main():
+    parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        skills = tmp / "skills.json"
+        skills.write_text(json.dumps([
+            {"name": "Python", "aliases": ["python3"]},
+            {"name": "Docker", "aliases": []},
+            {"name": "Kubernetes", "aliases": ["k8s"]},
+        ]), encoding="utf-8")
+        records = tmp / "resumes.jsonl"
+        records.write_text("\n".join([
+            json.dumps({"_id": "r1", "user_id": "cli-user", "raw_text": "Backend developer: python3 services packaged with Docker, deployed by CI."}),
+            "{not json",
+            json.dumps({"_id": "r3", "user_id": "cli-user", "raw_text": "too short"}),
+        ]) + "\n", encoding="utf-8")
+        out = tmp / "extractions.jsonl"
+
+        p = run("--input", str(records), "--skills-json", str(skills))
+        if p.returncode != 2 or "--skills-json requires --out" not in p.stderr:
+            die("--skills-json without --out was not refused")
+        ok("--skills-json without --out refused")
+
+        p = run("--input", str(records), "--skills-json", str(skills), "--out", str(out), "--workers", "2")
+        if p.returncode != 0:
+            die("Offline extraction failed")
+        rows = [json.loads(line) for line in out.read_text(encoding="utf-8").splitlines() if line.strip()]
+        if len(rows) != 1:
+            die(f"Expected one extracted record, got {len(rows)}")
+        [row] = rows
+        if row["resume_snapshot_id"] != "r1" or row["source"] != "resumes.jsonl:1":
+            die(f"Row not traced back to its input line: {row}")
+        names = sorted(s["skill_name"] for s in row["skills"])
+        if names != ["Docker", "Python"]:
+            die(f"Unexpected skills: {names}")
+        if "line 2: invalid json" not in p.stderr or "line 3: text too short" not in p.stderr:
+            die("Skipped lines were not reported")
+        ok("Offline extraction to JSONL")
+
+        text = "Platform engineer running Kubernetes clusters and Docker builds for data teams."
+        records.write_text("\n".join([
+            json.dumps({"user_id": "cli-user", "source_type": "kaggle", "raw_text": text}),
+            json.dumps({"user_id": "cli-user", "source_type": "kaggle", "raw_text": text}),
+            json.dumps({"raw_text": "Anonymous record with no user and no snapshot: Python and Docker."}),
+        ]) + "\n", encoding="utf-8")
+        client = MongoClient("mongodb://localhost:27017")
+        client.drop_database(MONGO_DB)
+        db = client[MONGO_DB]
+        try:
+            db["skills"].insert_many([{"name": "Docker", "aliases": []}, {"name": "Kubernetes", "aliases": ["k8s"]}])
+            for attempt in (1, 2):
+                p = run("--input", str(records), "--db", MONGO_DB)
+                if p.returncode != 0 or "line 3: no resume_snapshot_id or user_id" not in p.stderr:
+                    die(f"Mongo run {attempt} failed or did not report the unlinkable record")
+            snapshots = list(db["resume_snapshots"].find({"user_id": "cli-user"}))
+            if len(snapshots) != 1 or snapshots[0]["raw_text"] != text or not snapshots[0].get("content_hash"):
+                die(f"Expected one snapshot for the repeated text across both runs: {snapshots}")
+            extractions = list(db["skill_extractions"].find({}))
+            if len(extractions) != 4 or {e["resume_snapshot_id"] for e in extractions} != {snapshots[0]["_id"]}:
+                die(f"Every extraction should reference the snapshot: {[e['resume_snapshot_id'] for e in extractions]}")
+        finally:
+            client.drop_database(MONGO_DB)
+            client.close()
+        ok("Mongo mode links records to a snapshot and skips unlinkable ones")
+
+    ok("Offline extraction CLI")
+    pretty(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Index Registry and Query Plans (app/core/indexes.py, scripts/check_query_plans.py)
+
+Endpoint(s):
+- GET /health, GET /health/indexes
+
+What is being tested:
+- The index registry applied at startup finishes without errors for every collection.
+- Unique indexes (users.email, sessions.token, the dedupe keys) are built before the
+  server answers its first request: /health/indexes reports them from the first call,
+  even while secondary indexes are still building.
+- Every router's canonical query (scripts/query_plans.py) is served by an index: the
+  checker run against the server's database reports no COLLSCAN (exit code 0).
+
+Notes:
+- check_query_plans.py connects to the MongoDB at its default --mongo-uri (localhost:27017).
+
+Pass criteria:
+- /health/indexes reports "ok" for the unique indexes on the first call and done with
+  "ok" for every collection; the checker exits 0.
+"""
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import requests
+from _common import parse_args, assert_status, get_json, ok, pretty, die
+
+SCRIPT = Path(__file__).resolve().parents[1] / "backend" / "scripts" / "check_query_plans.py"
+
+
+def main():
+    args = parse_args()
+    base = args.base_url.rstrip("/")
+
+    r = requests.get(f"{base}/health/indexes", timeout=15)
+    assert_status(r, 200)
+    unique = get_json(r)["unique"] or {}
+    if not {"users", "sessions"} <= set(unique) or any(not res.startswith("ok") for res in unique.values()):
+        die(f"Unique indexes should be built before the server serves requests: {unique}")
+    ok(f"Unique indexes ready at startup on {len(unique)} collections")
+
+    deadline = time.monotonic() + 60
+    while True:
+        r = requests.get(f"{base}/health/indexes", timeout=15)
+        assert_status(r, 200)
+        status = get_json(r)
+        if status["status"] == "done":
+            break
+        if time.monotonic() > deadline:
+            die(f"Index build did not finish: {status}")
+        time.sleep(1)
+
+    failed = {name: res for name, res in status["collections"].items() if not res.startswith("ok")}
+    if failed:
+        die(f"Index build failed: {failed}")
+    ok(f"Registry applied to {len(status['collections'])} collections")
+
+    r = requests.get(f"{base}/health", timeout=15)
+    assert_status(r, 200)
+    db_name = get_json(r)["db"]
+
+    proc = subprocess.run(
+        [sys.executable, str(SCRIPT), "--db", db_name, "--user-id", args.user_id, "--no-apply"],
+        capture_output=True, text=True, timeout=120,
+    )
+    print(proc.stdout[-4000:], proc.stderr[-2000:])
+    if proc.returncode != 0:
+        die("check_query_plans.py found collection scans (or failed)")
+
+    ok("Index registry and query plans")
+    pretty(status)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Ingest Job Leases (app/core/ingest_worker.py)
+
+What is being tested (in-process, against a throwaway database skillbridge_uc_ingest_lease
+on the MongoDB at localhost:27017, with a 0.6s lease):
+- While a stage runs far longer than the lease, the heartbeat keeps renewing it and no
+  other worker can reclaim the job.
+- Each stage update also pushes the lease forward.
+- Once the holder stops (crashed: no heartbeat, no updates), the lease expires and
+  another worker claims the job on its next attempt.
+
+Pass criteria:
+- every assertion below holds.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+from _common import parse_args, ok, pretty, die
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "backend"))
+
+from motor.motor_asyncio import AsyncIOMotorClient  # noqa: E402
+
+from app.core import ingest_worker  # noqa: E402
+from app.core.config import settings  # noqa: E402
+
+LEASE_DB = "skillbridge_uc_ingest_lease"
+
+
+def check(cond: bool, msg: str):
+    if not cond:
+        die(msg)
+
+
+async def run() -> dict:
+    settings.ingest_lease_seconds = 0.6
+    client = AsyncIOMotorClient("mongodb://localhost:27017")
+    db = client[LEASE_DB]
+    await db[ingest_worker.QUEUE].drop()
+    try:
+        job = await ingest_worker.enqueue(db, "resume_text", "lease-user", {"text": "Lease test resume text."})
+        claimed = await ingest_worker._claim(db, "worker-a")
+        check(claimed is not None and claimed["_id"] == job["_id"], "worker-a should claim the queued job")
+
+        async with ingest_worker._heartbeat(db, claimed, "worker-a"):
+            for _ in range(4):
+                await asyncio.sleep(0.5)
+                check(await ingest_worker._claim(db, "worker-b") is None, "job reclaimed while its heartbeat was running")
+        ok("Heartbeat keeps the lease through a stage 3x longer than the lease")
+
+        before = (await db[ingest_worker.QUEUE].find_one({"_id": job["_id"]}))["lease_expires_at"]
+        await asyncio.sleep(0.1)
+        check(await ingest_worker._update(db, claimed, "worker-a", {"stage": "extract"}), "holder lost the job")
+        after = await db[ingest_worker.QUEUE].find_one({"_id": job["_id"]})
+        check(after["lease_expires_at"] > before and after["stage"] == "extract", "stage update did not renew the lease")
+        ok("Stage updates renew the lease")
+
+        await asyncio.sleep(1.0)
+        reclaimed = await ingest_worker._claim(db, "worker-b")
+        check(reclaimed is not None and reclaimed["attempts"] == 2, "expired lease was not reclaimed")
+        check(not await ingest_worker._update(db, claimed, "worker-a", {"stage": "snapshot"}), "old holder could still write")
+        ok("Expired lease is reclaimed and the old holder is fenced off")
+        return {"job_id": str(job["_id"]), "attempts": reclaimed["attempts"], "worker": reclaimed["worker_id"]}
+    finally:
+        await client.drop_database(LEASE_DB)
+        client.close()
+
+
+def main():
+    parse_args()
+    pretty(asyncio.run(run()))
+
+
+if __name__ == "__main__":
+    main()
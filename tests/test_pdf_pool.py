@@ -0,0 +1,91 @@
+"""PDF Parse Workers (app/core/pdf_pool.py)
+
+What is being tested (in-process, no server; 2 workers and a 1s parse timeout):
+- A parse that overruns the timeout raises TimeoutError and terminates only its own
+  worker process; a parse running on the other worker at the same time still finishes.
+- The terminated worker's slot starts a fresh process, so the next parses succeed.
+- An unreadable PDF raises ValueError and leaves its worker in service.
+- Every slot is free again afterwards and the counters add up.
+
+Pass criteria:
+- every assertion below holds.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+from _common import parse_args, ok, pretty, die
+from test_uc_31_resume_ingestion_pdf import make_pdf
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "backend"))
+
+from app.core import pdf_pool  # noqa: E402
+from app.core.config import settings  # noqa: E402
+
+SLOW = b"%slow"
+real_parse = pdf_pool._parse_pdf
+
+
+def slow_or_real(file_bytes: bytes) -> str:
+    # workers are forked from this process, so they pick up the patched parser
+    if file_bytes == SLOW:
+        time.sleep(30)
+    return real_parse(file_bytes)
+
+
+def check(cond: bool, msg: str):
+    if not cond:
+        die(msg)
+
+
+async def run() -> dict:
+    settings.pdf_workers = 2
+    settings.pdf_max_concurrency = 4
+    settings.pdf_parse_timeout_seconds = 1.0
+    pdf_pool._parse_pdf = slow_or_real
+    try:
+        started = time.monotonic()
+        slow = asyncio.ensure_future(pdf_pool.parse_pdf(SLOW))
+        text = await pdf_pool.parse_pdf(make_pdf("Parsed beside a stuck worker"))
+        check("stuck worker" in text, f"parse on the healthy worker failed: {text!r}")
+        try:
+            await slow
+            die("slow parse should have timed out")
+        except TimeoutError:
+            pass
+        check(time.monotonic() - started < 10, "timeout did not fire near pdf_parse_timeout_seconds")
+        check(len(pdf_pool._workers) == 1, f"only the stuck worker should be gone: {len(pdf_pool._workers)} left")
+        ok("Timeout terminates only the overrunning worker")
+
+        texts = await asyncio.gather(*(pdf_pool.parse_pdf(make_pdf(f"Fresh worker parse {n}")) for n in range(3)))
+        check([f"Fresh worker parse {n}" in t for n, t in enumerate(texts)] == [True] * 3, f"parses after the timeout failed: {texts}")
+        ok("The freed slot starts a fresh worker")
+
+        try:
+            await pdf_pool.parse_pdf(b"not a pdf")
+            die("unreadable PDF should raise ValueError")
+        except ValueError:
+            pass
+        check(len(pdf_pool._workers) == 2, "a parse error must not cost a worker")
+        ok("Unreadable PDF is a ValueError and keeps its worker")
+
+        stats = pdf_pool.pdf_pool_stats()
+        expected = {"running": 0, "queued": 0, "completed": 4, "failed": 2, "timeouts": 1, "worker_restarts": 1}
+        check({k: stats[k] for k in expected} == expected, f"unexpected counters: {stats}")
+        check(pdf_pool._get_slots().qsize() == settings.pdf_workers, "a worker slot leaked")
+        ok("Counters add up and every slot is free")
+        return stats
+    finally:
+        pdf_pool.shutdown_pdf_pool()
+        pdf_pool._parse_pdf = real_parse
+
+
+def main():
+    parse_args()
+    pretty(asyncio.run(run()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Query-Plan Regression Benchmark (scripts/bench_query_plans.py)
+
+What is being tested:
+- --seed refuses a database whose name doesn't end in _bench unless --yes-drop is given
+  (nothing is dropped; argparse exits with 2).
+- A compare run without a stored baseline exits 1.
+- --update-baseline records one, and an immediate compare run against it passes.
+- The committed baseline (scripts/query_plan_baseline.json) passes out of the box, and
+  only plan shape is gated: timings are never compared.
+
+Notes:
+- Runs the script against the MongoDB at its default --mongo-uri (localhost:27017), on a
+  small throwaway dataset in skillbridge_uc_bench.
+
+Pass criteria:
+- exit codes 2, 1, 0, 0 and 0 for the runs above, with no timing regressions reported.
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from _common import parse_args, ok, die
+
+SCRIPT = Path(__file__).resolve().parents[1] / "backend" / "scripts" / "bench_query_plans.py"
+SMALL = ["--users", "20", "--skills", "200", "--jobs", "500", "--evidence", "1000", "--repeat", "3"]
+
+
+def run(*argv: str) -> subprocess.CompletedProcess:
+    proc = subprocess.run([sys.executable, str(SCRIPT), *argv], capture_output=True, text=True, timeout=300)
+    print(f"$ bench_query_plans.py {' '.join(argv)}  -> rc={proc.returncode}")
+    print(proc.stdout[-2000:], proc.stderr[-2000:])
+    return proc
+
+
+def main():
+    parse_args()
+
+    p = run("--db", "skillbridge", "--seed")
+    if p.returncode != 2 or "--yes-drop" not in p.stderr:
+        die("--seed on a non-bench database was not refused")
+    ok("Seeding a non-bench database refused")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        baseline = str(Path(tmp) / "baseline.json")
+        common = ["--db", "skillbridge_uc_bench", "--baseline", baseline, *SMALL]
+
+        p = run(*common, "--seed")
+        if p.returncode != 1 or "No baseline" not in p.stdout:
+            die("Compare run without a baseline did not fail")
+        ok("Missing baseline fails the run")
+
+        p = run(*common, "--update-baseline")
+        if p.returncode != 0 or not Path(baseline).exists():
+            die("--update-baseline did not record a baseline")
+
+        p = run(*common)
+        if p.returncode != 0:
+            die("Compare run against a fresh baseline reported regressions")
+
+        recorded = json.loads(Path(baseline).read_text(encoding="utf-8"))
+        for entry in recorded.values():
+            entry["time_ms"] = 0  # a much faster machine recorded it: must not matter
+        Path(baseline).write_text(json.dumps(recorded), encoding="utf-8")
+        p = run(*common)
+        if p.returncode != 0 or "time_ms" in p.stdout.split("Regressions:")[-1]:
+            die("Timings were gated against the baseline")
+        ok("Only plan shape is gated")
+
+    p = run("--db", "skillbridge_uc_bench", *SMALL)
+    if p.returncode != 0:
+        die("The committed baseline does not pass on the seeded dataset")
+    ok("Committed baseline passes")
+
+    ok("Query-plan bench")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Skill Matcher (app/utils/skill_matcher.py)
+
+What is being tested (in-process, no server needed):
+- find_all reports every name and alias occurrence with offsets into the original text,
+  case-insensitively, including overlapping terms.
+- extract keeps one entry per skill: a name hit (0.9) beats an alias hit (0.75), and the
+  evidence snippet is cut around the reported offsets.
+- count_occurrences is word-bounded: C++ and C# match as tokens, "Java" does not match
+  inside "JavaScript", and one-letter names are ignored.
+- lookup resolves a name or alias to its skill, preferring names.
+
+Pass criteria:
+- every assertion below holds.
+"""
+
+import sys
+from pathlib import Path
+
+from _common import parse_args, ok, pretty, die
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "backend"))
+
+from app.utils.skill_matcher import SkillMatcher  # noqa: E402
+
+SKILLS = [
+    {"_id": "java", "name": "Java", "aliases": []},
+    {"_id": "js", "name": "JavaScript", "aliases": ["JS", "ECMAScript"]},
+    {"_id": "cpp", "name": "C++", "aliases": ["cpp"]},
+    {"_id": "csharp", "name": "C#", "aliases": ["csharp"]},
+    {"_id": "c", "name": "C", "aliases": []},
+    {"_id": "py", "name": "Python", "aliases": ["python3", "py"]},
+]
+
+
+def check(cond: bool, msg: str):
+    if not cond:
+        die(msg)
+
+
+def main():
+    parse_args()
+    m = SkillMatcher(SKILLS)
+    index = {sid: i for i, sid in enumerate(m.skill_ids)}
+    check(len(m) == len(SKILLS), "not every skill compiled")
+
+    text = "Shipped JavaScript and C# services; PYTHON3 tooling."
+    hits = m.find_all(text)
+    for h in hits:
+        check(text[h.start:h.end].lower() == h.term, f"offsets of {h} don't map onto the text")
+    found = {m.skill_ids[h.skill_index] for h in hits}
+    # Java is a prefix of JavaScript and Python of python3: overlapping terms are all reported
+    check({"java", "js", "csharp", "c", "py"} <= found, f"missing overlapping hits: {found}")
+    ok("find_all offsets and overlaps")
+
+    extracted = {e["skill_id"]: e for e in m.extract("Python developer, mostly python3 and py tools.")}
+    check(list(extracted) == ["py"], f"one entry per skill expected: {list(extracted)}")
+    check(extracted["py"]["confidence"] == 0.9, "name hit should beat alias hits")
+    check(extracted["py"]["evidence_snippet"].startswith("Python developer"), "snippet not cut around the hit")
+    only_alias = m.extract("Wrote JS modules.")
+    check([(e["skill_id"], e["confidence"]) for e in only_alias] == [("js", 0.75)], f"alias hit: {only_alias}")
+    ok("extract confidence and snippets")
+
+    counts = m.count_occurrences("C++, c++ and C#; JavaScript (not Java?) plus Java. cpp.")
+    by_id = {m.skill_ids[i]: c for i, (c, _) in counts.items()}
+    check(by_id.get("cpp") == 3, f"C++ should match 3 times (twice by name, once by alias): {by_id}")
+    check(by_id.get("csharp") == 1, f"C# should match once: {by_id}")
+    check(by_id.get("js") == 1, f"JavaScript should match once: {by_id}")
+    check(by_id.get("java") == 2, f"Java must not match inside JavaScript: {by_id}")
+    check("c" not in by_id, f"one-letter names are ignored: {by_id}")
+    check(counts[index["cpp"]][1] is True, "C++ matched on its name")
+    check(not m.count_occurrences("Javanese scripts, pythonic code"), "matches glued to letters must not count")
+    ok("count_occurrences word boundaries")
+
+    check(m.lookup("javascript") == index["js"], "lookup by name")
+    check(m.lookup(" CSHARP ") == index["csharp"], "lookup by alias")
+    check(m.lookup("Rust") is None, "unknown term")
+    ok("lookup")
+
+    ok("Skill matcher")
+    pretty(by_id)
+
+
+if __name__ == "__main__":
+    main()
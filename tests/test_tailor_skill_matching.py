@@ -0,0 +1,78 @@
+"""Tailor Add-on — Skill Matching in Job Postings
+
+Endpoint:
+- POST /tailor/job/ingest
+
+What is being tested:
+- Posting skills are counted per real occurrence of a skill's name or any alias.
+- Matching is word-bounded: C++ and C# are found as tokens, and "Java" is not found
+  inside "JavaScript".
+- Results are ordered by count (desc), then name.
+
+Pass criteria:
+- counts, matched_on and ordering below hold for the skills this test ensures exist.
+"""
+
+import uuid
+
+import requests
+from _common import parse_args, assert_status, get_json, ok, pretty, die
+
+
+def ensure_skill(base: str, name: str, category: str, aliases=None):
+    aliases = aliases or []
+    r = requests.post(f"{base}/skills", json={"name": name, "category": category, "aliases": aliases}, timeout=15)
+    if r.status_code == 200:
+        return get_json(r)["id"]
+    r = requests.get(f"{base}/skills", params={"q": name, "limit": 25}, timeout=15)
+    assert_status(r, 200)
+    for s in get_json(r):
+        if s.get("name", "").lower() == name.lower():
+            return s["id"]
+    die(f"Could not ensure skill exists: {name}")
+
+
+def main():
+    args = parse_args()
+    base = args.base_url.rstrip("/")
+    tag = uuid.uuid4().hex[:8]
+    store = f"Zephyrstore{tag}"
+
+    for name in ("C++", "C#", "Java", "JavaScript"):
+        ensure_skill(base, name, "Programming")
+    ensure_skill(base, store, "Database", [f"zs{tag}"])
+
+    text = (
+        f"Engines in C++ (modern c++), tooling in C#, dashboards in JavaScript. "
+        f"Data lives in {store}; zs{tag} replicas and {store} backups."
+    )
+    payload = {"user_id": args.user_id, "title": "Engine Developer", "company": "TestCo", "location": "MI", "text": text}
+    r = requests.post(f"{base}/tailor/job/ingest", json=payload, timeout=20)
+    assert_status(r, 200)
+    extracted = get_json(r)["extracted_skills"]
+    by_name = {}
+    for s in extracted:
+        by_name.setdefault(s["skill_name"].lower(), s)
+
+    expected = {"c++": 2, "c#": 1, "javascript": 1, store.lower(): 3}
+    for name, count in expected.items():
+        if name not in by_name:
+            die(f"{name} not matched; got {sorted(by_name)}")
+        if by_name[name]["count"] != count:
+            die(f"{name}: expected count {count}, got {by_name[name]['count']}")
+    if "java" in by_name:
+        die("Java matched inside JavaScript")
+    if by_name[store.lower()]["matched_on"] != "name":
+        die("A skill hit by name and alias should report matched_on=name")
+    ok("Word-bounded counts")
+
+    keys = [(-s["count"], s["skill_name"].lower()) for s in extracted]
+    if keys != sorted(keys):
+        die("extracted_skills not ordered by count desc, then name")
+
+    ok("Tailor skill matching")
+    pretty(extracted)
+
+
+if __name__ == "__main__":
+    main()
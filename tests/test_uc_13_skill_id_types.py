@@ -0,0 +1,143 @@
+"""UC 1.3 — One Representation for Skill Ids
+
+Endpoint(s):
+- POST /evidence, GET /evidence
+- GET /dashboard/summary
+- scripts/migrate_skill_ids.py
+
+What is being tested:
+- Skill ids are validated as ObjectIds on the way in (422 otherwise) and always come back
+  as canonical lowercase strings, however the client spelled them.
+- Filtering evidence by skill_id and the dashboard's skills join both work on the stored ids.
+- The migration script rewrites legacy string ids (evidence, confirmations,
+  project_skill_links), drops a legacy link whose canonical twin already exists, and is a
+  no-op when run again. It runs against a throwaway database (skillbridge_uc_migration)
+  on the MongoDB at localhost:27017.
+
+Pass criteria:
+- all checks below hold.
+"""
+
+import subprocess
+import sys
+import uuid
+from pathlib import Path
+
+import requests
+from bson import ObjectId
+from pymongo import MongoClient
+from _common import parse_args, assert_status, get_json, ok, pretty, die
+
+SCRIPT = Path(__file__).resolve().parents[1] / "backend" / "scripts" / "migrate_skill_ids.py"
+MIGRATION_DB = "skillbridge_uc_migration"
+
+
+def check_api(base: str, user_id: str, tag: str):
+    r = requests.post(f"{base}/skills", json={"name": f"Idskill {tag}", "category": "Testing", "aliases": []}, timeout=15)
+    assert_status(r, 200)
+    skill_id = get_json(r)["id"]
+
+    payload = {
+        "user_id": user_id,
+        "type": "project",
+        "title": "Id typing evidence",
+        "source": "local:test",
+        "text_excerpt": "Skill id typing.",
+        "skill_ids": [skill_id.upper()],
+        "tags": [],
+    }
+    r = requests.post(f"{base}/evidence", json=payload, timeout=15)
+    assert_status(r, 200)
+    ev = get_json(r)
+    if ev["skill_ids"] != [skill_id]:
+        die(f"skill_ids not returned in canonical form: {ev['skill_ids']}")
+
+    r = requests.post(f"{base}/evidence", json={**payload, "skill_ids": ["python"]}, timeout=15)
+    assert_status(r, 422)
+    ok("Skill ids validated and canonicalized")
+
+    for spelling in (skill_id, skill_id.upper()):
+        r = requests.get(f"{base}/evidence", params={"user_id": user_id, "skill_id": spelling}, timeout=15)
+        assert_status(r, 200)
+        if [e["id"] for e in get_json(r)] != [ev["id"]]:
+            die(f"Evidence filter by skill_id={spelling} did not find the evidence")
+
+    r = requests.get(f"{base}/dashboard/summary", params={"user_id": user_id}, timeout=15)
+    assert_status(r, 200)
+    top = get_json(r)["top_skills_by_evidence"]
+    if [(s["skill_id"], s["skill_name"]) for s in top] != [(skill_id, f"Idskill {tag}")]:
+        die(f"Dashboard did not join the skill: {top}")
+    ok("Evidence filter and dashboard join on ObjectIds")
+
+
+def run_migration() -> subprocess.CompletedProcess:
+    proc = subprocess.run(
+        [sys.executable, str(SCRIPT), "--db", MIGRATION_DB, "--restart", "--batch-size", "2"],
+        capture_output=True, text=True, timeout=120,
+    )
+    print(proc.stdout[-2000:], proc.stderr[-2000:])
+    if proc.returncode != 0:
+        die("migrate_skill_ids.py failed")
+    return proc
+
+
+def check_migration():
+    client = MongoClient("mongodb://localhost:27017")
+    client.drop_database(MIGRATION_DB)
+    db = client[MIGRATION_DB]
+    skill, project = ObjectId(), ObjectId()
+
+    ev_ids = db["evidence"].insert_many([
+        {"user_id": "u", "skill_ids": [str(skill), "not-an-id"]},
+        {"user_id": "u", "skill_ids": [str(skill)]},
+        {"user_id": "u", "skill_ids": [skill]},
+    ]).inserted_ids
+    conf_id = db["resume_skill_confirmations"].insert_one({
+        "user_id": "u",
+        "confirmed": [{"skill_id": str(skill), "skill_name": "S", "proficiency": 3}],
+        "rejected": [{"skill_id": str(skill), "skill_name": "S"}],
+        "edited": [],
+    }).inserted_id
+    canonical_link = db["project_skill_links"].insert_one({"project_id": project, "skill_id": skill}).inserted_id
+    db["project_skill_links"].insert_one({"project_id": str(project), "skill_id": str(skill)})
+    other_skill = ObjectId()
+    legacy_link = db["project_skill_links"].insert_one({"project_id": str(project), "skill_id": str(other_skill)}).inserted_id
+
+    run_migration()
+
+    docs = {d["_id"]: d for d in db["evidence"].find()}
+    if docs[ev_ids[0]]["skill_ids"] != [skill, "not-an-id"] or docs[ev_ids[1]]["skill_ids"] != [skill]:
+        die(f"Evidence skill_ids not migrated: {docs}")
+    conf = db["resume_skill_confirmations"].find_one({"_id": conf_id})
+    if conf["confirmed"][0]["skill_id"] != skill or conf["rejected"][0]["skill_id"] != skill:
+        die(f"Confirmation entries not migrated: {conf}")
+    links = {d["_id"]: d for d in db["project_skill_links"].find()}
+    if set(links) != {canonical_link, legacy_link}:
+        die(f"Legacy twin link not dropped: {links}")
+    if links[legacy_link]["project_id"] != project or links[legacy_link]["skill_id"] != other_skill:
+        die(f"Legacy link not migrated: {links[legacy_link]}")
+    if not db["migrations"].find_one({"_id": "skill_ids_to_objectid", "completed_at": {"$exists": True}}):
+        die("Migration not recorded as completed")
+    ok("Legacy string ids migrated")
+
+    again = run_migration()
+    if again.stdout.count("'updated': 0, 'deleted': 0") != 3:
+        die("Second run rewrote documents again")
+    client.drop_database(MIGRATION_DB)
+    ok("Migration is idempotent")
+
+
+def main():
+    args = parse_args()
+    base = args.base_url.rstrip("/")
+    tag = uuid.uuid4().hex[:8]
+
+    check_api(base, f"{args.user_id} ids-{tag}", tag)
+    check_migration()
+
+    ok("UC 1.3 skill id typing")
+    pretty({"user_id": f"{args.user_id} ids-{tag}"})
+
+
+if __name__ == "__main__":
+    main()
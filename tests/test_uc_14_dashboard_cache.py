@@ -0,0 +1,77 @@
+"""UC 1.4 — Dashboard Summary Cache
+
+Endpoint(s):
+- GET /dashboard/summary
+- POST /projects
+- GET /dashboard/cache/stats
+
+What is being tested:
+- The first summary for a user is computed (X-Cache: miss) and reports timings_ms.
+- Asking again is served from the cache (X-Cache: hit) with the same data and no timings_ms.
+- Creating a project invalidates the user's cached summary; the next one is a miss that
+  counts the new project.
+
+Pass criteria:
+- X-Cache headers, timings_ms presence and totals.projects behave as above.
+"""
+
+import uuid
+
+import requests
+from _common import parse_args, assert_status, get_json, ok, pretty, die
+
+
+def summary(base: str, user_id: str) -> tuple[str, dict]:
+    r = requests.get(f"{base}/dashboard/summary", params={"user_id": user_id}, timeout=15)
+    assert_status(r, 200)
+    return r.headers.get("X-Cache", ""), get_json(r)
+
+
+def main():
+    args = parse_args()
+    base = args.base_url.rstrip("/")
+    user_id = f"{args.user_id} dashboard-{uuid.uuid4().hex[:8]}"
+
+    r = requests.get(f"{base}/dashboard/cache/stats", timeout=15)
+    assert_status(r, 200)
+    stats_before = get_json(r)
+
+    cache, first = summary(base, user_id)
+    if cache != "miss" or "timings_ms" not in first:
+        die(f"First summary should be computed with timings: X-Cache={cache!r}")
+
+    cache, again = summary(base, user_id)
+    if cache != "hit":
+        die(f"Second summary not served from the cache: X-Cache={cache!r}")
+    if "timings_ms" in again:
+        die("Cached summary still reports the timings of the request that computed it")
+    if again["totals"] != first["totals"]:
+        die("Cached summary differs from the computed one")
+    ok("Repeat summary served from cache")
+
+    r = requests.post(
+        f"{base}/projects",
+        json={"user_id": user_id, "title": "Dashboard cache project", "description": "Created by test", "tags": []},
+        timeout=15,
+    )
+    assert_status(r, 200)
+
+    cache, after = summary(base, user_id)
+    if cache != "miss":
+        die(f"Summary after a project write was served from the cache: X-Cache={cache!r}")
+    if after["totals"]["projects"] != first["totals"]["projects"] + 1:
+        die(f"New project not counted: {first['totals']} -> {after['totals']}")
+    ok("Project write invalidated the cached summary")
+
+    r = requests.get(f"{base}/dashboard/cache/stats", timeout=15)
+    assert_status(r, 200)
+    stats = get_json(r)
+    if stats["hits"] < stats_before["hits"] + 1 or stats["misses"] < stats_before["misses"] + 2:
+        die(f"Cache counters did not move: {stats_before} -> {stats}")
+
+    ok("UC 1.4 dashboard cache")
+    pretty(stats)
+
+
+if __name__ == "__main__":
+    main()
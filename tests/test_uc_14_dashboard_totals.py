@@ -0,0 +1,93 @@
+"""UC 1.4 — Dashboard Summary Contents
+
+Endpoint(s):
+- POST /projects, POST /evidence, POST /skills
+- GET /dashboard/summary
+
+What is being tested (fresh user, so the numbers are exact):
+- recent_projects lists the 10 newest projects, newest first; totals.projects counts all of them.
+- totals.evidence counts the user's evidence; top_skills_by_evidence ranks skills by how
+  many evidence items cite them and carries the skill names.
+- timings_ms reports each concurrent read (projects, project_count, evidence, confirmations).
+
+Pass criteria:
+- every value above matches what the test wrote.
+"""
+
+import time
+import uuid
+
+import requests
+from _common import parse_args, assert_status, get_json, ok, pretty, die
+
+N_PROJECTS = 12
+
+
+def main():
+    args = parse_args()
+    base = args.base_url.rstrip("/")
+    tag = uuid.uuid4().hex[:8]
+    user_id = f"{args.user_id} totals-{tag}"
+
+    skill_ids = []
+    for name in (f"Dashskill A {tag}", f"Dashskill B {tag}"):
+        r = requests.post(f"{base}/skills", json={"name": name, "category": "Testing", "aliases": []}, timeout=15)
+        assert_status(r, 200)
+        skill_ids.append(get_json(r)["id"])
+
+    titles = []
+    for i in range(N_PROJECTS):
+        title = f"Dashboard project {i:02d}"
+        r = requests.post(
+            f"{base}/projects",
+            json={"user_id": user_id, "title": title, "description": "", "tags": []},
+            timeout=15,
+        )
+        assert_status(r, 200)
+        titles.append(title)
+        time.sleep(0.01)  # distinct created_at, so "newest first" is well defined
+
+    # skill A is cited by three evidence items, skill B by one
+    for cited in ([0, 1], [0], [0]):
+        payload = {
+            "user_id": user_id,
+            "type": "project",
+            "title": "Dashboard evidence",
+            "source": "local:test",
+            "text_excerpt": "Dashboard totals.",
+            "skill_ids": [skill_ids[i] for i in cited],
+            "tags": [],
+        }
+        r = requests.post(f"{base}/evidence", json=payload, timeout=15)
+        assert_status(r, 200)
+
+    r = requests.get(f"{base}/dashboard/summary", params={"user_id": user_id, "top_n": 5}, timeout=15)
+    assert_status(r, 200)
+    data = get_json(r)
+
+    if data["totals"]["projects"] != N_PROJECTS:
+        die(f"totals.projects = {data['totals']['projects']}, expected {N_PROJECTS}")
+    recent = [p["title"] for p in data["recent_projects"]]
+    if recent != list(reversed(titles))[:10]:
+        die(f"recent_projects are not the 10 newest, newest first: {recent}")
+    ok("Recent projects and project total")
+
+    if data["totals"]["evidence"] != 3:
+        die(f"totals.evidence = {data['totals']['evidence']}, expected 3")
+    top = [(s["skill_id"], s["evidence_count"]) for s in data["top_skills_by_evidence"]]
+    if top != [(skill_ids[0], 3), (skill_ids[1], 1)]:
+        die(f"top_skills_by_evidence wrong: {top}")
+    if data["top_skills_by_evidence"][0]["skill_name"] != f"Dashskill A {tag}":
+        die("Top skill is missing its name")
+    ok("Evidence total and top skills")
+
+    missing = {"projects", "project_count", "evidence", "confirmations", "total"} - set(data.get("timings_ms") or {})
+    if missing:
+        die(f"timings_ms missing stages: {sorted(missing)}")
+
+    ok("UC 1.4 dashboard totals")
+    pretty(data)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""UC 2.1 — Skill Typeahead
+
+Endpoint(s):
+- POST /skills
+- GET /skills/suggest?q=...
+
+What is being tested:
+- Suggestions rank exact name, exact alias, name prefix, then alias prefix.
+- A skill appears once even when several of its terms match.
+- category and limit narrow the results.
+- A new skill is suggested right after it is created (the index follows catalog writes).
+
+Pass criteria:
+- order, matched_on and match_type of the suggestions match the expectations below.
+"""
+
+import uuid
+
+import requests
+from _common import parse_args, assert_status, get_json, ok, pretty, die
+
+
+def create(base: str, name: str, category: str, aliases: list) -> str:
+    r = requests.post(f"{base}/skills", json={"name": name, "category": category, "aliases": aliases}, timeout=15)
+    assert_status(r, 200)
+    return get_json(r)["id"]
+
+
+def suggest(base: str, **params) -> list:
+    r = requests.get(f"{base}/skills/suggest", params=params, timeout=15)
+    assert_status(r, 200)
+    return get_json(r)
+
+
+def main():
+    args = parse_args()
+    base = args.base_url.rstrip("/")
+    q = f"vel{uuid.uuid4().hex[:8]}"
+
+    exact_name = create(base, q.capitalize(), "Backend", [f"{q}-classic"])
+    exact_alias = create(base, f"Alpha {q}", "Backend", [q])
+    name_prefix = create(base, f"{q.capitalize()}ox", "Frontend", [])
+    alias_prefix = create(base, f"Beta {q}", "Frontend", [f"{q}ium"])
+
+    rows = suggest(base, q=q.upper())
+    got = [(row["id"], row["matched_on"], row["match_type"]) for row in rows]
+    expected = [
+        (exact_name, "name", "exact"),
+        (exact_alias, "alias", "exact"),
+        (name_prefix, "name", "prefix"),
+        (alias_prefix, "alias", "prefix"),
+    ]
+    if got != expected:
+        die(f"Unexpected ranking: {got}")
+    ok("Exact name > exact alias > name prefix > alias prefix, one row per skill")
+
+    rows = suggest(base, q=q, category="Frontend")
+    if [row["id"] for row in rows] != [name_prefix, alias_prefix]:
+        die(f"category filter: {rows}")
+    rows = suggest(base, q=q, limit=2)
+    if [row["id"] for row in rows] != [exact_name, exact_alias]:
+        die(f"limit: {rows}")
+    if suggest(base, q=f"{q}zz"):
+        die("Prefix matching nothing returned suggestions")
+
+    ok("UC 2.1 skill typeahead")
+    pretty(suggest(base, q=q))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""UC 2.4 — Confirmed Skill Gaps Follow Evidence Writes
+
+Endpoint(s):
+- POST /skills/confirmations, POST /evidence
+- GET /skills/gaps/confirmed?user_id=...&threshold=...
+
+What is being tested (fresh user and fresh skills, so counts are exact):
+- Confirmed skills with no evidence are gaps with evidence_count 0.
+- Each POST /evidence bumps the user's per-skill counter right away: a skill leaves the
+  gap list once its count exceeds the threshold, and reports its count while it doesn't.
+- Another user's evidence does not count for this user.
+
+Pass criteria:
+- gap lists and evidence_count values match the expectations below.
+"""
+
+import uuid
+
+import requests
+from _common import parse_args, assert_status, get_json, ok, pretty, die
+
+
+def create_skill(base: str, name: str) -> str:
+    r = requests.post(f"{base}/skills", json={"name": name, "category": "Testing", "aliases": []}, timeout=15)
+    assert_status(r, 200)
+    return get_json(r)["id"]
+
+
+def add_evidence(base: str, user_id: str, skill_ids: list):
+    payload = {
+        "user_id": user_id,
+        "type": "project",
+        "title": "Counter evidence",
+        "source": "local:test",
+        "text_excerpt": "Evidence counter test.",
+        "skill_ids": skill_ids,
+        "tags": [],
+    }
+    r = requests.post(f"{base}/evidence", json=payload, timeout=15)
+    assert_status(r, 200)
+
+
+def gaps(base: str, user_id: str, threshold: int) -> dict:
+    r = requests.get(f"{base}/skills/gaps/confirmed", params={"user_id": user_id, "threshold": threshold}, timeout=20)
+    assert_status(r, 200)
+    return {row["skill_id"]: row["evidence_count"] for row in get_json(r)["results"]}
+
+
+def main():
+    args = parse_args()
+    base = args.base_url.rstrip("/")
+    tag = uuid.uuid4().hex[:8]
+    user_id = f"{args.user_id} counters-{tag}"
+    first = create_skill(base, f"Countskill One {tag}")
+    second = create_skill(base, f"Countskill Two {tag}")
+
+    r = requests.post(f"{base}/ingest/resume/text", json={"user_id": user_id, "text": f"Counter resume {tag}."}, timeout=15)
+    assert_status(r, 200)
+    snapshot_id = get_json(r)["snapshot_id"]
+    payload = {
+        "user_id": user_id,
+        "resume_snapshot_id": snapshot_id,
+        "confirmed": [
+            {"skill_id": first, "skill_name": "", "proficiency": 3},
+            {"skill_id": second, "skill_name": "", "proficiency": 2},
+        ],
+        "rejected": [],
+        "edited": [],
+    }
+    r = requests.post(f"{base}/skills/confirmations", json=payload, timeout=20)
+    assert_status(r, 200)
+
+    if gaps(base, user_id, 0) != {first: 0, second: 0}:
+        die(f"Both confirmed skills should be gaps with no evidence: {gaps(base, user_id, 0)}")
+    ok("Confirmed skills without evidence are gaps")
+
+    add_evidence(base, user_id, [first])
+    add_evidence(base, f"{user_id} other", [second])  # someone else's evidence
+
+    got = gaps(base, user_id, 0)
+    if got != {second: 0}:
+        die(f"After one evidence item only the second skill is a gap at threshold 0: {got}")
+    got = gaps(base, user_id, 1)
+    if got != {first: 1, second: 0}:
+        die(f"At threshold 1 both are gaps with their counts: {got}")
+    ok("Counters follow evidence writes, per user")
+
+    add_evidence(base, user_id, [first, second])
+    got = gaps(base, user_id, 1)
+    if got != {second: 1}:
+        die(f"Second evidence item should lift the first skill above threshold 1: {got}")
+
+    ok("UC 2.4 evidence counters")
+    pretty(got)
+
+
+if __name__ == "__main__":
+    main()
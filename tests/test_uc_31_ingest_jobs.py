@@ -0,0 +1,169 @@
+"""UC 3.1 — Background Resume Ingestion Jobs
+
+Endpoint(s):
+- POST /ingest/jobs/resume/text, POST /ingest/jobs/resume/pdf   (202, queued job)
+- GET  /ingest/jobs/{job_id}, GET /ingest/jobs/{job_id}/events (SSE)
+- GET  /ingest/jobs?user_id=...
+
+What is being tested (fresh user and a fresh skill):
+- A text job runs parse -> snapshot -> extract in the background and finishes "done"
+  with the snapshot id and the extracted catalog skill.
+- The same text queued again finishes with deduplicated=true and the same snapshot.
+- The SSE stream ends with a "done" event carrying the finished job.
+- An unreadable PDF fails permanently after one attempt.
+- A job whose worker died (expired lease) is reclaimed and finished; one whose lease
+  expired on the last allowed attempt (INGEST_MAX_ATTEMPTS, 3 by default) is failed.
+- The list endpoint returns the user's jobs newest first; bad / unknown ids are 400 / 404.
+
+Notes:
+- The expired-lease jobs are written straight into the server's database through the
+  MongoDB at localhost:27017.
+
+Pass criteria:
+- job statuses, results and stream events match the expectations below.
+"""
+
+import json
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import requests
+from pymongo import MongoClient
+from _common import parse_args, assert_status, get_json, ok, pretty, die
+from test_uc_31_resume_ingestion_pdf import make_pdf
+
+MAX_ATTEMPTS = 3
+
+
+def wait_for(base: str, job_id: str, timeout: float = 60) -> dict:
+    deadline = time.monotonic() + timeout
+    while True:
+        r = requests.get(f"{base}/ingest/jobs/{job_id}", timeout=15)
+        assert_status(r, 200)
+        job = get_json(r)
+        if job["status"] in ("done", "failed"):
+            return job
+        if time.monotonic() > deadline:
+            die(f"Ingest job {job_id} did not finish: {job}")
+        time.sleep(0.5)
+
+
+def enqueue_text(base: str, user_id: str, text: str) -> dict:
+    r = requests.post(f"{base}/ingest/jobs/resume/text", json={"user_id": user_id, "text": text}, timeout=15)
+    assert_status(r, 202)
+    return get_json(r)
+
+
+def stream_events(base: str, job_id: str) -> list[tuple[str, dict]]:
+    events, name = [], None
+    with requests.get(f"{base}/ingest/jobs/{job_id}/events", stream=True, timeout=60) as r:
+        assert_status(r, 200)
+        for line in r.iter_lines(decode_unicode=True):
+            if line.startswith("event: "):
+                name = line[len("event: "):]
+            elif line.startswith("data: "):
+                events.append((name, json.loads(line[len("data: "):])))
+    return events
+
+
+def stale_job(user_id: str, text: str, attempts: int) -> dict:
+    long_ago = datetime.now(timezone.utc) - timedelta(hours=1)
+    return {
+        "kind": "resume_text",
+        "user_id": user_id,
+        "payload": {"text": text},
+        "status": "running",
+        "stage": "parse",
+        "attempts": attempts,
+        "error": None,
+        "result": None,
+        "worker_id": "dead-worker",
+        "lease_expires_at": long_ago,
+        "created_at": long_ago,
+        "updated_at": long_ago,
+    }
+
+
+def main():
+    args = parse_args()
+    base = args.base_url.rstrip("/")
+    tag = uuid.uuid4().hex[:8]
+    user_id = f"{args.user_id} ingest-{tag}"
+
+    skill_name = f"Ingestskill{tag}"
+    r = requests.post(f"{base}/skills", json={"name": skill_name, "category": "Testing", "aliases": []}, timeout=15)
+    assert_status(r, 200)
+    skill_id = get_json(r)["id"]
+    text = f"Background ingest resume {tag}. Five years building services with {skill_name} in production."
+
+    queued = enqueue_text(base, user_id, text)
+    if queued["status"] != "queued" or queued["kind"] != "resume_text":
+        die(f"POST should return the queued job: {queued}")
+    done = wait_for(base, queued["id"])
+    if done["status"] != "done" or done["result"]["deduplicated"]:
+        die(f"Text job should finish with a new snapshot: {done}")
+    if skill_id not in {e["skill_id"] for e in done["result"]["extracted"]}:
+        die(f"{skill_name} not extracted: {done['result']['extracted']}")
+    ok("Text job parsed, snapshotted and extracted in the background")
+
+    again = enqueue_text(base, user_id, text)
+    events = stream_events(base, again["id"])
+    if not events or events[-1][0] != "done":
+        die(f"SSE stream should end with a done event: {events}")
+    final = events[-1][1]
+    if final["result"]["snapshot_id"] != done["result"]["snapshot_id"] or not final["result"]["deduplicated"]:
+        die(f"Re-queued text should reuse the snapshot: {final['result']}")
+    ok("SSE stream ends with the finished job; re-queued text is deduplicated")
+
+    files = {"file": (f"broken-{tag}.pdf", f"not a pdf {tag}".encode(), "application/pdf")}
+    r = requests.post(f"{base}/ingest/jobs/resume/pdf", data={"user_id": user_id}, files=files, timeout=30)
+    assert_status(r, 202)
+    broken = wait_for(base, get_json(r)["id"])
+    if broken["status"] != "failed" or broken["attempts"] != 1 or not broken["error"]:
+        die(f"Unreadable PDF should fail on its first attempt: {broken}")
+    ok("Unreadable PDF fails without retries")
+
+    pdf = make_pdf(f"PDF ingest job {tag}. Built data services with {skill_name} and Python.")
+    r = requests.post(f"{base}/ingest/jobs/resume/pdf", data={"user_id": user_id}, files={"file": (f"r-{tag}.pdf", pdf, "application/pdf")}, timeout=30)
+    assert_status(r, 202)
+    pdf_job = wait_for(base, get_json(r)["id"])
+    if pdf_job["status"] != "done" or skill_id not in {e["skill_id"] for e in pdf_job["result"]["extracted"]}:
+        die(f"PDF job should finish and extract {skill_name}: {pdf_job}")
+    ok("PDF job finished in the background")
+
+    r = requests.get(f"{base}/health", timeout=15)
+    assert_status(r, 200)
+    queue = MongoClient("mongodb://localhost:27017")[get_json(r)["db"]]["jobs_queue"]
+    reclaim_id = queue.insert_one(stale_job(user_id, f"Reclaimed resume {tag}. Orphaned by a crashed worker.", 1)).inserted_id
+    exhausted_id = queue.insert_one(stale_job(user_id, f"Exhausted resume {tag}. Crashed on every attempt.", MAX_ATTEMPTS)).inserted_id
+
+    reclaimed = wait_for(base, str(reclaim_id))
+    if reclaimed["status"] != "done" or reclaimed["attempts"] != 2:
+        die(f"Expired lease should be reclaimed and finished on attempt 2: {reclaimed}")
+    exhausted = wait_for(base, str(exhausted_id))
+    if exhausted["status"] != "failed" or exhausted["attempts"] != MAX_ATTEMPTS:
+        die(f"Expired lease on the last attempt should fail the job: {exhausted}")
+    ok("Expired leases are reclaimed, or failed once attempts run out")
+
+    r = requests.get(f"{base}/ingest/jobs", params={"user_id": user_id}, timeout=15)
+    assert_status(r, 200)
+    rows = get_json(r)
+    expected = {queued["id"], again["id"], broken["id"], pdf_job["id"], str(reclaim_id), str(exhausted_id)}
+    if {row["id"] for row in rows} != expected:
+        die(f"List should return exactly this user's jobs: {[row['id'] for row in rows]}")
+    created = [datetime.fromisoformat(row["created_at"].replace("Z", "+00:00")) for row in rows]
+    if created != sorted(created, reverse=True):
+        die("List should be newest first")
+    ok("List returns the user's jobs newest first")
+
+    assert_status(requests.get(f"{base}/ingest/jobs/not-an-id", timeout=15), 400)
+    assert_status(requests.get(f"{base}/ingest/jobs/{'0' * 24}", timeout=15), 404)
+    ok("Bad job id is 400, unknown job is 404")
+
+    ok("UC 3.1 background ingestion")
+    pretty(done)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""UC 3.1 — Resume Ingestion Deduplication
+
+Endpoint(s):
+- POST /ingest/resume/text
+- POST /ingest/resume/pdf
+
+What is being tested:
+- Pasting the same text again (only whitespace differs) returns the existing snapshot
+  with deduplicated=true; concurrent identical pastes all land on one snapshot.
+- Dedupe is per user: another user pasting the same text gets a new snapshot.
+- Uploading the same PDF bytes again returns the existing snapshot with deduplicated=true.
+
+Pass criteria:
+- snapshot ids and deduplicated flags match the expectations below.
+"""
+
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from _common import parse_args, assert_status, get_json, ok, pretty, die
+from test_uc_31_resume_ingestion_pdf import make_pdf
+
+
+def paste(base: str, user_id: str, text: str) -> dict:
+    r = requests.post(f"{base}/ingest/resume/text", json={"user_id": user_id, "text": text}, timeout=15)
+    assert_status(r, 200)
+    return get_json(r)
+
+
+def upload(base: str, user_id: str, name: str, pdf: bytes) -> dict:
+    files = {"file": (name, pdf, "application/pdf")}
+    r = requests.post(f"{base}/ingest/resume/pdf", data={"user_id": user_id}, files=files, timeout=60)
+    assert_status(r, 200)
+    return get_json(r)
+
+
+def main():
+    args = parse_args()
+    base = args.base_url.rstrip("/")
+    tag = uuid.uuid4().hex[:8]
+    user_id = f"{args.user_id} dedupe-{tag}"
+    text = f"Dedupe resume {tag}. Shipped Kubernetes operators in Go."
+
+    first = paste(base, user_id, text)
+    if first["deduplicated"]:
+        die("First paste must create a snapshot")
+    again = paste(base, user_id, "  " + text.replace(" ", "  \n") + "\n")
+    if again["snapshot_id"] != first["snapshot_id"] or not again["deduplicated"]:
+        die(f"Re-paste should return the existing snapshot: {first} -> {again}")
+    ok("Re-pasted text returns the existing snapshot")
+
+    other = paste(base, f"{user_id} other", text)
+    if other["snapshot_id"] == first["snapshot_id"] or other["deduplicated"]:
+        die(f"Another user's paste must get its own snapshot: {other}")
+    ok("Dedupe is scoped to the user")
+
+    racy = f"Concurrent resume {tag}. Tuned PostgreSQL queries."
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        rows = list(pool.map(lambda _: paste(base, user_id, racy), range(8)))
+    ids = {row["snapshot_id"] for row in rows}
+    if len(ids) != 1 or sum(not row["deduplicated"] for row in rows) != 1:
+        die(f"Concurrent identical pastes should create exactly one snapshot: {rows}")
+    ok("Concurrent identical pastes create one snapshot")
+
+    pdf = make_pdf(f"Dedupe PDF {tag}. Maintained CI pipelines with GitHub Actions and Terraform.")
+    first_pdf = upload(base, user_id, f"resume-{tag}.pdf", pdf)
+    if first_pdf["deduplicated"]:
+        die("First upload must create a snapshot")
+    again_pdf = upload(base, user_id, f"renamed-{tag}.pdf", pdf)
+    if again_pdf["snapshot_id"] != first_pdf["snapshot_id"] or not again_pdf["deduplicated"]:
+        die(f"Re-upload should return the existing snapshot: {first_pdf} -> {again_pdf}")
+    ok("Re-uploaded PDF returns the existing snapshot")
+
+    ok("UC 3.1 ingestion dedupe")
+    pretty(again_pdf)
+
+
+if __name__ == "__main__":
+    main()
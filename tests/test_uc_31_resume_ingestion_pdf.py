@@ -0,0 +1,85 @@
+"""UC 3.1 — Resume Ingestion (PDF Upload)
+
+Endpoint(s):
+- POST /ingest/resume/pdf
+- GET /health/pdf_pool
+
+What is being tested:
+- A small generated PDF is parsed in the PDF process pool and stored as a snapshot.
+- A file named .pdf that is not a PDF is rejected with 400.
+- The pool's counters record both parses and every parse slot is free again afterwards.
+
+Pass criteria:
+- HTTP 200 with the PDF's text in the preview; HTTP 400 for the broken file
+- /health/pdf_pool: completed and failed each went up, running == 0 and queued == 0
+"""
+
+import uuid
+
+import requests
+from _common import parse_args, assert_status, get_json, ok, pretty, die
+
+
+def make_pdf(text: str) -> bytes:
+    """Single-page PDF showing `text` in Helvetica, with a correct xref table."""
+    stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode("latin-1")
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R "
+        b"/Resources << /Font << /F1 5 0 R >> >> >>",
+        b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for i, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % i + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % off for off in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return out
+
+
+def pool_stats(base: str) -> dict:
+    r = requests.get(f"{base}/health/pdf_pool", timeout=15)
+    assert_status(r, 200)
+    return get_json(r)
+
+
+def main():
+    args = parse_args()
+    base = args.base_url.rstrip("/")
+    tag = uuid.uuid4().hex[:8]
+    before = pool_stats(base)
+
+    text = f"PDF resume {tag}. Built REST services in Python and FastAPI backed by MongoDB."
+    files = {"file": (f"resume-{tag}.pdf", make_pdf(text), "application/pdf")}
+    r = requests.post(f"{base}/ingest/resume/pdf", data={"user_id": args.user_id}, files=files, timeout=60)
+    assert_status(r, 200)
+    snap = get_json(r)
+    if tag not in (snap.get("preview") or ""):
+        die(f"Parsed text missing from preview: {snap.get('preview')!r}")
+    ok("PDF parsed in the pool")
+
+    files = {"file": (f"broken-{tag}.pdf", f"not a pdf {tag}".encode(), "application/pdf")}
+    r = requests.post(f"{base}/ingest/resume/pdf", data={"user_id": args.user_id}, files=files, timeout=60)
+    assert_status(r, 400)
+    ok("Unreadable PDF rejected")
+
+    after = pool_stats(base)
+    if after["completed"] < before["completed"] + 1:
+        die(f"completed counter did not move: {before} -> {after}")
+    if after["failed"] < before["failed"] + 1:
+        die(f"failed counter did not move: {before} -> {after}")
+    if after["running"] != 0 or after["queued"] != 0:
+        die(f"Parse slots still held after both uploads returned: {after}")
+
+    ok("UC 3.1 PDF ingestion")
+    pretty(after)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""UC 3.1 — Size-Capped Resume Upload with Stored Originals
+
+Endpoint(s):
+- POST /ingest/resume/pdf
+- GET /health   (database name)
+
+What is being tested:
+- An upload over the size cap (RESUME_UPLOAD_MAX_BYTES, 10 MiB by default) is refused
+  with 413 and no snapshot is written.
+- A valid PDF's original bytes are stored in the `resume_files` GridFS bucket under their
+  sha256, and the snapshot's metadata only keeps the reference (file_id, sha256, size).
+- The stored bytes read back identical to the upload.
+- Six users uploading the same new PDF at once end up sharing one GridFS file (unique
+  index on the bucket's filename), and no orphaned chunks are left behind.
+
+Notes:
+- Reads the server's database directly through the MongoDB at localhost:27017.
+
+Pass criteria:
+- HTTP 413 for the oversized file; GridFS entry and snapshot metadata as described.
+"""
+
+import hashlib
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import gridfs
+import requests
+from bson import ObjectId
+from pymongo import MongoClient
+from _common import parse_args, assert_status, get_json, ok, pretty, die
+from test_uc_31_resume_ingestion_pdf import make_pdf
+
+OVERSIZED = 11 * 1024 * 1024
+
+
+def main():
+    args = parse_args()
+    base = args.base_url.rstrip("/")
+    tag = uuid.uuid4().hex[:8]
+    user_id = f"{args.user_id} upload-{tag}"
+
+    r = requests.get(f"{base}/health", timeout=15)
+    assert_status(r, 200)
+    db = MongoClient("mongodb://localhost:27017")[get_json(r)["db"]]
+
+    files = {"file": (f"huge-{tag}.pdf", b"%PDF-1.4\n" + b"0" * OVERSIZED, "application/pdf")}
+    r = requests.post(f"{base}/ingest/resume/pdf", data={"user_id": user_id}, files=files, timeout=120)
+    assert_status(r, 413)
+    if db["resume_snapshots"].count_documents({"user_id": user_id}):
+        die("An oversized upload must not create a snapshot")
+    ok("Oversized upload refused with 413")
+
+    pdf = make_pdf(f"Stored resume {tag}. Designed data pipelines in Python, Airflow and PostgreSQL.")
+    sha256 = hashlib.sha256(pdf).hexdigest()
+    files = {"file": (f"resume-{tag}.pdf", pdf, "application/pdf")}
+    r = requests.post(f"{base}/ingest/resume/pdf", data={"user_id": user_id}, files=files, timeout=60)
+    assert_status(r, 200)
+    snap = db["resume_snapshots"].find_one({"_id": ObjectId(get_json(r)["snapshot_id"])})
+    meta = snap["metadata"]
+    if meta.get("sha256") != sha256 or meta.get("size") != len(pdf) or meta.get("filename") != f"resume-{tag}.pdf":
+        die(f"Snapshot metadata does not reference the upload: {meta}")
+    if not isinstance(meta.get("file_id"), ObjectId):
+        die(f"Snapshot metadata has no GridFS file_id: {meta}")
+
+    stored = db["resume_files.files"].find_one({"_id": meta["file_id"]})
+    if not stored or stored["filename"] != sha256:
+        die(f"GridFS file should be stored under the upload's sha256: {stored}")
+    if gridfs.GridFSBucket(db, bucket_name="resume_files").open_download_stream(meta["file_id"]).read() != pdf:
+        die("Stored original differs from the uploaded bytes")
+    ok("Original stored in GridFS under its hash; snapshot keeps the reference")
+
+    shared = make_pdf(f"Shared resume {tag}. Uploaded by several people at the same moment.")
+    shared_sha = hashlib.sha256(shared).hexdigest()
+
+    def upload(n: int) -> str:
+        files = {"file": (f"shared-{n}-{tag}.pdf", shared, "application/pdf")}
+        r = requests.post(f"{base}/ingest/resume/pdf", data={"user_id": f"{user_id}-{n}"}, files=files, timeout=60)
+        assert_status(r, 200)
+        return get_json(r)["snapshot_id"]
+
+    with ThreadPoolExecutor(max_workers=6) as ex:
+        snapshot_ids = list(ex.map(upload, range(6)))
+    stored = list(db["resume_files.files"].find({"filename": shared_sha}, {"_id": 1}))
+    if len(stored) != 1:
+        die(f"Concurrent uploads of the same bytes should share one GridFS file: {stored}")
+    file_ids = {db["resume_snapshots"].find_one({"_id": ObjectId(s)})["metadata"]["file_id"] for s in snapshot_ids}
+    if file_ids != {stored[0]["_id"]}:
+        die(f"Every snapshot should reference the shared file: {file_ids}")
+    live = set(db["resume_files.files"].distinct("_id"))
+    if set(db["resume_files.chunks"].distinct("files_id")) - live:
+        die("Losing concurrent uploads left orphaned GridFS chunks")
+    ok("Concurrent uploads of the same bytes share one stored file")
+
+    ok("UC 3.1 upload cap and original storage")
+    pretty({"file_id": str(meta["file_id"]), "sha256": sha256, "size": meta["size"]})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""UC 3.2 — Extraction Result Cache
+
+Endpoint(s):
+- POST /skills/extract/skills/{snapshot_id}
+- POST /skills/extract/batch
+- GET /health/extraction_cache
+
+What is being tested:
+- Extracting the same snapshot twice returns cached=true the second time with the original
+  created_at (no second skill_extractions doc).
+- A different snapshot with the same text is served from the cache but gets its own
+  extraction (a new created_at).
+- The batch endpoint reports both snapshots as cached (answered from their stored docs).
+- Two new snapshots with the same text in one batch are extracted once and each stored
+  once; retrying either of them returns the stored created_at.
+- The cache hit counter goes up.
+
+Pass criteria:
+- cached flags, created_at values and extracted skills behave as above.
+"""
+
+import uuid
+from datetime import datetime
+
+import requests
+from _common import parse_args, assert_status, get_json, ok, pretty, die
+
+
+def ingest(base: str, user_id: str, text: str) -> str:
+    r = requests.post(f"{base}/ingest/resume/text", json={"user_id": user_id, "text": text}, timeout=15)
+    assert_status(r, 200)
+    return get_json(r)["snapshot_id"]
+
+
+def extract(base: str, snapshot_id: str) -> dict:
+    r = requests.post(f"{base}/skills/extract/skills/{snapshot_id}", timeout=25)
+    assert_status(r, 200)
+    return get_json(r)
+
+
+def ts(value: str) -> datetime:
+    # JSON datetimes may end in Z or +00:00 depending on the serializer
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def skill_ids(extracted: list) -> list:
+    return sorted(e["skill_id"] for e in extracted)
+
+
+def main():
+    args = parse_args()
+    base = args.base_url.rstrip("/")
+    tag = uuid.uuid4().hex[:8]
+
+    r = requests.post(f"{base}/skills", json={"name": "Python", "category": "Programming", "aliases": ["python3"]}, timeout=15)
+    if r.status_code not in (200, 409):
+        assert_status(r, 200)
+
+    text = (
+        f"Extraction cache resume {tag}. Built data pipelines in Python and shipped "
+        "REST services; mentored two interns."
+    )
+    first_snapshot = ingest(base, args.user_id, text)
+    # same text under another user is a separate snapshot (dedupe is per user)
+    second_snapshot = ingest(base, f"{args.user_id} cache-{tag}", text)
+    if first_snapshot == second_snapshot:
+        die("Expected two snapshots for two users")
+
+    r = requests.get(f"{base}/health/extraction_cache", timeout=15)
+    assert_status(r, 200)
+    hits_before = get_json(r)["hits"]
+
+    first = extract(base, first_snapshot)
+    if first["cached"]:
+        die("First extraction of new text reported cached=true")
+
+    retry = extract(base, first_snapshot)
+    if not retry["cached"]:
+        die("Re-extracting the same snapshot was not served from the cache")
+    if ts(retry["created_at"]) != ts(first["created_at"]):
+        die("Cache hit for the same snapshot stored a new extraction")
+    ok("Retried snapshot served from cache without a new extraction doc")
+
+    second = extract(base, second_snapshot)
+    if not second["cached"]:
+        die("Same text in another snapshot was not served from the cache")
+    if ts(second["created_at"]) == ts(first["created_at"]):
+        die("Second snapshot did not get its own extraction")
+    if skill_ids(second["extracted"]) != skill_ids(first["extracted"]):
+        die("Cached extraction differs from the original")
+    ok("New snapshot with the same text got its own extraction from the cache")
+
+    r = requests.post(f"{base}/skills/extract/batch", json={"snapshot_ids": [first_snapshot, second_snapshot]}, timeout=25)
+    assert_status(r, 200)
+    batch = get_json(r)
+    statuses = [row["status"] for row in batch["results"]]
+    if statuses != ["cached", "cached"]:
+        die(f"Batch should serve both snapshots from the cache: {statuses}")
+    if [ts(row["created_at"]) for row in batch["results"]] != [ts(first["created_at"]), ts(second["created_at"])]:
+        die("Batch stored new extractions for snapshots that already had one")
+
+    r = requests.get(f"{base}/health/extraction_cache", timeout=15)
+    assert_status(r, 200)
+    stats = get_json(r)
+    if stats["hits"] < hits_before + 2:
+        die(f"Expected at least 2 new cache hits: {stats}")
+    ok("Batch answers stored snapshots without new extractions")
+
+    twin_text = f"Twin resume {tag}. Operated Kubernetes clusters and wrote Python tooling for deploys."
+    twins = [ingest(base, f"{args.user_id} twin-{n}-{tag}", twin_text) for n in (1, 2)]
+    r = requests.post(f"{base}/skills/extract/batch", json={"snapshot_ids": twins}, timeout=25)
+    assert_status(r, 200)
+    rows = get_json(r)["results"]
+    if [row["status"] for row in rows] != ["extracted", "extracted"]:
+        die(f"Both new twins should be extracted: {rows}")
+    if skill_ids(rows[0]["extracted"]) != skill_ids(rows[1]["extracted"]):
+        die("Twins with the same text got different skills")
+    for snapshot_id, row in zip(twins, rows):
+        retry = extract(base, snapshot_id)
+        if not retry["cached"] or ts(retry["created_at"]) != ts(row["created_at"]):
+            die(f"Retrying twin {snapshot_id} stored a second extraction: {row['created_at']} -> {retry['created_at']}")
+    r = requests.post(f"{base}/skills/extract/batch", json={"snapshot_ids": twins}, timeout=25)
+    assert_status(r, 200)
+    again = get_json(r)["results"]
+    if [ts(row["created_at"]) for row in again] != [ts(row["created_at"]) for row in rows]:
+        die("Re-running the batch stored new extractions for the twins")
+    ok("Identical texts in one batch are stored once per snapshot")
+
+    ok("UC 3.2 extraction cache")
+    pretty(stats)
+
+
+if __name__ == "__main__":
+    main()
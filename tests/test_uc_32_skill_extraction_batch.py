@@ -0,0 +1,82 @@
+"""UC 3.2 — Batch Skill Extraction
+
+Endpoint(s):
+- POST /skills/extract/batch
+- POST /skills/extract/skills/{snapshot_id}
+
+What is being tested:
+- One call extracts many snapshots (in the extraction process pool) and returns one
+  result per distinct id, in request order.
+- Ids that are malformed, unknown or point at too-short text get invalid_id, not_found
+  and too_short instead of failing the batch; an id in uppercase hex is reported in its
+  canonical lowercase form.
+- The batch stores and caches its results: extracting one of those snapshots afterwards
+  returns the same skills from the cache.
+
+Pass criteria:
+- statuses, ordering and extracted skills match the expectations below.
+"""
+
+import uuid
+
+import requests
+from _common import parse_args, assert_status, get_json, ok, pretty, die
+
+
+def ingest(base: str, user_id: str, text: str) -> str:
+    r = requests.post(f"{base}/ingest/resume/text", json={"user_id": user_id, "text": text}, timeout=15)
+    assert_status(r, 200)
+    return get_json(r)["snapshot_id"]
+
+
+def main():
+    args = parse_args()
+    base = args.base_url.rstrip("/")
+    tag = uuid.uuid4().hex[:8]
+
+    for name in ("Python", "MongoDB"):
+        requests.post(f"{base}/skills", json={"name": name, "category": "Programming", "aliases": []}, timeout=15)
+
+    python_snap = ingest(base, args.user_id, f"Batch resume {tag} one. Five years of Python, building ETL jobs and APIs.")
+    mongo_snap = ingest(base, args.user_id, f"Batch resume {tag} two. Operated MongoDB replica sets and tuned slow queries.")
+    short_snap = ingest(base, args.user_id, f"Short {tag}")
+    missing = "6500000000000000000000ff"
+
+    # uppercase hex is the same snapshot; results report the canonical id
+    ids = [python_snap, "not-an-id", mongo_snap.upper(), short_snap, missing, python_snap]
+    r = requests.post(f"{base}/skills/extract/batch", json={"snapshot_ids": ids}, timeout=60)
+    assert_status(r, 200)
+    data = get_json(r)
+
+    got = [(row["snapshot_id"], row["status"]) for row in data["results"]]
+    expected = [
+        (python_snap, "extracted"),
+        ("not-an-id", "invalid_id"),
+        (mongo_snap, "extracted"),
+        (short_snap, "too_short"),
+        (missing, "not_found"),
+    ]
+    if got != expected:
+        die(f"Unexpected batch results: {got}")
+    ok("One result per distinct id, in request order")
+
+    rows = {row["snapshot_id"]: row for row in data["results"]}
+    if "python" not in {e["skill_name"].lower() for e in rows[python_snap]["extracted"]}:
+        die("Python not extracted from the first snapshot")
+    if "mongodb" not in {e["skill_name"].lower() for e in rows[mongo_snap]["extracted"]}:
+        die("MongoDB not extracted from the second snapshot")
+
+    r = requests.post(f"{base}/skills/extract/skills/{python_snap}", timeout=25)
+    assert_status(r, 200)
+    single = get_json(r)
+    if not single["cached"]:
+        die("Single extraction after the batch was not served from the cache")
+    if sorted(e["skill_id"] for e in single["extracted"]) != sorted(e["skill_id"] for e in rows[python_snap]["extracted"]):
+        die("Single and batch extraction disagree")
+
+    ok("UC 3.2 batch skill extraction")
+    pretty(data)
+
+
+if __name__ == "__main__":
+    main()
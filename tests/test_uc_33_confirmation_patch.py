@@ -0,0 +1,106 @@
+"""UC 3.3 — Incremental Confirmation Changes
+
+Endpoint(s):
+- PATCH /skills/confirmations/{confirmation_id}
+- GET   /skills/confirmations?user_id=...
+
+What is being tested (fresh user and fresh skills, so the arrays are exact):
+- add / remove / set_proficiency / reject / unreject each change only the named skills.
+- add is idempotent: a skill is confirmed at most once.
+- add pulls the skill out of rejected; reject pulls it out of confirmed.
+- `modified` counts the requested changes that actually took effect.
+- Another user's id, an unknown skill and a malformed id are 404 / 404 / 400.
+
+Pass criteria:
+- the stored confirmation matches the expected arrays after every step.
+"""
+
+import uuid
+
+import requests
+from _common import parse_args, assert_status, get_json, ok, pretty, die
+
+
+def create_skill(base: str, name: str) -> str:
+    r = requests.post(f"{base}/skills", json={"name": name, "category": "Testing", "aliases": []}, timeout=15)
+    assert_status(r, 200)
+    return get_json(r)["id"]
+
+
+def patch(base: str, conf_id: str, body: dict):
+    return requests.patch(f"{base}/skills/confirmations/{conf_id}", json=body, timeout=20)
+
+
+def state(base: str, user_id: str) -> tuple[dict, set]:
+    r = requests.get(f"{base}/skills/confirmations", params={"user_id": user_id}, timeout=15)
+    assert_status(r, 200)
+    rows = get_json(r)
+    if len(rows) != 1:
+        die(f"Expected one confirmation for {user_id}, found {len(rows)}")
+    conf = rows[0]
+    confirmed = {c["skill_id"]: c["proficiency"] for c in conf["confirmed"]}
+    if len(confirmed) != len(conf["confirmed"]):
+        die(f"A skill is confirmed more than once: {conf['confirmed']}")
+    return confirmed, {x["skill_id"] for x in conf["rejected"]}
+
+
+def main():
+    args = parse_args()
+    base = args.base_url.rstrip("/")
+    tag = uuid.uuid4().hex[:8]
+    user_id = f"{args.user_id} patch-{tag}"
+    a, b, c = (create_skill(base, f"Patchskill {n} {tag}") for n in ("A", "B", "C"))
+
+    r = requests.post(f"{base}/ingest/resume/text", json={"user_id": user_id, "text": f"Patch resume {tag}."}, timeout=15)
+    assert_status(r, 200)
+    snapshot_id = get_json(r)["snapshot_id"]
+    r = requests.post(
+        f"{base}/skills/confirmations",
+        json={
+            "user_id": user_id,
+            "resume_snapshot_id": snapshot_id,
+            "confirmed": [{"skill_id": a, "skill_name": "", "proficiency": 2}],
+            "rejected": [{"skill_id": b, "skill_name": ""}],
+            "edited": [],
+        },
+        timeout=20,
+    )
+    assert_status(r, 200)
+    conf_id = get_json(r)["id"]
+
+    steps = [
+        ("add", {"add": [{"skill_id": c, "proficiency": 3}]}, 1, ({a: 2, c: 3}, {b})),
+        ("add again", {"add": [{"skill_id": c, "proficiency": 5}]}, 0, ({a: 2, c: 3}, {b})),
+        ("set_proficiency", {"set_proficiency": [{"skill_id": a, "proficiency": 5}]}, 1, ({a: 5, c: 3}, {b})),
+        ("reject", {"reject": [a]}, 2, ({c: 3}, {a, b})),
+        ("add a rejected skill", {"add": [{"skill_id": b, "proficiency": 1}]}, 2, ({c: 3, b: 1}, {a})),
+        ("unreject", {"unreject": [a]}, 1, ({c: 3, b: 1}, set())),
+        ("remove", {"remove": [c]}, 1, ({b: 1}, set())),
+    ]
+    for label, body, modified, expected in steps:
+        r = patch(base, conf_id, {"user_id": user_id, **body})
+        assert_status(r, 200)
+        out = get_json(r)
+        if out["id"] != conf_id or out["modified"] != modified:
+            die(f"{label}: expected modified={modified}, got {out}")
+        got = state(base, user_id)
+        if got != expected:
+            die(f"{label}: expected {expected}, got {got}")
+        ok(f"PATCH {label}")
+
+    r = patch(base, conf_id, {"user_id": f"{user_id} other", "remove": [b]})
+    assert_status(r, 404)
+    if state(base, user_id) != ({b: 1}, set()):
+        die("Another user's PATCH must not change the confirmation")
+    ok("PATCH is scoped to the owner")
+
+    r = patch(base, conf_id, {"user_id": user_id, "add": [{"skill_id": "0" * 24, "proficiency": 1}]})
+    assert_status(r, 404)
+    r = patch(base, "not-an-id", {"user_id": user_id, "remove": [b]})
+    assert_status(r, 400)
+    ok("Unknown skill is 404, malformed confirmation id is 400")
+    pretty(state(base, user_id)[0])
+
+
+if __name__ == "__main__":
+    main()
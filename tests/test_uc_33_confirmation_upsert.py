@@ -0,0 +1,110 @@
+"""UC 3.3 — Confirmation Upsert Is Atomic and Resolves Skill Names
+
+Endpoint(s):
+- POST /skills/confirmations
+- GET  /skills/confirmations?user_id=...
+
+What is being tested (fresh user, so the confirmation count is exact):
+- Skill names in the stored confirmation come from the catalog, not the payload.
+- Upserting again for the same (user_id, resume_snapshot_id) replaces the arrays on the
+  same document: same id, unchanged created_at.
+- Concurrent upserts for one snapshot still leave a single confirmation.
+- An unknown skill id anywhere in the payload is a 404 and writes nothing.
+
+Pass criteria:
+- one confirmation per snapshot, with the expected entries and names.
+"""
+
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from _common import parse_args, assert_status, get_json, ok, pretty, die
+
+
+def create_skill(base: str, name: str) -> str:
+    r = requests.post(f"{base}/skills", json={"name": name, "category": "Testing", "aliases": []}, timeout=15)
+    assert_status(r, 200)
+    return get_json(r)["id"]
+
+
+def upsert(base: str, payload: dict):
+    return requests.post(f"{base}/skills/confirmations", json=payload, timeout=20)
+
+
+def list_confirmations(base: str, user_id: str) -> list:
+    r = requests.get(f"{base}/skills/confirmations", params={"user_id": user_id}, timeout=15)
+    assert_status(r, 200)
+    return get_json(r)
+
+
+def main():
+    args = parse_args()
+    base = args.base_url.rstrip("/")
+    tag = uuid.uuid4().hex[:8]
+    user_id = f"{args.user_id} upsert-{tag}"
+    first_name, second_name = f"Upsertskill One {tag}", f"Upsertskill Two {tag}"
+    first = create_skill(base, first_name)
+    second = create_skill(base, second_name)
+
+    r = requests.post(f"{base}/ingest/resume/text", json={"user_id": user_id, "text": f"Upsert resume {tag}."}, timeout=15)
+    assert_status(r, 200)
+    snapshot_id = get_json(r)["snapshot_id"]
+
+    payload = {
+        "user_id": user_id,
+        "resume_snapshot_id": snapshot_id,
+        "confirmed": [{"skill_id": first, "skill_name": "stale name", "proficiency": 2}],
+        "rejected": [{"skill_id": second, "skill_name": ""}],
+        "edited": [{"from_text": "upsrt one", "to_skill_id": first}],
+    }
+    r = upsert(base, payload)
+    assert_status(r, 200)
+    conf = get_json(r)
+    if [(c["skill_id"], c["skill_name"], c["proficiency"]) for c in conf["confirmed"]] != [(first, first_name, 2)]:
+        die(f"Confirmed entry should carry the catalog name: {conf['confirmed']}")
+    if [(x["skill_id"], x["skill_name"]) for x in conf["rejected"]] != [(second, second_name)]:
+        die(f"Rejected entry should carry the catalog name: {conf['rejected']}")
+    if [(e["from_text"], e["to_skill_id"]) for e in conf["edited"]] != [("upsrt one", first)]:
+        die(f"Edited entry mismatch: {conf['edited']}")
+    ok("Upsert stores catalog skill names")
+
+    payload["confirmed"] = [
+        {"skill_id": first, "skill_name": "", "proficiency": 4},
+        {"skill_id": second, "skill_name": "", "proficiency": 1},
+    ]
+    payload["rejected"] = []
+    payload["edited"] = []
+    r = upsert(base, payload)
+    assert_status(r, 200)
+    again = get_json(r)
+    if again["id"] != conf["id"] or again["created_at"] != conf["created_at"]:
+        die(f"Second upsert should update the same document: {conf['id']} -> {again['id']}")
+    if {c["skill_id"]: c["proficiency"] for c in again["confirmed"]} != {first: 4, second: 1} or again["rejected"]:
+        die(f"Second upsert should replace the arrays: {again}")
+    ok("Second upsert replaces the arrays on the same document")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        codes = [resp.status_code for resp in pool.map(lambda _: upsert(base, payload), range(8))]
+    if any(c != 200 for c in codes):
+        die(f"Concurrent upserts should all succeed: {codes}")
+    rows = list_confirmations(base, user_id)
+    if [x["id"] for x in rows] != [conf["id"]]:
+        die(f"Concurrent upserts should leave one confirmation, found {len(rows)}")
+    ok("Concurrent upserts leave a single confirmation")
+
+    missing = "0" * 24
+    bad = dict(payload, rejected=[{"skill_id": missing, "skill_name": "Ghost"}])
+    r = upsert(base, bad)
+    assert_status(r, 404)
+    if missing not in r.text:
+        die(f"404 should name the unknown skill id: {r.text}")
+    rows = list_confirmations(base, user_id)
+    if rows[0]["rejected"]:
+        die("A rejected upsert must not write anything")
+    ok("Unknown skill id is a 404 and writes nothing")
+    pretty(rows[0])
+
+
+if __name__ == "__main__":
+    main()
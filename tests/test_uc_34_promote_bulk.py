@@ -0,0 +1,113 @@
+"""UC 3.4 — Promotion Is Batched and Idempotent
+
+Endpoint(s):
+- POST /ingest/resume/{snapshot_id}/promote
+- GET  /projects/{project_id}/skills
+- GET  /evidence?user_id=...&project_id=...
+
+What is being tested (fresh user and fresh skills, so counts are exact; unlike
+test_uc_34_promote.py this needs no SNAPSHOT_ID):
+- Promoting a confirmation creates one resume project, one project-skill link and one
+  evidence record per confirmed skill.
+- Promoting again creates nothing new and reuses the same project.
+- A skill confirmed later is the only thing the next promotion adds.
+- 404 when the user has no confirmation for the snapshot.
+
+Pass criteria:
+- promoted counts, links and evidence match the expectations below.
+"""
+
+import uuid
+
+import requests
+from _common import parse_args, assert_status, get_json, ok, pretty, die
+
+
+def create_skill(base: str, name: str) -> str:
+    r = requests.post(f"{base}/skills", json={"name": name, "category": "Testing", "aliases": []}, timeout=15)
+    assert_status(r, 200)
+    return get_json(r)["id"]
+
+
+def promote(base: str, snapshot_id: str, user_id: str):
+    return requests.post(f"{base}/ingest/resume/{snapshot_id}/promote", data={"user_id": user_id}, timeout=20)
+
+
+def promoted_state(base: str, user_id: str, project_id: str) -> tuple[list, list]:
+    r = requests.get(f"{base}/projects/{project_id}/skills", timeout=15)
+    assert_status(r, 200)
+    links = sorted(row["skill_id"] for row in get_json(r))
+    r = requests.get(f"{base}/evidence", params={"user_id": user_id, "project_id": project_id}, timeout=15)
+    assert_status(r, 200)
+    evidence = sorted(sid for row in get_json(r) for sid in row["skill_ids"])
+    return links, evidence
+
+
+def main():
+    args = parse_args()
+    base = args.base_url.rstrip("/")
+    tag = uuid.uuid4().hex[:8]
+    user_id = f"{args.user_id} promote-{tag}"
+    skills = [create_skill(base, f"Promoteskill {n} {tag}") for n in range(4)]
+
+    r = requests.post(f"{base}/ingest/resume/text", json={"user_id": user_id, "text": f"Promote resume {tag}."}, timeout=15)
+    assert_status(r, 200)
+    snapshot_id = get_json(r)["snapshot_id"]
+
+    assert_status(promote(base, snapshot_id, user_id), 404)
+    ok("No confirmation yet: 404")
+
+    r = requests.post(
+        f"{base}/skills/confirmations",
+        json={
+            "user_id": user_id,
+            "resume_snapshot_id": snapshot_id,
+            "confirmed": [{"skill_id": sid, "skill_name": "", "proficiency": 3} for sid in skills[:3]],
+            "rejected": [],
+            "edited": [],
+        },
+        timeout=20,
+    )
+    assert_status(r, 200)
+    conf_id = get_json(r)["id"]
+
+    r = promote(base, snapshot_id, user_id)
+    assert_status(r, 200)
+    first = get_json(r)
+    if first["promoted"] != 3 or not first["project_id"]:
+        die(f"First promotion should promote 3 skills: {first}")
+    expected = sorted(skills[:3])
+    if promoted_state(base, user_id, first["project_id"]) != (expected, expected):
+        die(f"Expected one link and one evidence per skill: {promoted_state(base, user_id, first['project_id'])}")
+    ok("Promotion links and records every confirmed skill once")
+
+    r = promote(base, snapshot_id, user_id)
+    assert_status(r, 200)
+    again = get_json(r)
+    if again["promoted"] != 0 or again["project_id"] != first["project_id"]:
+        die(f"Re-promotion should add nothing and reuse the project: {again}")
+    if promoted_state(base, user_id, first["project_id"]) != (expected, expected):
+        die("Re-promotion must not duplicate links or evidence")
+    ok("Re-promotion is a no-op")
+
+    r = requests.patch(
+        f"{base}/skills/confirmations/{conf_id}",
+        json={"user_id": user_id, "add": [{"skill_id": skills[3], "proficiency": 2}]},
+        timeout=20,
+    )
+    assert_status(r, 200)
+    r = promote(base, snapshot_id, user_id)
+    assert_status(r, 200)
+    later = get_json(r)
+    if later["promoted"] != 1:
+        die(f"Only the newly confirmed skill should be promoted: {later}")
+    if promoted_state(base, user_id, first["project_id"]) != (sorted(skills), sorted(skills)):
+        die("The new skill should be linked and recorded once")
+    ok("A later confirmation promotes only the new skill")
+
+    ok("UC 3.4 batched promotion")
+    pretty(later)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""UC 4.1 — Batch Moderation
+
+Endpoint(s):
+- POST /jobs/moderate   (job_ids or filter)
+- GET  /roles/{role_id}/weights
+
+What is being tested (fresh role, skills and postings, so weights are exact):
+- job_ids mode: duplicates collapse, results keep request order, malformed ids are
+  "invalid_id" and unknown ids "not_found".
+- filter mode moderates exactly the matching postings.
+- roles_refreshing lists a role only when one of its postings entered or left "approved",
+  and the role's weights are recomputed in the background.
+- Sending both or neither of job_ids / filter is a 400.
+- A legacy posting with no moderation_status counts as approved everywhere: GET /jobs
+  lists it as approved (and under status=approved), role weights count it, re-approving
+  it refreshes nothing and rejecting it refreshes its role.
+
+Notes:
+- The legacy posting is written straight into the server's database through the
+  MongoDB at localhost:27017.
+
+Pass criteria:
+- results, roles_refreshing and recomputed weights match the expectations below.
+"""
+
+import time
+import uuid
+from datetime import datetime, timezone
+
+import requests
+from bson import ObjectId
+from pymongo import MongoClient
+from _common import parse_args, assert_status, get_json, ok, pretty, die
+
+DESCRIPTIONS = [
+    "Warehouse coordinator {tag}: schedule inbound freight, reconcile pallet counts and keep the dock safe.",
+    "Frontend developer {tag}: build accessible React components, write Storybook stories and tune bundle size.",
+    "Clinical data analyst {tag}: clean trial datasets, produce SAS listings and answer regulator queries.",
+]
+
+
+def moderate(base: str, body: dict, expected: int = 200):
+    r = requests.post(f"{base}/jobs/moderate", json=body, timeout=20)
+    assert_status(r, expected)
+    return get_json(r) if expected == 200 else None
+
+
+def wait_for_weights(base: str, role_id: str, expected: dict, timeout: float = 20) -> dict:
+    deadline = time.monotonic() + timeout
+    while True:
+        r = requests.get(f"{base}/roles/{role_id}/weights", timeout=15)
+        got = {}
+        if r.status_code == 200:
+            got = {w["skill_id"]: round(w["weight"], 3) for w in get_json(r)["weights"]}
+            if got == expected:
+                return got
+        if time.monotonic() > deadline:
+            die(f"Role weights not refreshed: expected {expected}, got {got}")
+        time.sleep(0.5)
+
+
+def main():
+    args = parse_args()
+    base = args.base_url.rstrip("/")
+    tag = uuid.uuid4().hex[:8]
+    source = f"moderation-{tag}"
+
+    r = requests.post(f"{base}/roles", json={"name": f"Moderation Role {tag}"}, timeout=15)
+    assert_status(r, 200)
+    role_id = get_json(r)["id"]
+    skills = []
+    for n in (1, 2):
+        r = requests.post(f"{base}/skills", json={"name": f"Modskill {n} {tag}", "category": "Testing", "aliases": []}, timeout=15)
+        assert_status(r, 200)
+        skills.append(get_json(r)["id"])
+    s1, s2 = skills
+
+    job_ids = []
+    for desc, skill_ids in zip(DESCRIPTIONS, ([s1], [s1, s2], [s2])):
+        payload = {
+            "title": f"Moderation posting {tag}",
+            "company": "ModCo",
+            "location": "Remote",
+            "source": source,
+            "description_excerpt": desc.format(tag=tag),
+            "required_skills": [],
+            "required_skill_ids": skill_ids,
+            "role_ids": [role_id],
+        }
+        r = requests.post(f"{base}/jobs/submit", json=payload, timeout=15)
+        assert_status(r, 200)
+        job_ids.append(get_json(r)["id"])
+    j1, j2, j3 = job_ids
+
+    missing = "0" * 24
+    out = moderate(base, {"moderation_status": "approved", "job_ids": [j1, j2, "not-an-id", missing, j1]})
+    results = [(x["id"], x["status"]) for x in out["results"]]
+    if results != [(j1, "updated"), (j2, "updated"), ("not-an-id", "invalid_id"), (missing, "not_found")]:
+        die(f"Unexpected per-id results: {results}")
+    if out["updated"] != 2 or out["roles_refreshing"] != [role_id]:
+        die(f"Expected 2 updates refreshing the role: {out}")
+    wait_for_weights(base, role_id, {s1: 1.0, s2: 0.5})
+    ok("job_ids mode: per-id results, role weights refreshed")
+
+    out = moderate(base, {"moderation_status": "approved", "filter": {"source": source, "moderation_status": "pending"}})
+    if [x["id"] for x in out["results"]] != [j3] or out["roles_refreshing"] != [role_id]:
+        die(f"Filter should match only the remaining pending posting: {out}")
+    wait_for_weights(base, role_id, {s1: 0.667, s2: 0.667})
+    ok("filter mode moderates exactly the matching postings")
+
+    out = moderate(base, {"moderation_status": "approved", "moderation_reason": "still fine", "job_ids": [j1]})
+    if out["roles_refreshing"]:
+        die(f"Re-approving an approved posting must not refresh roles: {out}")
+    ok("No refresh when approval does not change")
+
+    out = moderate(base, {"moderation_status": "rejected", "moderation_reason": "batch test", "job_ids": [j2]})
+    if out["roles_refreshing"] != [role_id]:
+        die(f"Rejecting an approved posting should refresh its role: {out}")
+    wait_for_weights(base, role_id, {s1: 0.5, s2: 0.5})
+    ok("Leaving approved refreshes the role")
+
+    moderate(base, {"moderation_status": "approved"}, expected=400)
+    moderate(base, {"moderation_status": "approved", "job_ids": [j1], "filter": {"source": source}}, expected=400)
+    ok("Both or neither of job_ids / filter is a 400")
+
+    r = requests.post(f"{base}/roles", json={"name": f"Legacy Moderation Role {tag}"}, timeout=15)
+    assert_status(r, 200)
+    legacy_role = get_json(r)["id"]
+    r = requests.get(f"{base}/health", timeout=15)
+    assert_status(r, 200)
+    jobs = MongoClient("mongodb://localhost:27017")[get_json(r)["db"]]["jobs"]
+    legacy = str(jobs.insert_one({
+        "title": f"Legacy posting {tag}",
+        "company": "OldCo",
+        "location": "Remote",
+        "source": source,
+        "description_excerpt": f"Posting {tag} imported before moderation existed.",
+        "required_skills": [],
+        "required_skill_ids": [s1],
+        "role_ids": [legacy_role],
+        "created_at": datetime.now(timezone.utc),
+    }).inserted_id)
+
+    r = requests.get(f"{base}/jobs", params={"role_id": legacy_role, "status": "approved"}, timeout=15)
+    assert_status(r, 200)
+    if [(j["id"], j["moderation_status"]) for j in get_json(r)] != [(legacy, "approved")]:
+        die(f"Legacy posting should be listed as approved: {get_json(r)}")
+    r = requests.post(f"{base}/roles/{legacy_role}/compute_weights", timeout=20)
+    assert_status(r, 200)
+    wait_for_weights(base, legacy_role, {s1: 1.0})
+    out = moderate(base, {"moderation_status": "approved", "job_ids": [legacy]})
+    if out["roles_refreshing"]:
+        die(f"Approving a legacy (already approved) posting must not refresh roles: {out}")
+    jobs.update_one({"_id": ObjectId(legacy)}, {"$unset": {"moderation_status": ""}})
+    out = moderate(base, {"moderation_status": "rejected", "job_ids": [legacy]})
+    if out["roles_refreshing"] != [legacy_role]:
+        die(f"Rejecting a legacy posting should refresh its role: {out}")
+    wait_for_weights(base, legacy_role, {})
+    ok("A missing moderation_status counts as approved in listing, weights and moderation")
+
+    ok("UC 4.1 batch moderation")
+    pretty(out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""UC 4.1 — Flag Near-Duplicate Job Submissions
+
+What is being tested:
+- POST /jobs/submit with a lightly edited copy of a live posting returns duplicate_of /
+  duplicate_score pointing at it.
+- An unrelated submission is not flagged.
+- A copy of a posting that was rejected is not flagged.
+- POST /roles/{role_id}/compute_weights leaves a duplicate out only while its original is approved.
+
+Pass criteria:
+- duplicate flags and role weights follow the rules above.
+"""
+
+import uuid
+
+import requests
+from _common import parse_args, assert_status, get_json, ok, pretty, die
+
+BODY = (
+    "Posting {tag}: we are hiring a backend engineer to design and operate the services behind our "
+    "scheduling platform. You will build REST APIs in Python with FastAPI, model data "
+    "in MongoDB, write integration tests, review pull requests and take part in an "
+    "on-call rotation. Experience with Docker, CI pipelines and observability tooling "
+    "is a plus. The team works remotely across time zones and ships small changes "
+    "several times a day. Posting reference {tag}."
+)
+UNRELATED = (
+    "Our bakery is looking for an early-morning pastry chef who can laminate dough, "
+    "manage proofing schedules, keep the kitchen spotless and train two apprentices "
+    "during the busy holiday season. Reference {tag}."
+)
+
+
+def job(title: str, description: str, role_id: str, skill_id: str) -> dict:
+    return {
+        "title": title,
+        "company": "TestCo",
+        "location": "MI",
+        "source": "uc-test",
+        "description_excerpt": description,
+        "required_skills": [],
+        "required_skill_ids": [skill_id],
+        "role_ids": [role_id],
+    }
+
+
+def moderate(base: str, job_id: str, status: str):
+    r = requests.patch(f"{base}/jobs/{job_id}/moderate", json={"moderation_status": status}, timeout=15)
+    assert_status(r, 200)
+
+
+def weighted_skills(base: str, role_id: str) -> set:
+    r = requests.post(f"{base}/roles/{role_id}/compute_weights", timeout=20)
+    assert_status(r, 200)
+    return {w["skill_id"] for w in get_json(r)["weights"]}
+
+
+def main():
+    args = parse_args()
+    base = args.base_url.rstrip("/")
+    tag = uuid.uuid4().hex[:8]
+    original_skill, repost_skill = "6500000000000000000000a1", "6500000000000000000000b2"
+
+    r = requests.post(f"{base}/roles", json={"name": f"UC Duplicate Role {tag}", "description": "Created by UC tests."}, timeout=15)
+    assert_status(r, 200)
+    role_id = get_json(r)["id"]
+
+    r = requests.post(f"{base}/jobs", json=job("Backend Engineer", BODY.format(tag=tag), role_id, original_skill), timeout=15)
+    assert_status(r, 200)
+    original = get_json(r)
+    if original.get("duplicate_of") is not None:
+        die("Fresh posting created as a duplicate")
+
+    edited = BODY.format(tag=tag) + " Apply today."
+    r = requests.post(f"{base}/jobs/submit", json=job("Backend Engineer (repost)", edited, role_id, repost_skill), timeout=15)
+    assert_status(r, 200)
+    repost = get_json(r)
+    if repost.get("duplicate_of") != original["id"]:
+        die(f"Repost not flagged as a duplicate of {original['id']}: {repost.get('duplicate_of')}")
+    if not repost.get("duplicate_score") or repost["duplicate_score"] < 0.8:
+        die(f"duplicate_score below the threshold: {repost.get('duplicate_score')}")
+    ok(f"Near-duplicate flagged (score {repost['duplicate_score']:.2f})")
+
+    r = requests.post(f"{base}/jobs/submit", json=job("Pastry Chef", UNRELATED.format(tag=tag), role_id, repost_skill), timeout=15)
+    assert_status(r, 200)
+    unrelated = get_json(r)
+    if unrelated.get("duplicate_of") is not None or unrelated.get("duplicate_score") is not None:
+        die("Unrelated posting flagged as a duplicate")
+    moderate(base, unrelated["id"], "rejected")
+    ok("Unrelated posting not flagged")
+
+    # the repost is approved too: it is left out of the weights while its original is approved
+    moderate(base, repost["id"], "approved")
+    skills = weighted_skills(base, role_id)
+    if skills != {original_skill}:
+        die(f"Weights should count only the original while it is approved: {skills}")
+    ok("Duplicate of an approved posting left out of role weights")
+
+    moderate(base, original["id"], "rejected")
+    skills = weighted_skills(base, role_id)
+    if skills != {repost_skill}:
+        die(f"Weights should count the repost once its original is rejected: {skills}")
+    ok("Duplicate of a rejected posting counted in role weights")
+
+    # with both copies rejected there is no live original left to match
+    moderate(base, repost["id"], "rejected")
+    r = requests.post(f"{base}/jobs/submit", json=job("Backend Engineer (again)", edited, role_id, repost_skill), timeout=15)
+    assert_status(r, 200)
+    again = get_json(r)
+    if again.get("duplicate_of") is not None:
+        die(f"Copy of rejected postings flagged as a duplicate of {again['duplicate_of']}")
+    moderate(base, again["id"], "rejected")
+
+    ok("UC 4.1 near-duplicate detection")
+    pretty({"original": original["id"], "repost": repost, "unrelated": unrelated["id"]})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""UC 4.1 — Bulk Job Import (NDJSON)
+
+Endpoint(s):
+- POST /jobs/bulk?moderation_status=...&batch_size=...   (application/x-ndjson body)
+- GET  /jobs?role_id=...&status=...
+
+What is being tested (fresh role and fresh skill, so the imported set is exact):
+- The body is streamed in small chunks that split lines; every posting is still parsed.
+- Free-text required_skills resolve to catalog ids; a posting that lists no skills is
+  tagged from its description.
+- Invalid JSON, a line that is valid JSON but not an object, a line over the 1 MiB line
+  cap and postings failing validation are each reported per line with their own error,
+  and do not stop the rest of the import.
+- Re-running the same file inserts nothing: every posting is reported as skipped.
+
+Pass criteria:
+- inserted / skipped / failed counts, error lines and stored postings as described.
+"""
+
+import json
+import uuid
+
+import requests
+from _common import parse_args, assert_status, get_json, ok, pretty, die
+
+
+MAX_LINE_BYTES = 1024 * 1024
+
+
+def chunked(body: bytes, size: int = 7):
+    for i in range(0, len(body), size):
+        yield body[i:i + size]
+
+
+def bulk_import(base: str, body: bytes) -> dict:
+    r = requests.post(
+        f"{base}/jobs/bulk",
+        params={"moderation_status": "pending", "batch_size": 2},
+        data=chunked(body),
+        headers={"Content-Type": "application/x-ndjson"},
+        timeout=60,
+    )
+    assert_status(r, 200)
+    return get_json(r)
+
+
+def main():
+    args = parse_args()
+    base = args.base_url.rstrip("/")
+    tag = uuid.uuid4().hex[:8]
+
+    r = requests.post(f"{base}/roles", json={"name": f"Bulk Role {tag}", "description": "bulk import test"}, timeout=15)
+    assert_status(r, 200)
+    role_id = get_json(r)["id"]
+    skill_name = f"Bulkskill{tag}"
+    r = requests.post(f"{base}/skills", json={"name": skill_name, "category": "Testing", "aliases": []}, timeout=15)
+    assert_status(r, 200)
+    skill_id = get_json(r)["id"]
+
+    def posting(n: int, **extra) -> dict:
+        return {
+            "title": f"Bulk posting {n} {tag}",
+            "company": "BulkCo",
+            "location": "Remote",
+            "source": f"bulk-{tag}",
+            "description": f"Bulk posting number {n} for import run {tag}.",
+            "role_ids": [role_id],
+            **extra,
+        }
+
+    rows = [
+        json.dumps(posting(1, required_skills=[skill_name])),
+        json.dumps(posting(2, description=f"We rely on {skill_name} daily; {skill_name} experience required. Run {tag}.")),
+        "{not json",
+        json.dumps(posting(3)),
+        json.dumps({**posting(4), "title": ""}),
+        "",
+        json.dumps(posting(5, required_skill_ids=[skill_id])),
+        "[1, 2]",
+        json.dumps(posting(6, description="x" * MAX_LINE_BYTES)),
+    ]
+    body = ("\n".join(rows) + "\n").encode("utf-8")
+
+    first = bulk_import(base, body)
+    if (first["inserted"], first["skipped"], first["failed"]) != (4, 0, 4):
+        die(f"Expected 4 inserted and 4 failed: {first}")
+    errors = {e["line"]: e["error"] for e in first["errors"]}
+    if sorted(errors) != [3, 5, 8, 9]:
+        die(f"Errors should name lines 3, 5, 8 and 9: {first['errors']}")
+    if not errors[3].startswith("invalid JSON") or errors[8] != "expected a JSON object, got list":
+        die(f"Invalid JSON and non-object lines should be told apart: {errors}")
+    if "exceeds" not in errors[9] or "title" not in errors[5]:
+        die(f"Oversized line and validation failure not reported as such: {errors}")
+    ok("Streamed import inserts valid rows and reports bad lines")
+
+    r = requests.get(f"{base}/jobs", params={"role_id": role_id, "status": "pending"}, timeout=20)
+    assert_status(r, 200)
+    jobs = {j["title"]: j for j in get_json(r)}
+    if sorted(jobs) != sorted(f"Bulk posting {n} {tag}" for n in (1, 2, 3, 5)):
+        die(f"Imported postings mismatch: {sorted(jobs)}")
+    for n in (1, 5):
+        if jobs[f"Bulk posting {n} {tag}"]["required_skill_ids"] != [skill_id]:
+            die(f"Posting {n} should be linked to {skill_name}: {jobs[f'Bulk posting {n} {tag}']}")
+    tagged = jobs[f"Bulk posting 2 {tag}"]
+    if skill_id not in tagged["required_skill_ids"] or skill_name not in tagged["required_skills"]:
+        die(f"Posting 2 should be tagged with {skill_name} from its description: {tagged}")
+    ok("Skills resolved from names, ids and descriptions")
+
+    again = bulk_import(base, body)
+    if (again["inserted"], again["skipped"], again["failed"]) != (0, 4, 4):
+        die(f"Re-import should skip every posting: {again}")
+    r = requests.get(f"{base}/jobs", params={"role_id": role_id}, timeout=20)
+    assert_status(r, 200)
+    if len(get_json(r)) != 4:
+        die("Re-import must not duplicate postings")
+    ok("Re-running the same file is a no-op")
+
+    ok("UC 4.1 bulk import")
+    pretty(first)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""UC 4.1 — Page Through Job Postings
+
+What is being tested:
+- GET /jobs?limit=N returns at most N jobs and an X-Next-Cursor header while more remain.
+- Following X-Next-Cursor (?cursor=...) walks every matching job exactly once, newest first.
+- The last page carries no X-Next-Cursor.
+- GET /jobs?format=ndjson streams the same jobs, one JSON object per line.
+
+Pass criteria:
+- the pages together contain exactly the jobs created by this test, without duplicates.
+"""
+
+import json
+import uuid
+
+import requests
+from _common import parse_args, assert_status, get_json, ok, pretty, die
+
+N_JOBS = 5
+PAGE_SIZE = 2
+
+
+def main():
+    args = parse_args()
+    base = args.base_url.rstrip("/")
+    tag = uuid.uuid4().hex[:8]
+
+    # a fresh role scopes the listing to the jobs created here
+    r = requests.post(f"{base}/roles", json={"name": f"UC Pagination Role {tag}", "description": "Created by UC tests."}, timeout=15)
+    assert_status(r, 200)
+    role_id = get_json(r)["id"]
+
+    created = []
+    for i in range(N_JOBS):
+        payload = {
+            "title": f"UC Pagination Job {i}",
+            "company": "TestCo",
+            "location": "MI",
+            "source": "uc-test",
+            "description_excerpt": f"Pagination posting {i} for run {tag}.",
+            "required_skills": [],
+            "required_skill_ids": [],
+            "role_ids": [role_id],
+        }
+        r = requests.post(f"{base}/jobs", json=payload, timeout=15)
+        assert_status(r, 200)
+        created.append(get_json(r)["id"])
+
+    seen = []
+    cursor = None
+    pages = 0
+    while True:
+        params = {"role_id": role_id, "limit": PAGE_SIZE}
+        if cursor:
+            params["cursor"] = cursor
+        r = requests.get(f"{base}/jobs", params=params, timeout=15)
+        assert_status(r, 200)
+        page = get_json(r)
+        pages += 1
+        if len(page) > PAGE_SIZE:
+            die(f"Page {pages} has {len(page)} jobs, limit was {PAGE_SIZE}")
+        seen.extend(j["id"] for j in page)
+        cursor = r.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+        if pages > N_JOBS:
+            die("X-Next-Cursor never ran out")
+
+    if len(seen) != len(set(seen)):
+        die(f"Duplicate jobs across pages: {seen}")
+    if seen != list(reversed(created)):
+        die(f"Pages do not list the created jobs newest first: {seen} vs {created}")
+    expected_pages = -(-N_JOBS // PAGE_SIZE)
+    if pages != expected_pages:
+        die(f"Expected {expected_pages} pages, got {pages}")
+    ok(f"Cursor walked {len(seen)} jobs in {pages} pages")
+
+    r = requests.get(f"{base}/jobs", params={"role_id": role_id, "format": "ndjson"}, timeout=15)
+    assert_status(r, 200)
+    streamed = [json.loads(line)["id"] for line in r.text.splitlines() if line.strip()]
+    if streamed != seen:
+        die(f"NDJSON stream differs from the paged listing: {streamed}")
+
+    r = requests.get(f"{base}/jobs", params={"cursor": "not-a-cursor"}, timeout=15)
+    assert_status(r, 400)
+
+    ok("UC 4.1 job pagination")
+    pretty({"role_id": role_id, "pages": pages, "jobs": seen})
+
+
+if __name__ == "__main__":
+    main()
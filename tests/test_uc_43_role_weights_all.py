@@ -0,0 +1,111 @@
+"""UC 4.3 — Role Weights for Every Role in One Pass
+
+Endpoint(s):
+- POST /roles/compute_weights
+- POST /roles/{role_id}/compute_weights
+- GET  /roles/{role_id}/weights
+- POST /jobs, POST /jobs/submit, POST /jobs/bulk   (fixtures)
+
+What is being tested (fresh roles, skills and postings, so every number is exact):
+- Only approved postings count; a skill id repeated in one posting counts once; a
+  posting tagged with two roles counts for both.
+- Weights are ordered by weight and carry the catalog skill name.
+- There is no cap on postings per role: a role with 2,100 imported postings reports all
+  of them.
+- The all-roles endpoint and the per-role endpoint agree with the stored weights.
+
+Pass criteria:
+- job_count, skill_count and weights match the expectations below.
+"""
+
+import json
+import uuid
+
+import requests
+from _common import parse_args, assert_status, get_json, ok, pretty, die
+
+BULK_JOBS = 2100
+
+
+def create(base: str, path: str, payload: dict) -> str:
+    r = requests.post(f"{base}/{path}", json=payload, timeout=15)
+    assert_status(r, 200)
+    return get_json(r)["id"]
+
+
+def job(tag: str, n: int, role_ids: list, skill_ids: list) -> dict:
+    return {
+        "title": f"Weights posting {n} {tag}",
+        "company": "WeightCo",
+        "location": "Remote",
+        "source": f"weights-{tag}",
+        "description_excerpt": f"Posting {n} of weights run {tag}: " + " ".join(f"duty{n}x{i}" for i in range(12)),
+        "required_skills": [],
+        "required_skill_ids": skill_ids,
+        "role_ids": role_ids,
+    }
+
+
+def stored_weights(base: str, role_id: str) -> list:
+    r = requests.get(f"{base}/roles/{role_id}/weights", timeout=15)
+    assert_status(r, 200)
+    return [(w["skill_id"], round(w["weight"], 3), w["skill_name"]) for w in get_json(r)["weights"]]
+
+
+def main():
+    args = parse_args()
+    base = args.base_url.rstrip("/")
+    tag = uuid.uuid4().hex[:8]
+
+    role_a, role_b, role_c = (create(base, "roles", {"name": f"Weights Role {x} {tag}"}) for x in "ABC")
+    names = [f"Weightskill {n} {tag}" for n in (1, 2, 3)]
+    s1, s2, s3 = (create(base, "skills", {"name": name, "category": "Testing", "aliases": []}) for name in names)
+
+    create(base, "jobs", job(tag, 1, [role_a], [s1, s1, s2]))
+    create(base, "jobs", job(tag, 2, [role_a, role_b], [s1]))
+    create(base, "jobs", job(tag, 3, [role_b], [s3]))
+    create(base, "jobs", job(tag, 4, [role_a], []))
+    create(base, "jobs/submit", job(tag, 5, [role_a], [s2, s3]))  # pending: never counts
+
+    body = "".join(
+        json.dumps({**job(tag, 100 + n, [role_c], [s1] if n % 2 else [s2]), "description": f"Bulk weights posting {n} {tag}"}) + "\n"
+        for n in range(BULK_JOBS)
+    )
+    r = requests.post(f"{base}/jobs/bulk", data=body.encode(), headers={"Content-Type": "application/x-ndjson"}, timeout=300)
+    assert_status(r, 200)
+    if get_json(r)["inserted"] != BULK_JOBS:
+        die(f"Bulk fixture import failed: {get_json(r)}")
+
+    r = requests.post(f"{base}/roles/compute_weights", timeout=120)
+    assert_status(r, 200)
+    summary = get_json(r)
+    results = {row["role_id"]: (row["job_count"], row["skill_count"]) for row in summary["results"]}
+    expected = {role_a: (3, 2), role_b: (2, 2), role_c: (BULK_JOBS, 2)}
+    if {rid: results.get(rid) for rid in expected} != expected:
+        die(f"Unexpected job/skill counts: {[results.get(rid) for rid in expected]}")
+    ok("All roles computed in one call, with no posting cap")
+
+    want = {
+        role_a: [(s1, 0.667, names[0]), (s2, 0.333, names[1])],
+        role_b: sorted([(s1, 0.5, names[0]), (s3, 0.5, names[2])]),
+        role_c: sorted([(s1, 0.5, names[0]), (s2, 0.5, names[1])]),
+    }
+    for role_id, weights in want.items():
+        got = stored_weights(base, role_id)
+        if (got if role_id == role_a else sorted(got)) != weights:
+            die(f"Stored weights for {role_id}: expected {weights}, got {got}")
+    ok("Stored weights are exact, ordered and named")
+
+    r = requests.post(f"{base}/roles/{role_a}/compute_weights", timeout=20)
+    assert_status(r, 200)
+    single = [(w["skill_id"], round(w["weight"], 3), w["skill_name"]) for w in get_json(r)["weights"]]
+    if single != want[role_a]:
+        die(f"Per-role endpoint disagrees: {single}")
+    ok("Per-role endpoint agrees with the all-roles pass")
+
+    ok("UC 4.3 role weights for every role")
+    pretty({"roles": summary["roles"], "role_a": want[role_a]})
+
+
+if __name__ == "__main__":
+    main()
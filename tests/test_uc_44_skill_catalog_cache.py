@@ -0,0 +1,74 @@
+"""UC 4.4 — Taxonomy Edits Reach the Shared Skill Catalog
+
+Endpoint(s):
+- POST /skills, DELETE /skills/{skill_id}
+- POST /skills/extract/skills/{snapshot_id}, POST /skills/extract/batch
+- POST /tailor/job/ingest
+
+What is being tested:
+- A skill created through the API is matched right away by resume extraction and by
+  tailor job ingest (both read the same cached catalog, rebuilt on taxonomy writes).
+- Deleting it bumps the catalog version and it is no longer extracted.
+
+Pass criteria:
+- the new skill appears in both extractions, then disappears after the delete under a
+  higher catalog_version.
+"""
+
+import uuid
+
+import requests
+from _common import parse_args, assert_status, get_json, ok, pretty, die
+
+
+def main():
+    args = parse_args()
+    base = args.base_url.rstrip("/")
+    name = f"Quarkfold{uuid.uuid4().hex[:8]}"
+
+    r = requests.post(f"{base}/skills", json={"name": name, "category": "Framework", "aliases": []}, timeout=15)
+    assert_status(r, 200)
+    skill_id = get_json(r)["id"]
+
+    text = f"Catalog cache resume. Five years of building data services with {name} and Python in production."
+    r = requests.post(f"{base}/ingest/resume/text", json={"user_id": args.user_id, "text": text}, timeout=15)
+    assert_status(r, 200)
+    snapshot_id = get_json(r)["snapshot_id"]
+
+    r = requests.post(f"{base}/skills/extract/skills/{snapshot_id}", timeout=25)
+    assert_status(r, 200)
+    if skill_id not in {e["skill_id"] for e in get_json(r)["extracted"]}:
+        die(f"New skill {name} not extracted; catalog was not rebuilt after POST /skills")
+    ok("Resume extraction sees the new skill")
+
+    job = {"user_id": args.user_id, "title": "Engineer", "company": "TestCo", "location": "MI", "text": f"Must know {name}."}
+    r = requests.post(f"{base}/tailor/job/ingest", json=job, timeout=20)
+    assert_status(r, 200)
+    if name.lower() not in {s.get("skill_name", "").lower() for s in get_json(r)["extracted_skills"]}:
+        die(f"New skill {name} not matched by tailor job ingest")
+    ok("Tailor job ingest sees the new skill")
+
+    r = requests.post(f"{base}/skills/extract/batch", json={"snapshot_ids": [snapshot_id]}, timeout=25)
+    assert_status(r, 200)
+    version_before = get_json(r)["catalog_version"]
+
+    r = requests.delete(f"{base}/skills/{skill_id}", timeout=15)
+    assert_status(r, 200)
+
+    r = requests.post(f"{base}/skills/extract/batch", json={"snapshot_ids": [snapshot_id]}, timeout=25)
+    assert_status(r, 200)
+    data = get_json(r)
+    if data["catalog_version"] <= version_before:
+        die(f"catalog_version did not move after DELETE: {version_before} -> {data['catalog_version']}")
+    [row] = data["results"]
+    if row["status"] != "extracted":
+        die(f"Result from the old catalog version was reused: {row['status']}")
+    if skill_id in {e["skill_id"] for e in row["extracted"]}:
+        die("Deleted skill still extracted")
+
+    ok("UC 4.4 skill catalog cache")
+    pretty(data)
+
+
+if __name__ == "__main__":
+    main()